@@ -30,6 +30,7 @@ __doi__ = "10.5281/zenodo.18655299"
 from .core.bridge import Bridge
 from .core.sensor import Sensor, SensorArray
 from .core.measurement import Measurement, TimeSeries
+from .core.alignment import AlignedFrame
 
 # Analysis modules - import specific functions
 from .analysis.metrics import (
@@ -93,7 +94,7 @@ __all__ = [
     '__version__', '__author__', '__email__', '__license__', '__doi__',
     
     # Core
-    'Bridge', 'Sensor', 'SensorArray', 'Measurement', 'TimeSeries',
+    'Bridge', 'Sensor', 'SensorArray', 'Measurement', 'TimeSeries', 'AlignedFrame',
     
     # Metrics - functions
     'calculate_afc', 'calculate_alsa', 'calculate_cpii',
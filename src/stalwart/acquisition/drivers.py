@@ -0,0 +1,82 @@
+"""Sensor driver interface and the default simulated driver."""
+
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Optional
+
+import numpy as np
+
+from ..core.measurement import TimeSeries, VALUE_DTYPE
+
+
+@dataclass
+class SampleBlock:
+    """A block of evenly spaced samples from one channel."""
+    values: np.ndarray
+    start_time_ns: int  # epoch ns of the first sample
+    sample_period_ns: int
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    @property
+    def sampling_rate(self) -> float:
+        return 1e9 / self.sample_period_ns
+
+    @property
+    def timestamps_ns(self) -> np.ndarray:
+        offsets = np.arange(len(self.values), dtype=np.int64) * self.sample_period_ns
+        return self.start_time_ns + offsets
+
+    @property
+    def end_time_ns(self) -> int:
+        """Epoch ns just past the last sample."""
+        return self.start_time_ns + len(self.values) * self.sample_period_ns
+
+    def to_timeseries(
+        self, sensor_id: str, bridge_id: str = "", unit: str = ""
+    ) -> TimeSeries:
+        return TimeSeries.from_arrays(
+            sensor_id, bridge_id, self.timestamps_ns, self.values, unit=unit, copy=False
+        )
+
+
+class SensorDriver(ABC):
+    """Interface to the hardware (or simulation) behind a Sensor.
+
+    Drivers implement :meth:`read_block`; :meth:`read` defaults to a
+    one-sample block.
+    """
+
+    def read(self) -> float:
+        """Read a single sample."""
+        return float(self.read_block(1, 1.0, 0).values[0])
+
+    @abstractmethod
+    def read_block(
+        self, n_samples: int, sampling_rate: float, start_time_ns: int
+    ) -> SampleBlock:
+        """Acquire ``n_samples`` at ``sampling_rate`` Hz from ``start_time_ns``."""
+
+
+class SimulatedDriver(SensorDriver):
+    """Uniform noise over the sensor range, generated a block at a time."""
+
+    def __init__(self, range_min: float, range_max: float, seed: Optional[int] = None):
+        self.range_min = range_min
+        self.range_max = range_max
+        self.rng = np.random.default_rng(seed)
+
+    @classmethod
+    def from_specs(cls, specs, seed: Optional[int] = None) -> 'SimulatedDriver':
+        return cls(specs.range_min, specs.range_max, seed)
+
+    def read(self) -> float:
+        return float(self.rng.uniform(self.range_min, self.range_max))
+
+    def read_block(
+        self, n_samples: int, sampling_rate: float, start_time_ns: int
+    ) -> SampleBlock:
+        values = self.rng.uniform(self.range_min, self.range_max, n_samples)
+        values = values.astype(VALUE_DTYPE, copy=False)
+        return SampleBlock(values, start_time_ns, int(round(1e9 / sampling_rate)))
@@ -0,0 +1,214 @@
+"""Multi-rate acquisition scheduler.
+
+Each sensor channel is acquired at its own ``SensorSpecs.sampling_rate`` in
+fixed-size blocks.  A channel's block size is ``rate * block_duration``
+samples (at least one), so a 100 Hz accelerometer yields a 100-sample block
+every second while a 0.01 Hz corrosion probe yields one sample every 100 s.
+
+Channels wait on a heap keyed by the time their next block is due.  All due
+times derive from one start time and whole sample periods, so channels with
+commensurate rates fall due on the same instant.  Those co-due channels are
+popped and read together in one batch.  Block timestamps are contiguous per
+channel: block ``k`` starts at ``start + k * block_size * sample_period``,
+whenever the read actually happens.
+"""
+
+import heapq
+import time
+from concurrent.futures import Executor
+from dataclasses import dataclass
+from typing import Callable, Iterable, List, Optional, Tuple
+
+from .drivers import SampleBlock
+from ..core.sensor import Sensor
+from ..utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Default seconds of data per block
+BLOCK_DURATION = 1.0
+
+# Start times are aligned to this grid so co-due channels share due times
+START_ALIGNMENT_NS = 1_000_000
+
+
+@dataclass
+class Channel:
+    """Scheduling state for one sensor."""
+    sensor: Sensor
+    sampling_rate: float
+    block_size: int
+    next_due_ns: int
+    blocks_read: int = 0
+    late_blocks: int = 0
+    errors: int = 0
+
+    @property
+    def sample_period_ns(self) -> int:
+        return int(round(1e9 / self.sampling_rate))
+
+    @property
+    def block_period_ns(self) -> int:
+        return self.block_size * self.sample_period_ns
+
+
+BlockCallback = Callable[[Sensor, SampleBlock], None]
+
+
+class AcquisitionScheduler:
+    """Run every sensor at its own rate on a due-time heap.
+
+    Args:
+        sensors: Sensors to schedule
+        block_duration: Seconds of data per block (block size is
+            ``max(1, round(rate * block_duration))``)
+        on_block: Called with (sensor, block) for every block read
+        clock: Returns the current time in epoch ns
+        sleep: Sleeps for the given number of seconds
+        executor: Optional executor on which the reads of a co-due batch
+            run concurrently (useful for blocking bus drivers)
+    """
+
+    def __init__(
+        self,
+        sensors: Optional[Iterable[Sensor]] = None,
+        block_duration: float = BLOCK_DURATION,
+        on_block: Optional[BlockCallback] = None,
+        clock: Callable[[], int] = time.time_ns,
+        sleep: Callable[[float], None] = time.sleep,
+        executor: Optional[Executor] = None
+    ):
+        if block_duration <= 0:
+            raise ValueError("block_duration must be positive")
+        self.block_duration = block_duration
+        self.on_block = on_block
+        self.clock = clock
+        self.sleep = sleep
+        self.executor = executor
+        self.channels: List[Channel] = []
+        self._heap: List[Tuple[int, int, Channel]] = []
+        self._start_ns: Optional[int] = None
+
+        for sensor in sensors or []:
+            self.add_sensor(sensor)
+
+    def add_sensor(
+        self,
+        sensor: Sensor,
+        block_size: Optional[int] = None,
+        sampling_rate: Optional[float] = None
+    ) -> Channel:
+        """Schedule a sensor; defaults come from its specs."""
+        rate = sampling_rate or sensor.specs.sampling_rate
+        if rate <= 0:
+            raise ValueError(f"Sensor {sensor.sensor_id} has no positive sampling rate")
+        if block_size is None:
+            block_size = max(1, int(round(rate * self.block_duration)))
+        elif block_size <= 0:
+            raise ValueError("block_size must be positive")
+
+        channel = Channel(sensor, rate, block_size, next_due_ns=0)
+        self.channels.append(channel)
+        if self._start_ns is not None:
+            self._schedule(channel, self._aligned_now())
+        return channel
+
+    def _aligned_now(self) -> int:
+        now = self.clock()
+        return now - now % START_ALIGNMENT_NS
+
+    def _schedule(self, channel: Channel, start_ns: int):
+        channel.next_due_ns = start_ns + channel.block_period_ns
+        heapq.heappush(self._heap, (channel.next_due_ns, id(channel), channel))
+
+    def start(self, start_ns: Optional[int] = None):
+        """Fix the common start time; the first blocks cover the period after it."""
+        self._start_ns = self._aligned_now() if start_ns is None else start_ns
+        self._heap = []
+        for channel in self.channels:
+            self._schedule(channel, self._start_ns)
+
+    @property
+    def next_due_ns(self) -> Optional[int]:
+        """When the next block falls due (None if nothing is scheduled)."""
+        return self._heap[0][0] if self._heap else None
+
+    def due(self, now_ns: int) -> List[Channel]:
+        """Pop every channel whose block is due at ``now_ns``."""
+        batch = []
+        while self._heap and self._heap[0][0] <= now_ns:
+            batch.append(heapq.heappop(self._heap)[2])
+        return batch
+
+    def poll(self, now_ns: Optional[int] = None) -> List[Tuple[Sensor, SampleBlock]]:
+        """Read one block from every due channel and reschedule them.
+
+        A channel that fell more than a block behind is counted in
+        ``late_blocks`` and catches up one block per poll, keeping its
+        timestamps contiguous.
+        """
+        if self._start_ns is None:
+            self.start()
+        now_ns = self.clock() if now_ns is None else now_ns
+
+        batch = self.due(now_ns)
+        for channel in batch:
+            if now_ns - channel.next_due_ns >= channel.block_period_ns:
+                channel.late_blocks += 1
+        if self.executor is not None and len(batch) > 1:
+            results = list(self.executor.map(self._read, batch))
+        else:
+            results = [self._read(channel) for channel in batch]
+
+        blocks = []
+        for channel, block in zip(batch, results):
+            self._schedule(channel, channel.next_due_ns)
+            if block is None:
+                continue
+            blocks.append((channel.sensor, block))
+            if self.on_block is not None:
+                self.on_block(channel.sensor, block)
+        return blocks
+
+    @staticmethod
+    def _read(channel: Channel) -> Optional[SampleBlock]:
+        """Read the block ending at the channel's due time."""
+        start_ns = channel.next_due_ns - channel.block_period_ns
+        try:
+            block = channel.sensor.read_samples(
+                channel.block_size, channel.sampling_rate, start_ns
+            )
+        except Exception as e:
+            channel.errors += 1
+            logger.error(
+                f"Error reading block from sensor {channel.sensor.sensor_id}: {e}"
+            )
+            return None
+        channel.blocks_read += 1
+        return block
+
+    def run(
+        self,
+        duration: Optional[float] = None,
+        stop: Optional[Callable[[], bool]] = None
+    ):
+        """Acquire until ``duration`` seconds have passed or ``stop()`` is true.
+
+        Sleeps until the next block is due between polls.
+        """
+        if self._start_ns is None:
+            self.start()
+        end_ns = None if duration is None else self.clock() + int(duration * 1e9)
+
+        while self._heap:
+            now = self.clock()
+            if (end_ns is not None and now >= end_ns) or (stop is not None and stop()):
+                break
+            self.poll(now)
+
+            wake = self.next_due_ns
+            if end_ns is not None:
+                wake = min(wake, end_ns)
+            delay = (wake - self.clock()) / 1e9
+            if delay > 0:
+                self.sleep(delay)
@@ -0,0 +1,11 @@
+"""Simulated sensor drivers."""
+
+from .simulated import (
+    Mode, Damage, DEFAULT_MODES, diurnal_temperature,
+    ModalDriver, TrafficStrainDriver, TemperatureDriver
+)
+
+__all__ = [
+    'Mode', 'Damage', 'DEFAULT_MODES', 'diurnal_temperature',
+    'ModalDriver', 'TrafficStrainDriver', 'TemperatureDriver'
+]
@@ -0,0 +1,351 @@
+"""Physically shaped synthetic signals for simulated sensors.
+
+Every driver generates whole blocks with NumPy/SciPy primitives and keeps
+its filter state between blocks, so consecutive blocks join into one
+continuous signal.
+
+* :class:`ModalDriver` (acceleration): ambient excitation plus traffic
+  impulses, passed through the parallel sum of damped modal resonators
+  (impulse invariant, one ``sosfilt`` pass for all modes).
+* :class:`TrafficStrainDriver` (strain): vehicle crossings as Poisson
+  impulses shaped into load pulses, diurnal thermal strain and gauge noise.
+* :class:`TemperatureDriver` (temperature): diurnal cycle plus noise.
+
+Damage is injected with :meth:`inject_damage`: a stiffness loss lowers
+natural frequencies by ``sqrt(1 - loss)`` and raises strain under load by
+``1 / (1 - loss)``; a damping increase adds to every modal damping ratio.
+"""
+
+import time
+from dataclasses import dataclass
+from typing import List, Optional, Sequence
+
+import numpy as np
+from scipy import signal
+
+from ..drivers import SampleBlock, SensorDriver
+
+NS_PER_DAY = 86_400 * 10 ** 9
+
+# Standard deviation of uniform [-0.5, 0.5) noise
+_UNIFORM_STD = 1 / np.sqrt(12)
+
+# Smallest modal damping ratio the resonators are built with
+MIN_DAMPING = 0.001
+
+# Seconds between points of the diurnal curve (interpolated in between)
+_DIURNAL_STEP = 60.0
+
+
+@dataclass
+class Mode:
+    """One vibration mode."""
+    frequency: float  # Hz
+    damping: float  # ratio of critical
+    amplitude: float = 1.0  # RMS response to ambient excitation
+
+
+@dataclass
+class Damage:
+    """Damage state applied from ``onset_ns`` onward."""
+    stiffness_loss: float = 0.0  # fraction of stiffness lost
+    damping_increase: float = 0.0  # added damping ratio
+    onset_ns: Optional[int] = None  # None: immediately
+
+
+DEFAULT_MODES = (
+    Mode(0.8, 0.024, 0.004),
+    Mode(2.3, 0.018, 0.002),
+    Mode(4.1, 0.015, 0.001),
+)
+
+
+def diurnal_temperature(
+    timestamps_ns: np.ndarray,
+    mean: float = 15.0,
+    amplitude: float = 8.0,
+    peak_hour: float = 15.0
+) -> np.ndarray:
+    """Daily temperature cycle peaking at ``peak_hour`` (UTC) at the given times.
+
+    The cosine is evaluated on a one-minute grid and interpolated, so the
+    cost per sample is one ``np.interp`` rather than one ``np.cos``.
+    """
+    if len(timestamps_ns) == 0:
+        return np.empty(0)
+    t0 = int(timestamps_ns[0])
+    offset = (timestamps_ns - t0) / 1e9
+    grid = np.arange(0.0, offset[-1] + 2 * _DIURNAL_STEP, _DIURNAL_STEP)
+    phase = 2 * np.pi * (((t0 % NS_PER_DAY) / 1e9 + grid) / 86_400 - peak_hour / 24)
+    return np.interp(offset, grid, mean + amplitude * np.cos(phase))
+
+
+class _BlockDriver(SensorDriver):
+    """Shared damage bookkeeping and single-sample reads."""
+
+    def __init__(self, sampling_rate: float, seed: Optional[int] = None):
+        self.sampling_rate = sampling_rate
+        self.rng = np.random.default_rng(seed)
+        self.damage = Damage()
+        self._pending: List[Damage] = []
+        self._changed = False
+
+    def inject_damage(
+        self,
+        stiffness_loss: float = 0.0,
+        damping_increase: float = 0.0,
+        onset_ns: Optional[int] = None
+    ):
+        """Add damage, effective from the first block at or after ``onset_ns``."""
+        if not 0.0 <= self.damage.stiffness_loss + stiffness_loss < 1.0:
+            raise ValueError("Total stiffness loss must be in [0, 1)")
+        self._pending.append(Damage(stiffness_loss, damping_increase, onset_ns))
+
+    def set_damage(self, stiffness_loss: float = 0.0, damping_increase: float = 0.0):
+        """Replace the total damage state, effective from the next block."""
+        if not 0.0 <= stiffness_loss < 1.0:
+            raise ValueError("Total stiffness loss must be in [0, 1)")
+        current = (self.damage.stiffness_loss, self.damage.damping_increase)
+        if (stiffness_loss, damping_increase) != current:
+            self.damage = Damage(stiffness_loss, damping_increase)
+            self._changed = True
+
+    def _apply_damage(self, start_time_ns: int) -> bool:
+        """Apply pending damage due by ``start_time_ns``; True if anything changed."""
+        changed, self._changed = self._changed, False
+        due = [
+            d for d in self._pending
+            if d.onset_ns is None or d.onset_ns <= start_time_ns
+        ]
+        if not due:
+            return changed
+        self._pending = [d for d in self._pending if d not in due]
+        for d in due:
+            self.damage.stiffness_loss += d.stiffness_loss
+            self.damage.damping_increase += d.damping_increase
+        return True
+
+    def read(self) -> float:
+        return float(self.read_block(1, self.sampling_rate, time.time_ns()).values[0])
+
+
+class ModalDriver(_BlockDriver):
+    """Acceleration as a superposition of damped modes.
+
+    Args:
+        modes: Natural frequencies, damping ratios and RMS amplitudes
+        sampling_rate: Default rate for single-sample reads (Hz)
+        noise_std: White measurement noise (same unit as the amplitudes)
+        traffic_rate: Vehicle impulses per second exciting free decays
+        traffic_amplitude: Mean impulse size relative to the ambient
+            excitation
+    """
+
+    def __init__(
+        self,
+        modes: Sequence[Mode] = DEFAULT_MODES,
+        sampling_rate: float = 100.0,
+        noise_std: float = 0.0005,
+        traffic_rate: float = 0.5,
+        traffic_amplitude: float = 10.0,
+        seed: Optional[int] = None
+    ):
+        super().__init__(sampling_rate, seed)
+        if not modes:
+            raise ValueError("At least one mode is required")
+        self.modes = list(modes)
+        self.noise_std = noise_std
+        self.traffic_rate = traffic_rate
+        self.traffic_amplitude = traffic_amplitude
+        self._design_rate = None
+        self._sos = None
+        self._zi = None
+
+    @property
+    def current_modes(self) -> List[Mode]:
+        """Modes with the injected damage applied.
+
+        A negative damping increase (e.g. aerodynamic damping) is floored at
+        ``MIN_DAMPING`` to keep the resonators stable.
+        """
+        scale = np.sqrt(1.0 - self.damage.stiffness_loss)
+        return [
+            Mode(
+                m.frequency * scale,
+                max(MIN_DAMPING, m.damping + self.damage.damping_increase),
+                m.amplitude
+            )
+            for m in self.modes
+        ]
+
+    def _design(self, sampling_rate: float):
+        """Build the SOS filter equal to the parallel sum of modal resonators."""
+        T = 1.0 / sampling_rate
+        poles = []
+        numerator = np.zeros(1)
+        denominator = np.ones(1)
+        for mode in self.current_modes:
+            if mode.frequency >= sampling_rate / 2:
+                raise ValueError(f"Mode at {mode.frequency} Hz is above Nyquist")
+            omega = 2 * np.pi * mode.frequency
+            r = np.exp(-mode.damping * omega * T)
+            theta = omega * np.sqrt(1.0 - mode.damping ** 2) * T
+            # Impulse response r**n cos(theta n), scaled to unit stationary
+            # RMS per unit RMS of excitation
+            gain = mode.amplitude * np.sqrt(2 * (1 - r * r)) / _UNIFORM_STD
+            b = gain * np.array([1.0, -r * np.cos(theta), 0.0])
+            a = np.array([1.0, -2 * r * np.cos(theta), r * r])
+            numerator = np.polyadd(np.polymul(numerator, a), np.polymul(denominator, b))
+            denominator = np.polymul(denominator, a)
+            poles.extend([r * np.exp(1j * theta), r * np.exp(-1j * theta)])
+        # Measurement noise as a direct feed-through term
+        numerator = np.polyadd(numerator, self.noise_std / _UNIFORM_STD * denominator)
+
+        zeros = np.roots(numerator)
+        sos = signal.zpk2sos(zeros, np.array(poles), numerator[0])
+        if self._zi is None or self._zi.shape != (len(sos), 2):
+            self._zi = np.zeros((len(sos), 2))
+        self._sos = sos
+        self._design_rate = sampling_rate
+
+    def _excitation(self, n_samples: int) -> np.ndarray:
+        w = self.rng.random(n_samples)
+        w -= 0.5
+        n_vehicles = self.rng.poisson(self.traffic_rate * n_samples / self._design_rate)
+        if n_vehicles:
+            at = self.rng.integers(0, n_samples, n_vehicles)
+            size = self.rng.exponential(1.0, n_vehicles)
+            size *= self.traffic_amplitude * _UNIFORM_STD
+            np.add.at(w, at, size * self.rng.choice((-1.0, 1.0), n_vehicles))
+        return w
+
+    def read_block(
+        self, n_samples: int, sampling_rate: float, start_time_ns: int
+    ) -> SampleBlock:
+        changed = self._apply_damage(start_time_ns)
+        if self._sos is None or sampling_rate != self._design_rate:
+            self._zi = None
+            self._design(sampling_rate)
+            # Settle the resonators so the first block is already stationary
+            slowest = min(
+                m.damping * 2 * np.pi * m.frequency for m in self.current_modes
+            )
+            settle = self._excitation(int(5 * sampling_rate / slowest))
+            _, self._zi = signal.sosfilt(self._sos, settle, zi=self._zi)
+        elif changed:
+            self._design(sampling_rate)
+
+        excitation = self._excitation(n_samples)
+        values, self._zi = signal.sosfilt(self._sos, excitation, zi=self._zi)
+        return SampleBlock(values, start_time_ns, int(round(1e9 / sampling_rate)))
+
+
+class TrafficStrainDriver(_BlockDriver):
+    """Strain from vehicle crossings, temperature and gauge noise.
+
+    Each vehicle is an impulse shaped into a smooth load pulse (impulse
+    response ``n p**n`` of a critically damped second-order filter) that
+    peaks ``pulse_duration / 2`` after arrival.
+
+    Args:
+        traffic_rate: Vehicles per second
+        load_strain: Median peak strain of a car (microstrain)
+        truck_fraction: Share of vehicles that are trucks
+        truck_factor: Truck peak strain relative to a car
+        thermal_coefficient: Microstrain per degree C of deviation from
+            the mean temperature
+    """
+
+    def __init__(
+        self,
+        sampling_rate: float = 10.0,
+        baseline: float = 0.0,
+        traffic_rate: float = 0.5,
+        load_strain: float = 15.0,
+        truck_fraction: float = 0.1,
+        truck_factor: float = 8.0,
+        pulse_duration: float = 2.0,
+        thermal_coefficient: float = 4.0,
+        temperature_mean: float = 15.0,
+        temperature_amplitude: float = 8.0,
+        noise_std: float = 1.0,
+        seed: Optional[int] = None
+    ):
+        super().__init__(sampling_rate, seed)
+        self.baseline = baseline
+        self.traffic_rate = traffic_rate
+        self.load_strain = load_strain
+        self.truck_fraction = truck_fraction
+        self.truck_factor = truck_factor
+        self.pulse_duration = pulse_duration
+        self.thermal_coefficient = thermal_coefficient
+        self.temperature_mean = temperature_mean
+        self.temperature_amplitude = temperature_amplitude
+        self.noise_std = noise_std
+        self._design_rate = None
+        self._zi = None
+
+    def _design(self, sampling_rate: float):
+        peak = max(1.0, self.pulse_duration / 2 * sampling_rate)  # samples to peak
+        p = np.exp(-1.0 / peak)
+        scale = 1.0 / (peak * p ** (peak - 1))
+        self._b = np.array([0.0, scale])
+        self._a = np.array([1.0, -2 * p, p * p])
+        self._zi = np.zeros(2)
+        self._design_rate = sampling_rate
+
+    def read_block(
+        self, n_samples: int, sampling_rate: float, start_time_ns: int
+    ) -> SampleBlock:
+        self._apply_damage(start_time_ns)
+        if sampling_rate != self._design_rate:
+            self._design(sampling_rate)
+
+        impulses = np.zeros(n_samples)
+        n_vehicles = self.rng.poisson(self.traffic_rate * n_samples / sampling_rate)
+        if n_vehicles:
+            at = self.rng.integers(0, n_samples, n_vehicles)
+            load = self.load_strain * self.rng.lognormal(0.0, 0.3, n_vehicles)
+            load[self.rng.random(n_vehicles) < self.truck_fraction] *= self.truck_factor
+            np.add.at(impulses, at, load / (1.0 - self.damage.stiffness_loss))
+        values, self._zi = signal.lfilter(self._b, self._a, impulses, zi=self._zi)
+
+        period_ns = int(round(1e9 / sampling_rate))
+        timestamps = start_time_ns + np.arange(n_samples, dtype=np.int64) * period_ns
+        temperature = diurnal_temperature(
+            timestamps, self.temperature_mean, self.temperature_amplitude
+        )
+        values += self.thermal_coefficient * (temperature - self.temperature_mean)
+        values += self.baseline
+        values += self.noise_std * self.rng.standard_normal(n_samples)
+        return SampleBlock(values, start_time_ns, period_ns)
+
+
+class TemperatureDriver(_BlockDriver):
+    """Diurnal air/deck temperature with sensor noise (degrees C)."""
+
+    def __init__(
+        self,
+        sampling_rate: float = 1.0,
+        mean: float = 15.0,
+        amplitude: float = 8.0,
+        peak_hour: float = 15.0,
+        noise_std: float = 0.05,
+        seed: Optional[int] = None
+    ):
+        super().__init__(sampling_rate, seed)
+        self.mean = mean
+        self.amplitude = amplitude
+        self.peak_hour = peak_hour
+        self.noise_std = noise_std
+
+    def read_block(
+        self, n_samples: int, sampling_rate: float, start_time_ns: int
+    ) -> SampleBlock:
+        period_ns = int(round(1e9 / sampling_rate))
+        timestamps = start_time_ns + np.arange(n_samples, dtype=np.int64) * period_ns
+        values = diurnal_temperature(
+            timestamps, self.mean, self.amplitude, self.peak_hour
+        )
+        values += self.noise_std * self.rng.standard_normal(n_samples)
+        return SampleBlock(values, start_time_ns, period_ns)
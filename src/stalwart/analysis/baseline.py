@@ -0,0 +1,264 @@
+"""Temperature-compensated modal baselines.
+
+Natural frequencies of a healthy bridge move with temperature (stiffness
+of the deck, bearings and asphalt), by a few tenths of a percent per
+degree, which is as large as the frequency drift FFD is meant to detect.
+A :class:`BaselineModel` learns, during a commissioning period, linear
+regressions of the fundamental frequency and damping on temperature by
+recursive least squares.  After commissioning it is frozen, so damage is
+never learned as normal, and evaluating it for the current temperature is
+two dot products.
+
+:class:`BaselineStore` persists one fixed-size binary record per bridge
+(a structured ``.npy`` of a few hundred bytes), so loading a baseline at
+startup is a single small read.
+"""
+
+import os
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Optional, Union
+
+import numpy as np
+
+from ..core.measurement import as_scalar_ns
+
+# Default commissioning period (s) and minimum number of observations
+COMMISSIONING_PERIOD = 7 * 86400.0
+MIN_COMMISSIONING_SAMPLES = 100
+
+# Data time (s) between saves of a model that is still commissioning
+SAVE_INTERVAL = 600.0
+
+# Regressions: intercept and slope on (temperature - reference)
+QUANTITIES = ('frequency', 'damping')
+N_FEATURES = 2
+
+FORMAT_VERSION = 1
+BASELINE_DTYPE = np.dtype([
+    ('version', '<u2'),
+    ('frozen', 'u1'),
+    ('started_ns', '<i8'),
+    ('last_ns', '<i8'),
+    ('commissioning', '<f8'),
+    ('min_samples', '<i8'),
+    ('reference_temperature', '<f8'),
+    ('temperature_range', '<f8', (2,)),
+    ('forgetting', '<f8'),
+    ('theta', '<f8', (len(QUANTITIES), N_FEATURES)),
+    ('covariance', '<f8', (len(QUANTITIES), N_FEATURES, N_FEATURES)),
+    ('samples', '<i8', (len(QUANTITIES),)),
+])
+
+
+class RecursiveLeastSquares:
+    """Linear least squares updated one observation at a time.
+
+    ``forgetting`` below 1 discounts old observations exponentially;
+    ``delta`` sets the initial covariance (a weak prior on zero
+    coefficients).
+    """
+
+    def __init__(self, n_features: int, forgetting: float = 1.0, delta: float = 1e4):
+        if not 0 < forgetting <= 1:
+            raise ValueError("forgetting must be in (0, 1]")
+        self.forgetting = forgetting
+        self.theta = np.zeros(n_features)
+        self.covariance = delta * np.eye(n_features)
+        self.samples = 0
+
+    def update(self, x: np.ndarray, y: float):
+        """Add the observation ``y ~ x . theta``."""
+        Px = self.covariance @ x
+        gain = Px / (self.forgetting + x @ Px)
+        self.theta += gain * (y - x @ self.theta)
+        self.covariance = (self.covariance - np.outer(gain, Px)) / self.forgetting
+        self.samples += 1
+
+    def predict(self, x: np.ndarray) -> float:
+        return float(x @ self.theta)
+
+
+@dataclass
+class ModalBaseline:
+    """Expected modal properties of the healthy bridge at one temperature."""
+    frequency: float  # Hz
+    damping: float  # ratio of critical
+    temperature: float  # degrees C the baseline was evaluated at
+
+    @property
+    def decay_time(self) -> float:
+        """Envelope time constant 1 / (zeta omega) (s)."""
+        return 1.0 / (2 * np.pi * self.frequency * self.damping)
+
+
+class BaselineModel:
+    """Reference fundamental frequency and damping of one bridge.
+
+    Args:
+        bridge_id: Bridge the baseline belongs to
+        reference_temperature: Temperature the intercepts refer to (C)
+        commissioning: Seconds of observations before the model freezes
+        min_samples: Frequency observations needed before it freezes
+        forgetting: RLS forgetting factor during commissioning
+    """
+
+    def __init__(
+        self,
+        bridge_id: str,
+        reference_temperature: float = 15.0,
+        commissioning: float = COMMISSIONING_PERIOD,
+        min_samples: int = MIN_COMMISSIONING_SAMPLES,
+        forgetting: float = 1.0
+    ):
+        self.bridge_id = bridge_id
+        self.reference_temperature = reference_temperature
+        self.commissioning = commissioning
+        self.min_samples = min_samples
+        self.regressions = {
+            q: RecursiveLeastSquares(N_FEATURES, forgetting) for q in QUANTITIES
+        }
+        self.frozen = False
+        self.started_ns: Optional[int] = None
+        self.last_ns: Optional[int] = None
+        self.temperature_range = (np.inf, -np.inf)
+
+    def _features(self, temperature: float) -> np.ndarray:
+        return np.array([1.0, temperature - self.reference_temperature])
+
+    def update(
+        self,
+        timestamp: Any,
+        temperature: Optional[float],
+        frequency: float,
+        damping: float
+    ) -> bool:
+        """
+        Learn from one analysis window while commissioning.
+
+        Non-finite values are skipped per quantity; without a temperature
+        the reference temperature is assumed.
+
+        Returns:
+            True if this observation completed commissioning
+        """
+        if self.frozen:
+            return False
+        timestamp_ns = as_scalar_ns(timestamp)
+        if temperature is None or not np.isfinite(temperature):
+            temperature = self.reference_temperature
+        self.started_ns = timestamp_ns if self.started_ns is None else self.started_ns
+        self.last_ns = timestamp_ns
+
+        x = self._features(temperature)
+        for quantity, value in zip(QUANTITIES, (frequency, damping)):
+            if np.isfinite(value):
+                self.regressions[quantity].update(x, value)
+        lo, hi = self.temperature_range
+        self.temperature_range = (min(lo, temperature), max(hi, temperature))
+
+        elapsed = (self.last_ns - self.started_ns) / 1e9
+        samples = self.regressions['frequency'].samples
+        if elapsed >= self.commissioning and samples >= self.min_samples:
+            self.frozen = True
+        return self.frozen
+
+    def evaluate(self, temperature: Optional[float] = None) -> ModalBaseline:
+        """
+        Baseline at ``temperature``, clamped to the commissioning range.
+
+        Without damping observations the damping is NaN.
+        """
+        lo, hi = self.temperature_range
+        if temperature is None or not np.isfinite(temperature):
+            temperature = self.reference_temperature
+        if lo <= hi:
+            temperature = min(max(temperature, lo), hi)
+        x = self._features(temperature)
+        damping = self.regressions['damping']
+        return ModalBaseline(
+            frequency=self.regressions['frequency'].predict(x),
+            damping=damping.predict(x) if damping.samples else np.nan,
+            temperature=temperature
+        )
+
+    @property
+    def temperature_coefficient(self) -> float:
+        """Relative frequency change per degree at the reference temperature (1/C)."""
+        intercept, slope = self.regressions['frequency'].theta
+        return slope / intercept if intercept else 0.0
+
+    def to_record(self) -> np.ndarray:
+        """The whole model as one :data:`BASELINE_DTYPE` record."""
+        record = np.zeros((), dtype=BASELINE_DTYPE)
+        record['version'] = FORMAT_VERSION
+        record['frozen'] = self.frozen
+        record['started_ns'] = -1 if self.started_ns is None else self.started_ns
+        record['last_ns'] = -1 if self.last_ns is None else self.last_ns
+        record['commissioning'] = self.commissioning
+        record['min_samples'] = self.min_samples
+        record['reference_temperature'] = self.reference_temperature
+        record['temperature_range'] = self.temperature_range
+        record['forgetting'] = self.regressions['frequency'].forgetting
+        for i, quantity in enumerate(QUANTITIES):
+            regression = self.regressions[quantity]
+            record['theta'][i] = regression.theta
+            record['covariance'][i] = regression.covariance
+            record['samples'][i] = regression.samples
+        return record
+
+    @classmethod
+    def from_record(cls, bridge_id: str, record: np.ndarray) -> 'BaselineModel':
+        if record.dtype != BASELINE_DTYPE or int(record['version']) != FORMAT_VERSION:
+            raise ValueError(f"Unsupported baseline record for bridge {bridge_id}")
+        model = cls(
+            bridge_id,
+            reference_temperature=float(record['reference_temperature']),
+            commissioning=float(record['commissioning']),
+            min_samples=int(record['min_samples']),
+            forgetting=float(record['forgetting'])
+        )
+        model.frozen = bool(record['frozen'])
+        started_ns, last_ns = int(record['started_ns']), int(record['last_ns'])
+        model.started_ns = None if started_ns < 0 else started_ns
+        model.last_ns = None if last_ns < 0 else last_ns
+        model.temperature_range = tuple(float(t) for t in record['temperature_range'])
+        for i, quantity in enumerate(QUANTITIES):
+            regression = model.regressions[quantity]
+            regression.theta = record['theta'][i].copy()
+            regression.covariance = record['covariance'][i].copy()
+            regression.samples = int(record['samples'][i])
+        return model
+
+
+class BaselineStore:
+    """Baselines persisted as one small file per bridge in ``directory``."""
+
+    def __init__(self, directory: Union[str, Path]):
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+    def path(self, bridge_id: str) -> Path:
+        """File of ``bridge_id``, which must be a plain file name."""
+        if Path(bridge_id).name != bridge_id or bridge_id in ('', '..'):
+            raise ValueError(f"Invalid bridge id for a baseline file: {bridge_id!r}")
+        return self.directory / f"{bridge_id}.baseline.npy"
+
+    def save(self, model: BaselineModel):
+        """Write the model atomically (readers never see a partial file)."""
+        path = self.path(model.bridge_id)
+        tmp = path.with_suffix('.tmp')
+        with open(tmp, 'wb') as f:
+            np.save(f, model.to_record(), allow_pickle=False)
+        os.replace(tmp, path)
+
+    def load(self, bridge_id: str) -> Optional[BaselineModel]:
+        """The stored model, or None if the bridge has none."""
+        path = self.path(bridge_id)
+        if not path.exists():
+            return None
+        return BaselineModel.from_record(bridge_id, np.load(path, allow_pickle=False))
+
+    def get(self, bridge_id: str, **kwargs) -> BaselineModel:
+        """The stored model, or a new one (``kwargs`` as for :class:`BaselineModel`)."""
+        return self.load(bridge_id) or BaselineModel(bridge_id, **kwargs)
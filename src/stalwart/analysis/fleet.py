@@ -0,0 +1,315 @@
+"""Parallel analysis of a fleet of bridges.
+
+Bridges are sharded across worker processes, one single-process pool per
+shard, so every bridge is always analyzed by the same process.  That keeps
+each bridge's :class:`~stalwart.analysis.streaming.StreamingProcessor`
+(sliding windows, spectra, mode baselines) resident in its worker; only
+new sample blocks travel.  Per round, the blocks of a shard are copied
+into one shared-memory segment and the worker receives a small layout
+table, so the samples are never pickled.
+
+A bridge whose analysis raises is reported in the round's errors without
+affecting the rest of its shard.  A shard whose worker dies gets a new
+worker, whose processors start over.
+"""
+
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass, field
+from multiprocessing import shared_memory
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from ..acquisition.drivers import SampleBlock
+from ..core.bridge import Bridge, BridgeStatus
+from ..core.measurement import VALUE_DTYPE
+from ..utils.logger import get_logger
+from .baseline import BaselineStore
+from .streaming import WINDOW, StreamingProcessor
+
+logger = get_logger(__name__)
+
+# (bridge_id, sensor_id, offset, length, start_time_ns, sample_period_ns)
+BlockLayout = Tuple[str, str, int, int, int, int]
+
+# Worker-process state: processors of the shard's bridges
+_PROCESSORS: Dict[str, StreamingProcessor] = {}
+
+# Per-bridge (status, latency) and per-bridge error messages of one round
+ShardResult = Tuple[Dict[str, Tuple[BridgeStatus, float]], Dict[str, str]]
+
+
+def _processors(
+    bridges: List[Bridge],
+    window: float,
+    baseline_directory: Optional[str]
+) -> Dict[str, StreamingProcessor]:
+    store = BaselineStore(baseline_directory) if baseline_directory else None
+    return {
+        b.specs.bridge_id: StreamingProcessor(b, window, baseline_store=store)
+        for b in bridges
+    }
+
+
+def _init_shard(
+    bridges: List[Bridge], window: float, baseline_directory: Optional[str]
+):
+    """Create the processors of one shard (runs in the worker)."""
+    _PROCESSORS.clear()
+    _PROCESSORS.update(_processors(bridges, window, baseline_directory))
+
+
+def _analyze_shard(
+    processors: Dict[str, StreamingProcessor],
+    values: np.ndarray,
+    layout: Sequence[BlockLayout]
+) -> ShardResult:
+    """Ingest a round of blocks and update every bridge in ``layout``.
+
+    A bridge that fails is reported in the errors; the others still run.
+    """
+    blocks: Dict[str, list] = {}
+    for bridge_id, sensor_id, offset, length, start_ns, period_ns in layout:
+        block = SampleBlock(values[offset:offset + length], start_ns, period_ns)
+        blocks.setdefault(bridge_id, []).append((sensor_id, block))
+
+    results, errors = {}, {}
+    for bridge_id, bridge_blocks in blocks.items():
+        processor = processors[bridge_id]
+        sensors = {s.sensor_id: s for s in processor.bridge.sensors}
+        start = time.perf_counter()
+        try:
+            status = processor.process(
+                (sensors[sensor_id], block) for sensor_id, block in bridge_blocks
+            )
+        except Exception as e:
+            logger.error(f"Analysis of bridge {bridge_id} failed: {e}")
+            errors[bridge_id] = str(e)
+            continue
+        results[bridge_id] = (status, time.perf_counter() - start)
+    return results, errors
+
+
+def _analyze_shared(
+    name: str, n_values: int, layout: Sequence[BlockLayout]
+) -> ShardResult:
+    """Worker entry point: map the shared segment and analyze the round."""
+    shm = shared_memory.SharedMemory(name=name)
+    try:
+        values = np.ndarray((n_values,), dtype=VALUE_DTYPE, buffer=shm.buf)
+        # The processors copy what they keep, so the view can go with the segment
+        results = _analyze_shard(_PROCESSORS, values, layout)
+        del values
+        return results
+    finally:
+        shm.close()
+
+
+@dataclass
+class FleetStatus:
+    """Statuses of one analysis round over the fleet."""
+    statuses: Dict[str, BridgeStatus]
+    latency: Dict[str, float]  # analysis time per bridge in its worker (s)
+    wall_time: float  # whole round, including transfer (s)
+    errors: Dict[str, str] = field(default_factory=dict)  # bridge_id -> message
+
+    def to_dataframe(self):
+        """One row per bridge with health, risk, latency and every parameter."""
+        import pandas as pd
+        rows = [
+            {
+                'bridge_id': bridge_id,
+                'timestamp': status.timestamp,
+                'overall_health': status.overall_health,
+                'risk_level': status.risk_level,
+                'latency_ms': self.latency[bridge_id] * 1e3,
+                **status.parameters
+            }
+            for bridge_id, status in self.statuses.items()
+        ]
+        if not rows:
+            return pd.DataFrame()
+        return pd.DataFrame(rows).set_index('bridge_id').sort_index()
+
+
+class FleetAnalyzer:
+    """Streaming analysis of many bridges on a process pool.
+
+    Bridges are assigned to shards by descending sample rate, each to the
+    least loaded shard, so shards carry similar work.  With
+    ``max_workers=0`` the shards run in the calling process (no pool),
+    which gives identical results.
+
+    Args:
+        bridges: Monitored bridges (pickled once into their worker)
+        max_workers: Worker processes (default ``os.cpu_count()``)
+        window: Sliding window of every processor (s)
+        baseline_directory: :class:`~stalwart.analysis.baseline.BaselineStore`
+            directory shared by the workers (default: baselines in memory)
+    """
+
+    def __init__(
+        self,
+        bridges: Sequence[Bridge],
+        max_workers: Optional[int] = None,
+        window: float = WINDOW,
+        baseline_directory: Optional[str] = None
+    ):
+        ids = [b.specs.bridge_id for b in bridges]
+        if len(set(ids)) != len(ids):
+            raise ValueError("bridge ids must be unique")
+        if max_workers is not None and max_workers < 0:
+            raise ValueError("max_workers must not be negative")
+        self.bridges = {b.specs.bridge_id: b for b in bridges}
+        self.window = window
+        self.baseline_directory = baseline_directory
+
+        workers = max_workers if max_workers else os.cpu_count() or 1
+        n_shards = max(1, min(len(bridges), workers))
+        load = np.zeros(n_shards)
+        self.shards: List[List[str]] = [[] for _ in range(n_shards)]
+        self.shard_of: Dict[str, int] = {}
+        rate = {
+            bid: sum(s.specs.sampling_rate for s in b.sensors)
+            for bid, b in self.bridges.items()
+        }
+        for bridge_id in sorted(rate, key=rate.get, reverse=True):
+            shard = int(np.argmin(load))
+            self.shards[shard].append(bridge_id)
+            self.shard_of[bridge_id] = shard
+            load[shard] += rate[bridge_id]
+
+        self.in_process = max_workers == 0
+        self._executors: List[ProcessPoolExecutor] = []
+        self._local: List[Dict[str, StreamingProcessor]] = []
+        for shard in range(n_shards):
+            if self.in_process:
+                members = [self.bridges[bridge_id] for bridge_id in self.shards[shard]]
+                self._local.append(_processors(members, window, baseline_directory))
+            else:
+                self._executors.append(self._executor(shard))
+        logger.info(f"Fleet of {len(bridges)} bridges in {n_shards} shards")
+
+    def _executor(self, shard: int) -> ProcessPoolExecutor:
+        """A single-process pool whose worker holds the shard's processors."""
+        members = [self.bridges[bridge_id] for bridge_id in self.shards[shard]]
+        return ProcessPoolExecutor(
+            max_workers=1, initializer=_init_shard,
+            initargs=(members, self.window, self.baseline_directory)
+        )
+
+    def _replace_executor(self, shard: int):
+        """Start a new worker for a shard whose worker died."""
+        logger.warning(
+            f"Worker of shard {shard} died; restarting it with fresh processors"
+        )
+        self._executors[shard].shutdown(wait=False)
+        self._executors[shard] = self._executor(shard)
+
+    def _submit(self, shard: int, *args):
+        try:
+            return self._executors[shard].submit(_analyze_shared, *args)
+        except BrokenProcessPool:
+            # The worker died since the last round
+            self._replace_executor(shard)
+            return self._executors[shard].submit(_analyze_shared, *args)
+
+    def __enter__(self) -> 'FleetAnalyzer':
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        """Shut the worker processes down."""
+        for executor in self._executors:
+            executor.shutdown(wait=True)
+        self._executors = []
+
+    def _pack(
+        self, shard: int, blocks: Dict[str, Dict[str, SampleBlock]]
+    ) -> Tuple[List[np.ndarray], List[BlockLayout]]:
+        arrays, layout, offset = [], [], 0
+        for bridge_id in self.shards[shard]:
+            for sensor_id, block in blocks.get(bridge_id, {}).items():
+                n = len(block.values)
+                arrays.append(block.values)
+                layout.append((
+                    bridge_id, sensor_id, offset, n,
+                    block.start_time_ns, block.sample_period_ns
+                ))
+                offset += n
+        return arrays, layout
+
+    def analyze(self, blocks: Dict[str, Dict[str, SampleBlock]]) -> FleetStatus:
+        """
+        Ingest one round of blocks and update every bridge that received data.
+
+        Args:
+            blocks: ``{bridge_id: {sensor_id: SampleBlock}}``
+
+        Returns:
+            FleetStatus; a bridge whose analysis failed, or whose worker
+            died during the round, is listed in ``errors``
+        """
+        unknown = set(blocks) - set(self.bridges)
+        if unknown:
+            raise ValueError(f"Unknown bridges: {sorted(unknown)}")
+        start = time.perf_counter()
+
+        results: Dict[str, Tuple[BridgeStatus, float]] = {}
+        errors: Dict[str, str] = {}
+        segments, futures = [], []
+        try:
+            for shard in range(len(self.shards)):
+                arrays, layout = self._pack(shard, blocks)
+                if not layout:
+                    continue
+                if self.in_process:
+                    values = np.concatenate(arrays).astype(VALUE_DTYPE, copy=False)
+                    shard_results, shard_errors = _analyze_shard(
+                        self._local[shard], values, layout
+                    )
+                    results.update(shard_results)
+                    errors.update(shard_errors)
+                    continue
+
+                n_values = sum(len(a) for a in arrays)
+                size = max(1, n_values) * np.dtype(VALUE_DTYPE).itemsize
+                shm = shared_memory.SharedMemory(create=True, size=size)
+                segments.append(shm)
+                shared = np.ndarray((n_values,), dtype=VALUE_DTYPE, buffer=shm.buf)
+                np.concatenate(arrays, out=shared)
+                del shared
+                futures.append((shard, self._submit(shard, shm.name, n_values, layout)))
+
+            for shard, future in futures:
+                try:
+                    shard_results, shard_errors = future.result()
+                except Exception as e:
+                    logger.error(f"Shard {shard} failed: {e}")
+                    if isinstance(e, BrokenProcessPool):
+                        self._replace_executor(shard)
+                    for bridge_id in self.shards[shard]:
+                        if bridge_id in blocks:
+                            errors[bridge_id] = str(e)
+                    continue
+                results.update(shard_results)
+                errors.update(shard_errors)
+        finally:
+            for shm in segments:
+                shm.close()
+                shm.unlink()
+
+        statuses = {bridge_id: status for bridge_id, (status, _) in results.items()}
+        for bridge_id, status in statuses.items():
+            self.bridges[bridge_id].status = status
+        return FleetStatus(
+            statuses=statuses,
+            latency={bridge_id: latency for bridge_id, (_, latency) in results.items()},
+            wall_time=time.perf_counter() - start,
+            errors=errors
+        )
@@ -0,0 +1,165 @@
+"""Bounded, array-backed history of metric results."""
+
+from typing import Any, Dict, Optional
+
+import numpy as np
+
+from ..core.measurement import (
+    TIMESTAMP_DTYPE, VALUE_DTYPE, as_scalar_ns, bin_aggregate, parse_frequency
+)
+from .metrics import STATUS_CODES, UNKNOWN_STATUS, MetricResult
+
+# One analysis result of one metric
+HISTORY_DTYPE = np.dtype([
+    ('timestamp', TIMESTAMP_DTYPE),  # epoch ns
+    ('value', VALUE_DTYPE),
+    ('status', np.int8),  # STATUS_CODES, UNKNOWN_STATUS for anything else
+    ('confidence', np.float32),
+])
+
+# Results kept per metric: a day of 10 s updates
+DEFAULT_CAPACITY = 8640
+
+# Records allocated before the buffer first grows
+_INITIAL_ALLOCATION = 64
+
+
+class MetricHistory:
+    """Fixed-capacity history of one metric, oldest record first.
+
+    Records live in a mirrored circular buffer of :data:`HISTORY_DTYPE`
+    (stored twice back to back, as in :class:`~stalwart.core.ring_buffer.RingBuffer`),
+    so the history is always one contiguous, time-ordered view.  Appends
+    are O(1), range queries O(log n) by binary search on the timestamps,
+    and memory is at most ``2 * capacity * 21`` bytes however long the
+    monitor runs; the oldest records are overwritten.  The buffer starts
+    small and doubles until it reaches ``capacity``.
+    """
+
+    def __init__(self, capacity: int = DEFAULT_CAPACITY):
+        if capacity <= 0:
+            raise ValueError("capacity must be positive")
+        self.capacity = capacity
+        self._allocated = min(capacity, _INITIAL_ALLOCATION)
+        self._records = np.zeros(2 * self._allocated, dtype=HISTORY_DTYPE)
+        self._head = 0
+        self._size = 0
+
+    def _grow(self):
+        # Only called when full for the first time: the records are the
+        # whole lower half, oldest first
+        allocated = min(2 * self._allocated, self.capacity)
+        records = np.zeros(2 * allocated, dtype=HISTORY_DTYPE)
+        current = self._records[:self._size]
+        records[:self._size] = records[allocated:allocated + self._size] = current
+        self._records, self._allocated = records, allocated
+        self._head = self._size
+
+    def __len__(self) -> int:
+        return self._size
+
+    def append(
+        self, timestamp: Any, value: float, status: str, confidence: float = 1.0
+    ):
+        """Add one result.
+
+        ``timestamp`` may be a datetime, datetime64, epoch-ns int or
+        epoch-s float.  A timestamp before the newest record (a clock step
+        back) is raised to it, so the history stays sorted.
+        """
+        timestamp_ns = as_scalar_ns(timestamp)
+        if self._size:
+            newest = self._records[self._head + self._allocated - 1]['timestamp']
+            timestamp_ns = max(timestamp_ns, int(newest))
+        if self._size == self._allocated < self.capacity:
+            self._grow()
+        code = STATUS_CODES.get(status, UNKNOWN_STATUS)
+        record = (timestamp_ns, value, code, confidence)
+        head, allocated = self._head, self._allocated
+        self._records[head] = self._records[head + allocated] = record
+        self._head = (head + 1) % allocated
+        self._size = min(self._size + 1, allocated)
+
+    def append_result(self, timestamp: Any, result: MetricResult):
+        self.append(timestamp, result.value, result.status, result.confidence)
+
+    @property
+    def records(self) -> np.ndarray:
+        """All records oldest-first (structured view)."""
+        end = self._head + self._allocated
+        return self._records[end - self._size:end]
+
+    @property
+    def timestamps_ns(self) -> np.ndarray:
+        return self.records['timestamp']
+
+    @property
+    def values(self) -> np.ndarray:
+        return self.records['value']
+
+    @property
+    def latest(self) -> Optional[np.void]:
+        """The newest record, or None."""
+        return self.records[-1] if self._size else None
+
+    def range(self, start: Any = None, end: Any = None) -> np.ndarray:
+        """Records in ``[start, end)`` as a view; None leaves that side open."""
+        records = self.records
+        t = records['timestamp']
+        lo = 0 if start is None else int(np.searchsorted(t, as_scalar_ns(start)))
+        hi = len(t) if end is None else int(np.searchsorted(t, as_scalar_ns(end)))
+        return records[lo:max(lo, hi)]
+
+    def downsample(
+        self, frequency: Any, start: Any = None, end: Any = None, how: str = 'mean'
+    ) -> np.ndarray:
+        """
+        Records of ``[start, end)`` aggregated into fixed time buckets.
+
+        Each non-empty bucket gives one record stamped at the bucket start:
+        the ``how`` aggregate of the values (see
+        :func:`~stalwart.core.measurement.bin_aggregate`), the worst status
+        and the mean confidence.
+        """
+        records = self.range(start, end)
+        step = parse_frequency(frequency)
+        t = records['timestamp']
+        values = bin_aggregate(t, records['value'], step, (how,))
+        status = bin_aggregate(t, records['status'], step, ('max',))['max']
+        confidence = records['confidence'].astype(np.float64)
+        confidence = bin_aggregate(t, confidence, step, ('mean',))['mean']
+
+        result = np.empty(len(values['timestamp']), dtype=HISTORY_DTYPE)
+        result['timestamp'] = values['timestamp']
+        result['value'] = values[how]
+        result['status'] = status
+        result['confidence'] = confidence
+        return result
+
+    def clear(self):
+        self._head = 0
+        self._size = 0
+
+    def to_dataframe(self, start: Any = None, end: Any = None):
+        """Records of ``[start, end)`` as a DataFrame indexed by time."""
+        import pandas as pd
+        records = self.range(start, end)
+        return pd.DataFrame({
+            'value': records['value'],
+            'status': records['status'],
+            'confidence': records['confidence'],
+        }, index=pd.DatetimeIndex(
+            records['timestamp'].view('datetime64[ns]'), name='timestamp'
+        ))
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'capacity': self.capacity,
+            'size': self._size,
+            'latest': None if not self._size else {
+                'timestamp': int(self.latest['timestamp']),
+                'value': float(self.latest['value']),
+                'status': int(self.latest['status']),
+                'confidence': float(self.latest['confidence'])
+            }
+        }
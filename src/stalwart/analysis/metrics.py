@@ -7,14 +7,32 @@ for Structural Health Monitoring and Failure Prevention.
 
 import numpy as np
 from typing import Optional, Dict, Any, List, Union
+from numpy.typing import ArrayLike
 from dataclasses import dataclass
 
+from ..core.measurement import VALUE_DTYPE
 from ..utils.constants import THRESHOLDS
 from ..utils.logger import get_logger
+from .structural.fatigue import (
+    SN_CONSTANT, SN_EXPONENT, rainflow_cycles, strain_to_stress
+)
+
+try:
+    from rainflow import count_cycles
+    HAS_RAINFLOW = True
+except ImportError:
+    # Built-in ASTM E1049 counting gives the same cycles
+    HAS_RAINFLOW = False
 
 logger = get_logger(__name__)
 
 
+# Metric statuses in order of severity; the index is the status code
+STATUSES = ("SAFE", "WARNING", "CAUTION", "CRITICAL")
+STATUS_CODES = {status: code for code, status in enumerate(STATUSES)}
+UNKNOWN_STATUS = -1
+
+
 @dataclass
 class MetricResult:
     """Result of a metric calculation."""
@@ -91,36 +109,35 @@ def calculate_alsa(
     design_cycles: int = 100_000_000
 ) -> MetricResult:
     """Calculate Axle Load Strain Accumulation."""
-    try:
-        from rainflow import count_cycles
-        HAS_RAINFLOW = True
-    except ImportError:
-        HAS_RAINFLOW = False
-        ALSA = np.mean(strain_measurements) / yield_strain
-        return MetricResult(ALSA, "WARNING", 0.5, {"note": "simplified calculation"})
-    
-    E = 200e9
-    stress = strain_measurements * 1e-6 * E / 1e6
-    
-    cycles = count_cycles(stress)
+    stress = strain_to_stress(strain_measurements)
     
-    D_total = 0.0
-    for cycle in cycles:
-        if len(cycle) == 3:
-            stress_range, _, n_cycles = cycle
-        elif len(cycle) == 2:
-            stress_range, n_cycles = cycle
+    if HAS_RAINFLOW:
+        cycles = count_cycles(stress)
+        # (range, [mean,] count) rows
+        if cycles:
+            table = np.array(cycles, dtype=np.float64).reshape(len(cycles), -1)
         else:
-            continue
-        
-        if stress_range > 0:
-            N_f = 2e12 / (stress_range ** 3)
-            D_total += n_cycles / N_f
-    
-    if len(strain_measurements) > 0:
-        ALSA = D_total * design_cycles / len(strain_measurements)
+            table = np.zeros((0, 2))
+        stress_range, n_cycles = table[:, 0], table[:, -1]
     else:
-        ALSA = 0.0
+        stress_range, _, n_cycles = rainflow_cycles(stress)
+    
+    D_total = float(np.sum(n_cycles * stress_range ** SN_EXPONENT)) / SN_CONSTANT
+    
+    return calculate_alsa_from_damage(
+        D_total, len(strain_measurements), design_cycles,
+        {'cycles_counted': float(np.sum(n_cycles))}
+    )
+
+
+def calculate_alsa_from_damage(
+    damage: float,
+    samples: int,
+    design_cycles: int = 100_000_000,
+    details: Optional[Dict[str, Any]] = None
+) -> MetricResult:
+    """Calculate ALSA from Miner damage accumulated over ``samples`` strain samples."""
+    ALSA = damage * design_cycles / samples if samples > 0 else 0.0
     
     thresholds = THRESHOLDS['ALSA']
     if ALSA < thresholds['warning']:
@@ -132,10 +149,7 @@ def calculate_alsa(
     else:
         status = "CRITICAL"
     
-    return MetricResult(ALSA, status, 0.9, {
-        'damage_total': D_total,
-        'cycles_counted': len(cycles)
-    })
+    return MetricResult(ALSA, status, 0.9, {'damage_total': damage, **(details or {})})
 
 
 # ============================================================================
@@ -400,6 +414,209 @@ def calculate_sed(
     return MetricResult(SED, status, 0.85, {})
 
 
+# ============================================================================
+# Batch Calculation
+# ============================================================================
+
+# One metric evaluation of a batch (value, STATUS_CODES code, confidence)
+METRIC_DTYPE = np.dtype([
+    ('value', VALUE_DTYPE),
+    ('status', np.int8),
+    ('confidence', np.float32),
+])
+
+
+def classify_status(name: str, values: ArrayLike) -> np.ndarray:
+    """
+    Status codes of many values of one metric (see ``STATUS_CODES``).
+
+    Same rule as the scalar calculators: below ``warning`` is SAFE, below
+    ``caution`` WARNING, below ``critical`` CAUTION, anything else
+    (including NaN) CRITICAL; inverted metrics compare with ``>``.
+    """
+    thresholds = THRESHOLDS[name]
+    limits = np.array(
+        [thresholds['warning'], thresholds['caution'], thresholds['critical']]
+    )
+    x = np.asarray(values, dtype=np.float64)[..., None]
+    below = x > limits if thresholds.get('inverted', False) else x < limits
+    return (len(limits) - below.sum(axis=-1)).astype(np.int8)
+
+
+def _batch_result(
+    name: str, values: np.ndarray, confidence: float, status_values=None
+) -> np.ndarray:
+    result = np.empty(np.shape(values), dtype=METRIC_DTYPE)
+    result['value'] = values
+    result['status'] = classify_status(
+        name, values if status_values is None else status_values
+    )
+    result['confidence'] = confidence
+    return result
+
+
+def _arrays(*args):
+    """
+    Float64 arrays broadcast to a common shape.
+
+    None becomes 0 (falsy, as in the scalar code).
+    """
+    return np.broadcast_arrays(*(
+        np.asarray(0.0 if a is None else a, dtype=np.float64) for a in args
+    ))
+
+
+def calculate_afc_batch(
+    wind_speed: ArrayLike,
+    vertical_amplitude: ArrayLike,
+    damping_ratio: ArrayLike,
+    frequency: ArrayLike,
+    critical_flutter_speed: ArrayLike,
+    design_amplitude: ArrayLike,
+    design_damping: ArrayLike,
+    design_frequency: ArrayLike
+) -> np.ndarray:
+    """:func:`calculate_afc` of broadcast arrays, as a :data:`METRIC_DTYPE` array."""
+    U, A, zeta, f, Uc, Ad, zeta_d, fd = _arrays(
+        wind_speed, vertical_amplitude, damping_ratio, frequency,
+        critical_flutter_speed, design_amplitude, design_damping, design_frequency
+    )
+    with np.errstate(divide='ignore', invalid='ignore'):
+        VR = U / Uc
+        AR = np.where(Ad > 0, np.sqrt(A / Ad), 0.0)
+        DR = np.where(zeta_d > 0, 1 - zeta / zeta_d, 0.0)
+        FR = np.where(fd > 0, np.abs(f - fd) / fd, 0.0)
+    return _batch_result('AFC', VR * AR * (1 + DR) * (1 + FR) * 1.1, 0.9)
+
+
+def calculate_alsa_batch(
+    strain_measurements: ArrayLike,
+    yield_strain: float,
+    design_cycles: int = 100_000_000
+) -> np.ndarray:
+    """
+    :func:`calculate_alsa` of every row of ``strain_measurements``.
+
+    Args:
+        strain_measurements: Windows x samples (microstrain)
+
+    Returns:
+        :data:`METRIC_DTYPE` array, one entry per window
+    """
+    strain = np.atleast_2d(np.asarray(strain_measurements, dtype=np.float64))
+    # Cycle counting is sequential within a window
+    values = np.array([
+        calculate_alsa(row, yield_strain, design_cycles).value for row in strain
+    ])
+    return _batch_result('ALSA', values, 0.9)
+
+
+def calculate_cpii_batch(
+    wire_breaks: Optional[ArrayLike] = None,
+    total_wires: Optional[ArrayLike] = None,
+    bridge_type: str = "cable_stayed"
+) -> np.ndarray:
+    """:func:`calculate_cpii` of broadcast arrays, as a :data:`METRIC_DTYPE` array.
+
+    Too few wires for one critical break gives ``-inf`` (CRITICAL) where the
+    scalar function divides by zero.
+    """
+    breaks, wires = _arrays(wire_breaks, total_wires)
+    CPII = np.ones(breaks.shape)
+    if bridge_type in ['cable_stayed', 'suspension']:
+        counted = (breaks != 0) & (wires != 0)
+        N_critical = np.trunc(0.02 * wires)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            CPII = np.where(counted, 1 - breaks / N_critical, CPII)
+    return _batch_result('CPII', CPII, 0.85)
+
+
+def calculate_ffd_batch(
+    current_frequency: ArrayLike,
+    baseline_frequency: ArrayLike,
+    temperature: Optional[ArrayLike] = None,
+    reference_temperature: Optional[ArrayLike] = None
+) -> np.ndarray:
+    """:func:`calculate_ffd` of broadcast arrays, as a :data:`METRIC_DTYPE` array."""
+    f, f0, T, T0 = _arrays(
+        current_frequency, baseline_frequency, temperature, reference_temperature
+    )
+    corrected = np.where((T != 0) & (T0 != 0), f * (1 + 0.0002 * (T - T0)), f)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        FFD = (corrected - f0) / f0 * 100
+    return _batch_result('FFD', FFD, 0.95, np.abs(FFD))
+
+
+def calculate_lts_batch(
+    temperature_delta: ArrayLike,
+    measured_expansion: ArrayLike,
+    expected_expansion: ArrayLike
+) -> np.ndarray:
+    """:func:`calculate_lts` of broadcast arrays, as a :data:`METRIC_DTYPE` array."""
+    dT, measured, expected = _arrays(
+        temperature_delta, measured_expansion, expected_expansion
+    )
+    with np.errstate(divide='ignore', invalid='ignore'):
+        joint_efficiency = np.where(expected > 0, measured / expected, 1.0)
+    thermal_stress = 200e9 * 12e-6 * dT * (1 - joint_efficiency)
+    return _batch_result('LTS', thermal_stress / 350e6 * 100, 0.9)
+
+
+def calculate_ccf_batch(
+    chloride_concentration: Optional[ArrayLike] = None,
+    carbonation_depth: Optional[ArrayLike] = None,
+    concrete_cover: Optional[ArrayLike] = None
+) -> np.ndarray:
+    """:func:`calculate_ccf` of broadcast arrays, as a :data:`METRIC_DTYPE` array."""
+    chloride, depth, cover = _arrays(
+        chloride_concentration, carbonation_depth, concrete_cover
+    )
+    with np.errstate(divide='ignore', invalid='ignore'):
+        chloride_ccf = np.where(chloride != 0, chloride / 0.4 * 100, -np.inf)
+        carbonation_ccf = np.where(
+            (depth != 0) & (cover != 0), depth / cover * 100, -np.inf
+        )
+    CCF = np.maximum(chloride_ccf, carbonation_ccf)
+    return _batch_result('CCF', np.where(np.isneginf(CCF), 0.0, CCF), 0.85)
+
+
+def calculate_tvr_batch(
+    current_damping: ArrayLike,
+    baseline_damping: ArrayLike,
+    current_decay_time: ArrayLike,
+    baseline_decay_time: ArrayLike
+) -> np.ndarray:
+    """:func:`calculate_tvr` of broadcast arrays, as a :data:`METRIC_DTYPE` array."""
+    zeta, zeta0, tau, tau0 = _arrays(
+        current_damping, baseline_damping, current_decay_time, baseline_decay_time
+    )
+    with np.errstate(divide='ignore', invalid='ignore'):
+        TVR = (zeta / zeta0) * (tau0 / tau)
+    return _batch_result('TVR', np.clip(TVR, 0.1, 1.0), 0.9)
+
+
+def calculate_bd_batch(
+    displacement: ArrayLike,
+    displacement_capacity: ArrayLike
+) -> np.ndarray:
+    """:func:`calculate_bd` of broadcast arrays, as a :data:`METRIC_DTYPE` array."""
+    d, capacity = _arrays(displacement, displacement_capacity)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        BD = np.where(capacity > 0, np.abs(d) / capacity * 100, 0.0)
+    return _batch_result('BD', BD, 0.95)
+
+
+def calculate_sed_batch(
+    local_strain: ArrayLike,
+    global_strain: ArrayLike
+) -> np.ndarray:
+    """:func:`calculate_sed` of broadcast arrays, as a :data:`METRIC_DTYPE` array."""
+    local, global_ = _arrays(local_strain, global_strain)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        U_ratio = np.where(global_ > 0, (local / global_) ** 2, 1.0)
+    return _batch_result('SED', U_ratio * 50, 0.85)
+
+
 # ============================================================================
 # Health Index Calculation
 # ============================================================================
@@ -440,9 +657,13 @@ METRIC_NAMES = [cls.name for cls in METRIC_CLASSES]
 __all__ = [
     'AFC', 'ALSA', 'CPII', 'FFD', 'LTS', 'CCF', 'TVR', 'BD', 'SED',
     'MetricResult',
-    'calculate_afc', 'calculate_alsa', 'calculate_cpii',
+    'calculate_afc', 'calculate_alsa', 'calculate_alsa_from_damage', 'calculate_cpii',
     'calculate_ffd', 'calculate_lts', 'calculate_ccf',
     'calculate_tvr', 'calculate_bd', 'calculate_sed',
+    'calculate_afc_batch', 'calculate_alsa_batch', 'calculate_cpii_batch',
+    'calculate_ffd_batch', 'calculate_lts_batch', 'calculate_ccf_batch',
+    'calculate_tvr_batch', 'calculate_bd_batch', 'calculate_sed_batch',
+    'classify_status', 'METRIC_DTYPE', 'STATUSES', 'STATUS_CODES',
     'calculate_health_index',
     'METRIC_CLASSES', 'METRIC_NAMES'
 ]
@@ -5,26 +5,71 @@ from datetime import datetime
 import numpy as np
 
 from ..core.bridge import Bridge, BridgeStatus
-from ..core.measurement import Measurement
+from ..core.measurement import Measurement, as_scalar_ns, from_epoch_ns
 from .metrics import (
     calculate_afc, calculate_alsa, calculate_cpii,
     calculate_ffd, calculate_lts, calculate_ccf,
     calculate_tvr, calculate_bd, calculate_sed,
-    calculate_health_index, MetricResult
+    calculate_health_index, MetricResult, METRIC_NAMES
+)
+from .baseline import SAVE_INTERVAL, BaselineModel, BaselineStore
+from .history import DEFAULT_CAPACITY, MetricHistory
+from .structural.damping import DecayEstimate, envelope_decay_time, random_decrement
+from .structural.modal import MODAL_METHODS, ModalResult, ModeTracker, identify_modes
+from .signal_processing.frequency import (
+    FREQUENCY_ESTIMATORS, estimate_frequency, zero_crossing_frequency
 )
 from ..utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+DEFAULT_FREQUENCY = 1.2  # Hz, used when no estimate is available
+DEFAULT_SAMPLING_RATE = 100.0  # Hz, for sensors not attached to the bridge
+DEFAULT_DAMPING = 0.024  # design damping ratio, used when no baseline exists
+DEFAULT_DECAY_TIME = 5.0  # s
+
+# Confidence from which measured free decays are used for TVR
+MIN_DECAY_CONFIDENCE = 0.5
+
+# Band around a mode's frequency isolating it for damping estimation
+DAMPING_BAND = (0.7, 1.3)
+
 
 class AnalysisProcessor:
     """Main processor for bridge health analysis."""
     
-    def __init__(self, bridge: Bridge):
+    def __init__(
+        self,
+        bridge: Bridge,
+        frequency_method: Optional[str] = None,
+        modal_method: Optional[str] = None,
+        history_capacity: int = DEFAULT_CAPACITY,
+        baseline_store: Optional[BaselineStore] = None
+    ):
         self.bridge = bridge
-        self.metrics_history: Dict[str, List[Dict[str, Any]]] = {
-            'AFC': [], 'ALSA': [], 'CPII': [], 'FFD': [],
-            'LTS': [], 'CCF': [], 'TVR': [], 'BD': [], 'SED': []
+        self.frequency_method = frequency_method or bridge.specs.frequency_estimator
+        if self.frequency_method not in FREQUENCY_ESTIMATORS:
+            raise ValueError(
+                f"Unknown frequency estimator {self.frequency_method!r}; "
+                f"expected one of {sorted(FREQUENCY_ESTIMATORS)}"
+            )
+        self.modal_method = modal_method or bridge.specs.modal_method
+        if self.modal_method not in MODAL_METHODS:
+            raise ValueError(
+                f"Unknown modal method {self.modal_method!r}; "
+                f"expected one of {sorted(MODAL_METHODS)}"
+            )
+        self.mode_tracker = ModeTracker()
+        self.last_modal_result: Optional[ModalResult] = None
+        self.baseline_store = baseline_store
+        bridge_id = bridge.specs.bridge_id
+        if baseline_store is not None:
+            self.baseline = baseline_store.get(bridge_id)
+        else:
+            self.baseline = BaselineModel(bridge_id)
+        self._baseline_saved_ns: Optional[int] = None
+        self.metrics_history: Dict[str, MetricHistory] = {
+            name: MetricHistory(history_capacity) for name in METRIC_NAMES
         }
     
     def analyze(self, measurements: List[Measurement]) -> BridgeStatus:
@@ -36,42 +81,44 @@ class AnalysisProcessor:
         
         # Calculate metrics
         if 'accelerometer' in sensor_data:
-            accel_values = [m.value for m in sensor_data['accelerometer']]
-            
-            # FFD
-            frequency = self._estimate_frequency_simple(accel_values)
-            ffd_result = calculate_ffd(
-                current_frequency=frequency,
-                baseline_frequency=frequency
-            )
-            metrics['FFD'] = ffd_result
-            
-            # TVR
-            current_damping = self._estimate_damping_simple(accel_values)
-            current_decay = self._estimate_decay_time_simple(accel_values)
-            tvr_result = calculate_tvr(
-                current_damping=current_damping,
-                baseline_damping=0.024,
-                current_decay_time=current_decay,
-                baseline_decay_time=5.0
-            )
-            metrics['TVR'] = tvr_result
+            temperature = None
+            if 'temperature' in sensor_data:
+                temperature = float(np.mean(
+                    [m.value for m in sensor_data['temperature']]
+                ))
+            metrics.update(self._vibration_metrics(
+                sensor_data['accelerometer'], temperature
+            ))
         
         if 'strain_gauge' in sensor_data:
-            strain_values = [m.value for m in sensor_data['strain_gauge']]
-            alsa_result = calculate_alsa(
-                strain_measurements=np.array(strain_values),
-                yield_strain=2000
-            )
-            metrics['ALSA'] = alsa_result
-            
-            sed_result = calculate_sed(
-                local_strain=max(strain_values) if strain_values else 0,
-                global_strain=np.mean(strain_values) if strain_values else 0
-            )
-            metrics['SED'] = sed_result
+            strain_values = np.array([m.value for m in sensor_data['strain_gauge']])
+            metrics.update(self._strain_metrics(
+                strain_values, strain_values.max(), strain_values.mean()
+            ))
         
-        # Add default metrics
+        newest = max((m.timestamp for m in measurements), default=None)
+        return self._status(metrics, newest)
+    
+    def _strain_metrics(
+        self, strain: np.ndarray, local: float, mean: float
+    ) -> Dict[str, MetricResult]:
+        """ALSA from the strain record and SED from its peak and mean."""
+        return {
+            'ALSA': calculate_alsa(strain_measurements=strain, yield_strain=2000),
+            'SED': calculate_sed(local_strain=local, global_strain=mean)
+        }
+    
+    def _status(
+        self, metrics: Dict[str, MetricResult], timestamp: Any = None
+    ) -> BridgeStatus:
+        """
+        Complete ``metrics`` with the default parameters and rate the bridge.
+
+        ``timestamp`` is the time of the newest analyzed sample (anything
+        :func:`~stalwart.core.measurement.as_scalar_ns` accepts); the status
+        and the history records carry it, so replays and backfills keep
+        their data time.  Without data the wall clock is used.
+        """
         metrics['CPII'] = calculate_cpii(bridge_type=self.bridge.specs.bridge_type)
         metrics['AFC'] = calculate_afc(15.0, 0.05, 0.02, 1.2, 70.0, 0.1, 0.024, 1.2)
         metrics['LTS'] = calculate_lts(25.0, 150.0, 200.0)
@@ -85,13 +132,21 @@ class AnalysisProcessor:
         risk_level = self._determine_risk_level(metrics, health_index)
         
         # Create status
+        timestamp_ns = None if timestamp is None else as_scalar_ns(timestamp)
         status = BridgeStatus(
             bridge_id=self.bridge.specs.bridge_id,
-            timestamp=datetime.now(),
+            timestamp=(
+                datetime.now() if timestamp_ns is None else from_epoch_ns(timestamp_ns)
+            ),
             overall_health=health_index,
             risk_level=risk_level,
             parameters={k: v.value for k, v in metrics.items()}
         )
+        for name, result in metrics.items():
+            if name in self.metrics_history:
+                self.metrics_history[name].append_result(
+                    status.timestamp if timestamp_ns is None else timestamp_ns, result
+                )
         
         logger.info(f"Analysis complete: Health={health_index:.1f}%, Risk={risk_level}")
         
@@ -122,57 +177,290 @@ class AnalysisProcessor:
         
         return organized
     
-    def _estimate_damping_simple(self, values: List[float]) -> float:
-        """Simple damping estimation."""
-        if len(values) < 20:
-            return 0.024
-        
-        max_val = max(abs(v) for v in values)
-        min_val = min(abs(v) for v in values)
-        
-        if max_val + min_val > 0:
-            damping = 0.5 * (max_val - min_val) / (max_val + min_val)
-            # التأكد من أن القيمة أقل من 0.05 (وليس أقل من أو يساوي)
-            return min(0.049, max(0.001, damping))
-        
-        return 0.024
-    
+    @staticmethod
+    def _damping_band(frequency: float, fs: float) -> tuple:
+        """Pass band isolating the mode at ``frequency`` for random decrement."""
+        return (
+            DAMPING_BAND[0] * frequency,
+            min(DAMPING_BAND[1] * frequency, 0.45 * fs)
+        )
+
+    def _estimate_damping_simple(self, values: List[float], fs: float = 100) -> float:
+        """Damping of the dominant mode of one channel by random decrement."""
+        values = np.asarray(values, dtype=float)
+        frequency = estimate_frequency(values, fs, 'fft_peak')
+        if not np.isfinite(frequency) or len(values) < 64:
+            return DEFAULT_DAMPING
+        band = self._damping_band(frequency, fs)
+        damping = random_decrement(values, fs, band).damping[0]
+        return float(damping) if np.isfinite(damping) else DEFAULT_DAMPING
+
+    def _estimate_damping(
+        self, measurements: List[Measurement], frequency: float
+    ) -> float:
+        """
+        Damping of the mode at ``frequency`` by random decrement.
+
+        Every channel group is band-passed around the mode and processed in
+        one call; the result is the median over channels.
+        """
+        estimates = []
+        for (fs, n), group in self._channels(measurements).items():
+            band = self._damping_band(frequency, fs)
+            if n < 64 or band[0] >= band[1]:
+                continue
+            estimates.append(random_decrement(np.array(group), fs, band).damping)
+        if not estimates:
+            return DEFAULT_DAMPING
+        estimates = np.concatenate(estimates)
+        estimates = estimates[np.isfinite(estimates)]
+        return float(np.median(estimates)) if len(estimates) else DEFAULT_DAMPING
+
+    def _vibration_metrics(
+        self,
+        measurements: List[Measurement],
+        temperature: Optional[float] = None
+    ) -> Dict[str, MetricResult]:
+        """
+        FFD and TVR from accelerometer data.
+
+        Once the bridge's baseline model is commissioned, the fundamental
+        is compared with the model at the current temperature.  Until then
+        the tracked fundamental is compared with its own first
+        identification (and teaches the model); without identified modes
+        the single channel estimators are used, compared with the baseline
+        of the (dormant) tracked fundamental if there is one.
+        """
+        modal = self._identify_modes(measurements)
+        identified = modal is not None and bool(modal.modes)
+        if identified:
+            self.last_modal_result = modal
+            self.mode_tracker.update(modal)
+        # A fundamental missing from this window keeps only its baseline
+        track = self.mode_tracker.fundamental
+
+        if identified and track is not None and not track.missed:
+            frequency = track.frequency
+            damping = track.damping
+            if not np.isfinite(damping):
+                damping = self._estimate_damping(measurements, frequency)
+            if track.baseline_damping is None:
+                track.baseline_damping = damping
+            timestamp = max(m.timestamp for m in measurements)
+            baseline_frequency, baseline_damping = self._reference(
+                timestamp, temperature, frequency, damping,
+                track.baseline_frequency, track.baseline_damping
+            )
+            details = {'method': modal.method, 'mode_shape_mac': track.shape_mac}
+        else:
+            frequency = self._estimate_frequency(measurements)
+            damping = self._estimate_damping(measurements, frequency)
+            baseline_frequency, baseline_damping = frequency, DEFAULT_DAMPING
+            if track is not None:
+                baseline_frequency = track.baseline_frequency
+                baseline_damping = track.baseline_damping or DEFAULT_DAMPING
+            if self.baseline.frozen:
+                baseline_frequency, baseline_damping = self._reference(
+                    None, temperature, frequency, damping,
+                    baseline_frequency, baseline_damping
+                )
+            details = {}
+
+        ffd_result = calculate_ffd(
+            current_frequency=frequency, baseline_frequency=baseline_frequency
+        )
+        ffd_result.details.update(details)
+        ffd_result.details.update({
+            'frequency': frequency,
+            'baseline_frequency': baseline_frequency,
+            'temperature': temperature,
+            'temperature_compensated': self.baseline.frozen
+        })
+        tvr_result = self._tvr(
+            frequency, baseline_frequency, damping, baseline_damping,
+            self._estimate_decay_time(measurements, frequency)
+        )
+        return {'FFD': ffd_result, 'TVR': tvr_result}
+
+    def _reference(
+        self,
+        timestamp: Any,
+        temperature: Optional[float],
+        frequency: float,
+        damping: float,
+        baseline_frequency: float,
+        baseline_damping: float
+    ) -> tuple:
+        """
+        Baseline frequency and damping for FFD and TVR.
+
+        A commissioned model is evaluated at ``temperature``.  Otherwise the
+        observation is learned and the given fallback baseline is returned.
+        With a store, a commissioning model is persisted at most once per
+        :data:`~stalwart.analysis.baseline.SAVE_INTERVAL` of data time, and
+        always when it freezes.
+        """
+        if not self.baseline.frozen:
+            done = self.baseline.update(timestamp, temperature, frequency, damping)
+            now_ns = self.baseline.last_ns
+            if self.baseline_store is not None and (
+                done or self._baseline_saved_ns is None
+                or now_ns - self._baseline_saved_ns >= SAVE_INTERVAL * 1e9
+            ):
+                self.baseline_store.save(self.baseline)
+                self._baseline_saved_ns = now_ns
+            if done:
+                logger.info(
+                    f"Baseline of bridge {self.bridge.specs.bridge_id} commissioned: "
+                    f"{self.baseline.evaluate().frequency:.4f} Hz at "
+                    f"{self.baseline.reference_temperature:.1f} C, "
+                    f"{self.baseline.temperature_coefficient * 100:+.3f} %/C"
+                )
+            return baseline_frequency, baseline_damping
+
+        reference = self.baseline.evaluate(temperature)
+        if np.isfinite(reference.damping) and reference.damping > 0:
+            baseline_damping = reference.damping
+        return reference.frequency, baseline_damping
+
+    def _tvr(
+        self,
+        frequency: float,
+        baseline_frequency: float,
+        damping: float,
+        baseline_damping: float,
+        decay: Optional[DecayEstimate] = None
+    ) -> MetricResult:
+        """
+        TVR from the current and baseline damping.
+
+        The baseline decay time is the one implied by the baseline frequency
+        and damping, so once the model is commissioned it is the persisted,
+        temperature-compensated reference.  Measured free decays give the
+        current decay time when there are enough of them, otherwise the
+        current damping does; ``details['decay_source']`` records which.
+        """
+        baseline_decay_time = 1 / (2 * np.pi * baseline_frequency * baseline_damping)
+        if decay is not None and decay.confidence >= MIN_DECAY_CONFIDENCE:
+            decay_time, source = decay.decay_time, 'measured'
+        else:
+            decay_time, source = 1 / (2 * np.pi * frequency * damping), 'damping'
+
+        tvr_result = calculate_tvr(
+            current_damping=damping,
+            baseline_damping=baseline_damping,
+            current_decay_time=decay_time,
+            baseline_decay_time=baseline_decay_time
+        )
+        tvr_result.details.update({
+            'damping': damping,
+            'baseline_damping': baseline_damping,
+            'decay_time': decay_time,
+            'baseline_decay_time': baseline_decay_time,
+            'decay_source': source,
+            'decay_confidence': decay.confidence if decay is not None else 0.0
+        })
+        return tvr_result
+
+    def _estimate_decay_time(
+        self, measurements: List[Measurement], frequency: float
+    ) -> DecayEstimate:
+        """
+        Free-decay time of the mode at ``frequency`` from the Hilbert envelope.
+
+        Each channel group is processed at its own sampling rate; the events
+        of all groups are pooled into one median and confidence.
+        """
+        estimates = []
+        for (fs, n), group in self._channels(measurements).items():
+            band = self._damping_band(frequency, fs)
+            if n < 64 or band[0] >= band[1]:
+                continue
+            estimates.append(envelope_decay_time(np.array(group), fs, band))
+        if len(estimates) == 1:
+            return estimates[0]
+
+        if estimates:
+            decay_times = np.concatenate([e.decay_times for e in estimates])
+        else:
+            decay_times = np.empty(0)
+        if not len(decay_times):
+            return DecayEstimate(np.nan, 0.0, 0, decay_times)
+        weights = np.array([e.events for e in estimates], dtype=float)
+        confidence = float(np.average(
+            [e.confidence for e in estimates], weights=weights
+        ))
+        return DecayEstimate(
+            float(np.median(decay_times)), confidence, len(decay_times), decay_times
+        )
+
+    def _channels(
+        self, measurements: List[Measurement]
+    ) -> Dict[tuple, List[List[float]]]:
+        """Group per-sensor value lists by (sampling rate, length)."""
+        channels: Dict[str, List[float]] = {}
+        for m in measurements:
+            channels.setdefault(m.sensor_id, []).append(m.value)
+
+        groups: Dict[tuple, List[List[float]]] = {}
+        for sensor_id, values in channels.items():
+            key = (self._sampling_rate(sensor_id), len(values))
+            groups.setdefault(key, []).append(values)
+        return groups
+
+    def _identify_modes(self, measurements: List[Measurement]) -> Optional[ModalResult]:
+        """Identify modes from the largest group of synchronous channels."""
+        groups = self._channels(measurements)
+        if not groups:
+            return None
+        (fs, _), group = max(groups.items(), key=lambda item: len(item[1]) * item[0][1])
+        try:
+            return identify_modes(np.array(group), fs, self.modal_method)
+        except (ValueError, np.linalg.LinAlgError) as e:
+            logger.warning(f"Modal identification failed: {e}")
+            return None
+
+    def _sampling_rate(self, sensor_id: str) -> float:
+        """Sampling rate of a bridge sensor."""
+        for sensor in self.bridge.sensors:
+            if sensor.sensor_id == sensor_id:
+                return sensor.specs.sampling_rate
+        return DEFAULT_SAMPLING_RATE
+
+    def _estimate_frequency(self, measurements: List[Measurement]) -> float:
+        """
+        Fundamental frequency from accelerometer measurements.
+
+        Each sensor is estimated at its own sampling rate with the bridge's
+        estimator; equal-length channels at the same rate go through in one
+        call.  The result is the median over channels.
+        """
+        groups = self._channels(measurements)
+        estimates = [
+            np.atleast_1d(
+                estimate_frequency(np.array(group), fs, self.frequency_method)
+            )
+            for (fs, _), group in groups.items()
+        ]
+        if not estimates:
+            return DEFAULT_FREQUENCY
+        estimates = np.concatenate(estimates)
+        estimates = estimates[np.isfinite(estimates)]
+        return float(np.median(estimates)) if len(estimates) else DEFAULT_FREQUENCY
+
     def _estimate_frequency_simple(self, values: List[float], fs: float = 100) -> float:
-        """Simple frequency estimation."""
-        if len(values) < 100:
-            return 1.2
-        
-        values = np.array(values) - np.mean(values)
-        
-        zero_crossings = 0
-        for i in range(1, len(values)):
-            if values[i-1] * values[i] < 0:
-                zero_crossings += 1
-        
-        if zero_crossings > 0:
-            duration = len(values) / fs
-            freq = (zero_crossings / 2) / duration
-            return round(freq * 10) / 10
-        
-        return 1.2
-    
-    def _estimate_decay_time_simple(self, values: List[float]) -> float:
-        """Simple decay time estimation."""
-        if len(values) < 50:
-            return 5.0
-        
-        max_idx = np.argmax(np.abs(values))
-        max_val = abs(values[max_idx])
-        
-        if max_val == 0:
-            return 5.0
-        
-        half_val = max_val * 0.5
-        for i in range(max_idx, min(max_idx + 100, len(values))):
-            if abs(values[i]) < half_val:
-                return (i - max_idx) / 100
-        
-        return 5.0
+        """Simple frequency estimation from the zero-crossing rate."""
+        freq = zero_crossing_frequency(np.asarray(values, dtype=float), fs)
+        return float(freq) if np.isfinite(freq) else DEFAULT_FREQUENCY
+
+    def _estimate_decay_time_simple(
+        self, values: List[float], fs: float = 100
+    ) -> float:
+        """Decay time of one channel's free vibration from its Hilbert envelope."""
+        estimate = envelope_decay_time(np.asarray(values, dtype=float), fs)
+        if np.isfinite(estimate.decay_time):
+            return estimate.decay_time
+        return DEFAULT_DECAY_TIME
     
     def _determine_risk_level(self, metrics: Dict[str, MetricResult], health_index: float) -> str:
         """
@@ -0,0 +1,11 @@
+"""Signal processing routines for bridge monitoring data."""
+
+from .frequency import (
+    FREQUENCY_ESTIMATORS, estimate_frequency,
+    fft_peak_frequency, zero_crossing_frequency
+)
+
+__all__ = [
+    'FREQUENCY_ESTIMATORS', 'estimate_frequency',
+    'fft_peak_frequency', 'zero_crossing_frequency'
+]
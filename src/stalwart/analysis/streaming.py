@@ -0,0 +1,527 @@
+"""Streaming (incremental) bridge analysis.
+
+:class:`AnalysisProcessor` analyzes whatever window of measurements it is
+handed from scratch.  :class:`StreamingProcessor` instead ingests sample
+blocks as they arrive and keeps per-channel sliding-window state, so each
+update costs O(new samples) rather than O(window):
+
+* :class:`SlidingWindow` holds the last ``window`` seconds of a channel in
+  a ring buffer together with running sums for the window moments; evicted
+  samples are subtracted as new ones are added.  A monotonic queue of
+  candidate maxima gives the window maximum without a scan.
+* :class:`CrossSpectralAccumulator` keeps the cross-spectral outer products
+  of the Welch segments inside the window and their running sum.  Only the
+  segments completed by a new block are transformed, and frequency-domain
+  decomposition runs on the summed matrix, whose size does not depend on
+  the window length.
+* Each strain gauge feeds a
+  :class:`~stalwart.analysis.structural.fatigue.RainflowCounter`, so ALSA
+  is the fatigue damage accumulated since monitoring started, including
+  cycles that span many blocks.
+"""
+
+from collections import deque
+from datetime import datetime
+from typing import Deque, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from ..acquisition.drivers import SampleBlock
+from ..core.bridge import Bridge, BridgeStatus
+from ..core.ring_buffer import RingBuffer
+from ..core.sensor import Sensor
+from ..utils.logger import get_logger
+from .metrics import (
+    MetricResult, calculate_alsa_from_damage, calculate_ffd, calculate_sed
+)
+from .baseline import BaselineStore
+from .processor import DEFAULT_DAMPING, AnalysisProcessor
+from .structural.fatigue import RainflowCounter, SNCurve, strain_to_stress
+from .structural.modal import ModalResult, default_nperseg, fdd_spectra
+
+logger = get_logger(__name__)
+
+# Default sliding window (s)
+WINDOW = 120.0
+
+
+class SlidingWindow:
+    """The newest ``capacity`` samples of one channel with running moments.
+
+    Sums are kept relative to the first sample ever added, which keeps the
+    variance accurate for signals with a large offset (strain), and are
+    recomputed from the buffer once per ``capacity`` samples so rounding
+    cannot accumulate.
+
+    The window maximum is the head of a queue of (sample index, value)
+    pairs with decreasing values: a sample is dropped once a later one is
+    at least as large, or when it leaves the window.
+    """
+
+    def __init__(self, capacity: int):
+        self.buffer = RingBuffer(capacity)
+        self._shift: Optional[float] = None
+        self._sum = 0.0
+        self._sum_sq = 0.0
+        self._since_resync = 0
+        self._added = 0
+        self._maxima: Deque[Tuple[int, float]] = deque()
+
+    def __len__(self) -> int:
+        return len(self.buffer)
+
+    @property
+    def capacity(self) -> int:
+        return self.buffer.capacity
+
+    def extend(self, timestamps_ns: np.ndarray, values: np.ndarray):
+        """Add a block, dropping the samples that fall out of the window."""
+        k = len(values)
+        if k == 0:
+            return
+        if self._shift is None:
+            self._shift = float(values[0])
+        self._push_maxima(values)
+
+        cap = self.capacity
+        evicted = max(0, len(self.buffer) + k - cap)
+        if k >= cap or self._since_resync + k >= cap:
+            self.buffer.extend(timestamps_ns, values)
+            self._resync()
+            return
+
+        if evicted:
+            old = self.buffer.values[:evicted] - self._shift
+            self._sum -= float(old.sum())
+            self._sum_sq -= float(old @ old)
+        new = np.asarray(values, dtype=np.float64) - self._shift
+        self._sum += float(new.sum())
+        self._sum_sq += float(new @ new)
+        self._since_resync += k
+        self.buffer.extend(timestamps_ns, values)
+
+    def _push_maxima(self, values: np.ndarray):
+        """Queue the block's candidate maxima and drop superseded ones."""
+        v = np.asarray(values, dtype=np.float64)
+        # Within the block only values above everything after them survive
+        later = np.maximum.accumulate(v[::-1])[::-1]
+        survivors = np.append(np.flatnonzero(v[:-1] > later[1:]), len(v) - 1)
+        maxima = self._maxima
+        while maxima and maxima[-1][1] <= later[0]:
+            maxima.pop()
+        maxima.extend(zip((self._added + survivors).tolist(), v[survivors].tolist()))
+        self._added += len(v)
+        first = self._added - self.capacity
+        while maxima[0][0] < first:
+            maxima.popleft()
+
+    def _resync(self):
+        x = self.buffer.values - self._shift
+        self._sum = float(x.sum())
+        self._sum_sq = float(x @ x)
+        self._since_resync = 0
+
+    @property
+    def values(self) -> np.ndarray:
+        """Window values oldest-first (view)."""
+        return self.buffer.values
+
+    @property
+    def mean(self) -> float:
+        n = len(self.buffer)
+        return self._shift + self._sum / n if n else 0.0
+
+    @property
+    def maximum(self) -> float:
+        """Largest value in the window (NaN when empty)."""
+        return self._maxima[0][1] if self._maxima else np.nan
+
+    @property
+    def variance(self) -> float:
+        """Sample variance of the window (0 for fewer than two values)."""
+        n = len(self.buffer)
+        if n < 2:
+            return 0.0
+        return max(0.0, (self._sum_sq - self._sum * self._sum / n) / (n - 1))
+
+
+class CrossSpectralAccumulator:
+    """Sliding Welch estimate of the CSD matrix of synchronous channels.
+
+    Blocks may arrive per channel in any order; a segment is transformed
+    once every live channel has reached its end.  Each segment has its own
+    mean removed (a sensor offset must not depend on where the window
+    starts), so the result is the average of
+    :func:`~stalwart.analysis.structural.modal.cross_spectral_matrix` over
+    the single segments.
+
+    A channel more than a segment (or two of its blocks) behind the
+    newest samples is left out of the following segments, with zero
+    spectra, and its samples are dropped, so one dead sensor neither stops
+    the others nor makes their buffers grow.  Given sample indices, a
+    channel that resumes rejoins at the right position; :attr:`present`
+    tells which channels are in every segment of the window.
+    """
+
+    def __init__(
+        self,
+        n_channels: int,
+        fs: float,
+        nperseg: int,
+        max_segments: int,
+        overlap: float = 0.5
+    ):
+        if nperseg < 8 or max_segments < 1:
+            raise ValueError("nperseg must be at least 8 and max_segments positive")
+        self.n_channels = n_channels
+        self.fs = fs
+        self.nperseg = nperseg
+        self.step = max(1, int(nperseg * (1 - overlap)))
+        self.max_segments = max_segments
+        self.freqs = np.fft.rfftfreq(nperseg, 1 / fs)
+
+        self._window = np.hanning(nperseg)
+        self._scale = 1.0 / (fs * np.sum(self._window ** 2))
+        n_freqs = len(self.freqs)
+        self._segments = np.zeros(
+            (max_segments, n_freqs, n_channels, n_channels), dtype=np.complex128
+        )
+        self._present = np.zeros((max_segments, n_channels), dtype=bool)
+        self._sum = np.zeros((n_freqs, n_channels, n_channels), dtype=np.complex128)
+        self._head = 0
+        self.count = 0  # segments in the window
+        self.pushed = 0  # segments since creation
+
+        # Samples not yet in a segment, per channel, from sample index _start
+        self._pending = [np.empty(0) for _ in range(n_channels)]
+        self._start = [0] * n_channels
+        # Index just past the last sample received, per channel
+        self._end: List[Optional[int]] = [None] * n_channels
+        self._origin: Optional[int] = None  # sample index of the next segment
+        self._block = 0  # largest block seen
+
+    @property
+    def pending(self) -> List[int]:
+        """Samples buffered per channel."""
+        return [len(p) for p in self._pending]
+
+    @property
+    def present(self) -> np.ndarray:
+        """Channels present in every segment of the window."""
+        return self._present[:self.count].all(axis=0)
+
+    def extend(self, channel: int, values: np.ndarray, start: Optional[int] = None):
+        """
+        Append samples of one channel and transform completed segments.
+
+        Args:
+            channel: Channel index
+            values: New samples
+            start: Sample index of ``values[0]`` (e.g. timestamp / period);
+                default: right after the channel's previous block
+        """
+        values = np.asarray(values, dtype=np.float64)
+        if start is None:
+            previous = self._end[channel]
+            start = previous if previous is not None else (self._origin or 0)
+        if self._origin is None:
+            self._origin = start
+        self._end[channel] = start + len(values)
+        self._block = max(self._block, len(values))
+
+        pending = self._pending[channel]
+        if len(pending) and start == self._start[channel] + len(pending):
+            pending = np.concatenate((pending, values))
+        else:
+            # First block, or a gap: the channel starts over at this block
+            pending, self._start[channel] = values.copy(), start
+        self._pending[channel] = pending
+        self._trim(channel)
+        self._advance()
+
+    def _trim(self, channel: int):
+        """Drop samples of ``channel`` before the next segment."""
+        pending = self._pending[channel]
+        cut = min(max(0, self._origin - self._start[channel]), len(pending))
+        if cut:
+            self._pending[channel] = self._pending[channel][cut:]
+            self._start[channel] += cut
+
+    def _advance(self):
+        ends = [start + len(p) for start, p in zip(self._start, self._pending)]
+        lead = max(ends)
+        max_lag = max(self.nperseg, 2 * self._block)
+        for channel, end in enumerate(ends):
+            if lead - end > max_lag and len(self._pending[channel]):
+                self._pending[channel] = np.empty(0)
+                self._start[channel] = end
+        live = [c for c in range(self.n_channels) if lead - ends[c] <= max_lag]
+        if not any(self._start[c] == self._origin for c in live):
+            # Every channel of the old origin went silent: restart at the
+            # oldest live sample
+            self._origin = min(self._start[c] for c in live)
+        active = [c for c in live if self._start[c] == self._origin]
+
+        available = min(ends[c] for c in active) - self._origin
+        if available < self.nperseg:
+            return
+        n_new = 1 + (available - self.nperseg) // self.step
+        span = (n_new - 1) * self.step + self.nperseg
+        y = np.stack([self._pending[c][:span] for c in active])
+        segments = np.lib.stride_tricks.sliding_window_view(y, self.nperseg, axis=1)
+        segments = segments[:, ::self.step]
+        segments = segments - segments.mean(axis=-1, keepdims=True)
+        spectra = np.zeros(
+            (n_new, len(self.freqs), self.n_channels), dtype=np.complex128
+        )
+        transformed = np.fft.rfft(segments * self._window, axis=-1)
+        spectra[:, :, active] = transformed.transpose(1, 2, 0)
+        present = np.zeros(self.n_channels, dtype=bool)
+        present[active] = True
+        self._push(spectra[..., :, None] * spectra[..., None, :].conj(), present)
+
+        self._origin += n_new * self.step
+        for channel in range(self.n_channels):
+            self._trim(channel)
+
+    def _push(self, products: np.ndarray, present: np.ndarray):
+        # Segments that would be evicted within the same block are skipped
+        self.pushed += max(0, len(products) - self.max_segments)
+        for product in products[-self.max_segments:]:
+            if self.count == self.max_segments:
+                self._sum -= self._segments[self._head]
+            else:
+                self.count += 1
+            self._segments[self._head] = product
+            self._present[self._head] = present
+            self._sum += product
+            self._head = (self._head + 1) % self.max_segments
+            self.pushed += 1
+            # Recompute the sum once per window so rounding cannot accumulate
+            if self.pushed % self.max_segments == 0:
+                self._sum = self._segments[:self.count].sum(axis=0)
+
+    @property
+    def csd(self) -> Tuple[np.ndarray, np.ndarray]:
+        """``(freqs, G)`` over the window's segments (G is empty before the first)."""
+        if not self.count:
+            empty = np.zeros((0, self.n_channels, self.n_channels), dtype=np.complex128)
+            return self.freqs, empty
+        G = self._sum * (self._scale / self.count)
+        G[1:-1] *= 2  # one-sided
+        return self.freqs, G
+
+
+class StreamingProcessor(AnalysisProcessor):
+    """Stateful analysis of a bridge fed with sample blocks.
+
+    Feed blocks with :meth:`ingest` (its signature fits
+    ``AcquisitionScheduler(on_block=...)``) and call :meth:`update` for a
+    status.  Accelerometers sharing a sampling rate are analyzed together
+    by FDD on their sliding CSD matrix.  Strain gauges keep their windows
+    and running moments for SED and a rainflow counter each for ALSA
+    (:attr:`fatigue`), whose damage is cumulative rather than per window.
+
+    Args:
+        bridge: Monitored bridge; its sensors define the channels
+        window: Sliding window length (s)
+        nperseg: Welch segment length (default
+            :func:`~stalwart.analysis.structural.modal.default_nperseg`
+            of the window)
+    """
+
+    def __init__(
+        self,
+        bridge: Bridge,
+        window: float = WINDOW,
+        nperseg: Optional[int] = None,
+        frequency_method: Optional[str] = None,
+        baseline_store: Optional[BaselineStore] = None
+    ):
+        super().__init__(bridge, frequency_method, baseline_store=baseline_store)
+        if window <= 0:
+            raise ValueError("window must be positive")
+        self.window = window
+        self.nperseg = nperseg
+        self.windows: Dict[str, SlidingWindow] = {}
+        self.spectra: Dict[float, CrossSpectralAccumulator] = {}
+        self._spectral_channel: Dict[str, Tuple[float, int]] = {}
+        self.fatigue: Dict[str, RainflowCounter] = {
+            s.sensor_id: RainflowCounter()
+            for s in bridge.get_sensors_by_type('strain_gauge')
+        }
+        self.last_update: Optional[datetime] = None
+
+        accelerometers: Dict[float, List[Sensor]] = {}
+        for sensor in bridge.sensors:
+            fs = sensor.specs.sampling_rate
+            capacity = max(1, int(round(window * fs)))
+            self.windows[sensor.sensor_id] = SlidingWindow(capacity)
+            if sensor.specs.sensor_type == 'accelerometer':
+                accelerometers.setdefault(fs, []).append(sensor)
+
+        for fs, sensors in accelerometers.items():
+            capacity = int(round(window * fs))
+            segment = min(nperseg or default_nperseg(capacity, fs), capacity)
+            if segment < 64:
+                continue
+            step = segment // 2
+            self.spectra[fs] = CrossSpectralAccumulator(
+                len(sensors), fs, segment, 1 + (capacity - segment) // step
+            )
+            for i, sensor in enumerate(sensors):
+                self._spectral_channel[sensor.sensor_id] = (fs, i)
+
+    def ingest(self, sensor: Sensor, block: SampleBlock):
+        """Add a block read from one of the bridge's sensors."""
+        sliding = self.windows.get(sensor.sensor_id)
+        if sliding is None:
+            raise ValueError(
+                f"Sensor {sensor.sensor_id} is not on bridge "
+                f"{self.bridge.specs.bridge_id}"
+            )
+        values = np.asarray(block.values, dtype=np.float64)
+        sliding.extend(block.timestamps_ns, values)
+        if sensor.sensor_id in self._spectral_channel:
+            fs, channel = self._spectral_channel[sensor.sensor_id]
+            period = block.sample_period_ns
+            start = (block.start_time_ns + period // 2) // period
+            self.spectra[fs].extend(channel, values, start)
+        if sensor.sensor_id in self.fatigue:
+            self.fatigue[sensor.sensor_id].extend(strain_to_stress(values))
+
+    def process(self, blocks: Iterable[Tuple[Sensor, SampleBlock]]) -> BridgeStatus:
+        """Ingest ``blocks`` (e.g. from ``AcquisitionScheduler.poll``) and update."""
+        for sensor, block in blocks:
+            self.ingest(sensor, block)
+        return self.update()
+
+    def update(self) -> BridgeStatus:
+        """Status of the bridge over the current windows."""
+        metrics: Dict[str, MetricResult] = {}
+        metrics.update(self._spectral_metrics())
+
+        strain = [
+            self.windows[s.sensor_id]
+            for s in self.bridge.get_sensors_by_type('strain_gauge')
+            if len(self.windows[s.sensor_id])
+        ]
+        if strain:
+            counts = np.array([len(w) for w in strain])
+            mean = float(np.average([w.mean for w in strain], weights=counts))
+            local = max(w.maximum for w in strain)
+            metrics['ALSA'] = self._fatigue_alsa()
+            metrics['SED'] = calculate_sed(local_strain=local, global_strain=mean)
+
+        self.last_update = datetime.now()
+        data_time = None
+        if any(len(w) for w in self.windows.values()):
+            data_time = self._last_sample_ns()
+        return self._status(metrics, data_time)
+
+    def cumulative_damage(self, curve: Optional[SNCurve] = None) -> Dict[str, float]:
+        """
+        Miner damage per strain gauge since monitoring started.
+
+        Without ``curve`` the damage is exact for the counters' S-N curve;
+        with one it is evaluated from each gauge's fatigue ledger.
+        """
+        if curve is None:
+            return {
+                sensor_id: counter.total_damage
+                for sensor_id, counter in self.fatigue.items()
+            }
+        return {
+            sensor_id: counter.ledger_with_residual().damage(curve)
+            for sensor_id, counter in self.fatigue.items()
+        }
+
+    def _fatigue_alsa(self) -> MetricResult:
+        """ALSA of the gauge with the highest damage rate."""
+        sensor_id, counter = max(
+            self.fatigue.items(), key=lambda item: item[1].damage_rate() or 0.0
+        )
+        return calculate_alsa_from_damage(
+            counter.total_damage, counter.samples, details={
+                'sensor_id': sensor_id,
+                'cycles_counted': counter.cycles,
+                'residual_points': len(counter.residual)
+            }
+        )
+
+    def _identify_spectral(self) -> Optional[ModalResult]:
+        """FDD of the channels present over the largest full window."""
+        ready = [acc for acc in self.spectra.values() if acc.count == acc.max_segments]
+        if not ready:
+            return None
+        acc = max(ready, key=lambda a: (int(a.present.sum()), a.count))
+        present = acc.present
+        if not present.any():
+            return None
+        freqs, G = acc.csd
+        result = fdd_spectra(
+            freqs, G[:, present][:, :, present], acc.fs,
+            acc.count * acc.step + acc.nperseg - acc.step
+        )
+        # Shapes keep one entry per channel; missing channels are NaN
+        for mode in result.modes:
+            shape = np.full(acc.n_channels, np.nan, dtype=mode.shape.dtype)
+            shape[present] = mode.shape
+            mode.shape = shape
+        return result
+
+    def _spectral_metrics(self) -> Dict[str, MetricResult]:
+        """FFD and TVR of the tracked fundamental from the sliding spectra."""
+        modal = self._identify_spectral()
+        if modal is None or not modal.modes:
+            return {}
+        self.last_modal_result = modal
+        self.mode_tracker.update(modal)
+        track = self.mode_tracker.fundamental
+        if track is None or track.missed:
+            return {}
+
+        # EFDD needs segments several decay times long; until a damping
+        # is identified the design value stands in
+        damping = track.damping if np.isfinite(track.damping) else DEFAULT_DAMPING
+        if track.baseline_damping is None and np.isfinite(track.damping):
+            track.baseline_damping = damping
+        temperature = self._temperature()
+        baseline_frequency, baseline_damping = self._reference(
+            self._last_sample_ns(), temperature, track.frequency, track.damping,
+            track.baseline_frequency, track.baseline_damping or DEFAULT_DAMPING
+        )
+
+        ffd_result = calculate_ffd(
+            current_frequency=track.frequency,
+            baseline_frequency=baseline_frequency
+        )
+        ffd_result.details.update({
+            'method': 'fdd',
+            'frequency': track.frequency,
+            'baseline_frequency': baseline_frequency,
+            'mode_shape_mac': track.shape_mac,
+            'temperature': temperature,
+            'temperature_compensated': self.baseline.frozen
+        })
+        return {
+            'FFD': ffd_result,
+            'TVR': self._tvr(
+                track.frequency, baseline_frequency, damping, baseline_damping
+            )
+        }
+
+    def _temperature(self) -> Optional[float]:
+        """Mean temperature over the windows of the temperature sensors."""
+        windows = [
+            self.windows[s.sensor_id]
+            for s in self.bridge.get_sensors_by_type('temperature')
+            if len(self.windows[s.sensor_id])
+        ]
+        return float(np.mean([w.mean for w in windows])) if windows else None
+
+    def _last_sample_ns(self) -> int:
+        """Timestamp of the newest sample in any window."""
+        return max(
+            int(w.buffer.timestamps_ns[-1]) for w in self.windows.values() if len(w)
+        )
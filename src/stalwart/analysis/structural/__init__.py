@@ -0,0 +1,26 @@
+"""Structural analysis: operational modal identification, mode tracking,
+damping and fatigue."""
+
+from .damping import (
+    DampingEstimate, DecayEstimate, envelope_decay_time, random_decrement,
+    random_decrement_signature
+)
+from .fatigue import (
+    DEFAULT_SN_CURVE, FatigueLedger, RainflowCounter, SNCurve,
+    count_cycles, rainflow_cycles, strain_to_stress, turning_point_indices,
+    turning_points
+)
+from .modal import (
+    MODAL_METHODS, IdentifiedMode, ModalResult, ModeTrack, ModeTracker,
+    cross_spectral_matrix, fdd, fdd_spectra, identify_modes, mac, ssi_cov
+)
+
+__all__ = [
+    'DampingEstimate', 'DecayEstimate', 'envelope_decay_time', 'random_decrement',
+    'random_decrement_signature',
+    'DEFAULT_SN_CURVE', 'FatigueLedger', 'RainflowCounter', 'SNCurve',
+    'count_cycles', 'rainflow_cycles', 'strain_to_stress', 'turning_point_indices',
+    'turning_points',
+    'MODAL_METHODS', 'IdentifiedMode', 'ModalResult', 'ModeTrack', 'ModeTracker',
+    'cross_spectral_matrix', 'fdd', 'fdd_spectra', 'identify_modes', 'mac', 'ssi_cov'
+]
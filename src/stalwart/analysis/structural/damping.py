@@ -0,0 +1,282 @@
+"""Damping from ambient vibration by the random decrement technique.
+
+Averaging many response segments that start at the same trigger condition
+cancels the random part of the response and leaves the free decay of the
+structure (the random decrement signature).  The logarithmic decrement of
+the signature's extrema gives the damping ratio.
+
+All channels of a record are processed together: triggers are found with
+array comparisons, segments are gathered from a strided view of the record
+and summed per channel with one ``reduceat``, and the exponential fit is a
+masked least-squares fit over every channel at once.
+"""
+
+from dataclasses import dataclass
+from typing import Optional, Tuple
+
+import numpy as np
+from scipy import ndimage, signal
+
+from ..signal_processing.frequency import zero_crossing_frequency
+
+# Periods of the band centre covered by one signature
+SIGNATURE_PERIODS = 25
+
+# Trigger level as a multiple of the channel RMS (level up-crossing)
+TRIGGER_LEVEL = np.sqrt(2)
+
+# Longest signature without a band (s)
+MAX_SIGNATURE = 30.0
+
+# Free decays needed for full confidence in a decay time
+MIN_DECAY_EVENTS = 5
+
+# Segment samples gathered per chunk
+_GATHER_ELEMENTS = 2 ** 20
+
+
+@dataclass
+class DampingEstimate:
+    """Random decrement result, one entry per channel."""
+    damping: np.ndarray  # ratio of critical (NaN when no fit)
+    frequency: np.ndarray  # damped frequency of the signature (Hz)
+    decay_time: np.ndarray  # envelope time constant 1 / (zeta omega) (s)
+    triggers: np.ndarray  # segments averaged into each signature
+    signature: np.ndarray  # channels x segment samples
+
+
+def _bandpass(x: np.ndarray, fs: float, band: Tuple[float, float]) -> np.ndarray:
+    lo, hi = band
+    if not 0 < lo < hi < fs / 2:
+        raise ValueError(f"band must satisfy 0 < low < high < {fs / 2}, got {band}")
+    sos = signal.butter(4, (lo, hi), btype='bandpass', fs=fs, output='sos')
+    return signal.sosfiltfilt(sos, x, axis=-1)
+
+
+def random_decrement_signature(
+    values: np.ndarray,
+    segment_length: int,
+    level: float = TRIGGER_LEVEL
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Random decrement signatures of one or more channels.
+
+    Triggers are up-crossings of ``level`` times the channel RMS.
+
+    Args:
+        values: One channel (1-D) or channels x samples (2-D)
+        segment_length: Samples per signature
+        level: Trigger level in multiples of the RMS
+
+    Returns:
+        ``(signature, triggers)`` of shapes (channels, segment_length) and
+        (channels,)
+    """
+    x = np.atleast_2d(np.asarray(values, dtype=np.float64))
+    x = x - x.mean(axis=-1, keepdims=True)
+    n_channels, n = x.shape
+    if segment_length < 2 or segment_length > n:
+        raise ValueError(f"segment_length must be in [2, {n}], got {segment_length}")
+
+    threshold = level * np.sqrt(np.mean(x * x, axis=-1, keepdims=True))
+    usable = n - segment_length + 1
+    trigger = (x[:, :usable - 1] < threshold) & (x[:, 1:usable] >= threshold)
+    channel, start = np.nonzero(trigger)
+    start += 1
+
+    counts = np.bincount(channel, minlength=n_channels)
+    sums = np.zeros((n_channels, segment_length))
+    windows = np.lib.stride_tricks.sliding_window_view(x, segment_length, axis=-1)
+    # Gather in chunks so long records do not materialize every segment
+    step = max(1, _GATHER_ELEMENTS // segment_length)
+    for lo in range(0, len(start), step):
+        rows = channel[lo:lo + step]
+        segments = windows[rows, start[lo:lo + step]]
+        first = np.concatenate(([0], np.flatnonzero(np.diff(rows)) + 1))
+        sums[rows[first]] += np.add.reduceat(segments, first, axis=0)
+    with np.errstate(invalid='ignore'):
+        return sums / counts[:, None], counts
+
+
+def _log_linear_fit(
+    values: np.ndarray, used: np.ndarray, fs: float
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Least-squares slope of ``log(values)`` against time over ``used``, row by row.
+
+    Returns:
+        ``(slope, points)`` per row, slope in 1/s
+    """
+    t = np.arange(values.shape[-1]) / fs
+    w = used.astype(np.float64)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        y = np.where(used, np.log(values), 0.0)
+        sw = w.sum(-1)
+        st = (w * t).sum(-1)
+        stt = (w * t * t).sum(-1)
+        slope = (sw * (y * t).sum(-1) - st * y.sum(-1)) / (sw * stt - st * st)
+    return slope, sw
+
+
+def _decrement_fit(signature: np.ndarray, fs: float, floor: float = 0.3) -> np.ndarray:
+    """Envelope decay rate (1/s) from the extrema of each signature.
+
+    Uses every local maximum of ``|signature|`` until the first one below
+    ``floor`` of the largest (the tail is dominated by the residual of the
+    averaging).  The zero-lag value is left out: the up-crossing condition
+    mixes in the derivative of the correlation, so ``|s(0)|`` sits below
+    the envelope.  Fits ``log|s| = a - sigma t`` by least squares on all
+    channels at once.
+    """
+    magnitude = np.abs(signature)
+    reference = magnitude.max(axis=-1, keepdims=True)
+    extremum = np.zeros_like(magnitude, dtype=bool)
+    inner = magnitude[:, 1:-1]
+    extremum[:, 1:-1] = (inner > magnitude[:, :-2]) & (inner >= magnitude[:, 2:])
+    with np.errstate(invalid='ignore'):
+        small = extremum & (magnitude < floor * reference)
+    used = extremum & (np.cumsum(small, axis=-1) == 0)
+
+    slope, points = _log_linear_fit(magnitude, used, fs)
+    return np.where(points >= 3, -slope, np.nan)
+
+
+def random_decrement(
+    values: np.ndarray,
+    fs: float,
+    band: Optional[Tuple[float, float]] = None,
+    segment_duration: Optional[float] = None,
+    level: float = TRIGGER_LEVEL
+) -> DampingEstimate:
+    """
+    Damping ratio of the dominant mode in ``band`` by random decrement.
+
+    Args:
+        values: Accelerations, one channel (1-D) or channels x samples (2-D)
+        fs: Sampling rate (Hz)
+        band: Pass band (Hz) isolating one mode; zero-phase Butterworth.
+            Without a band the signature holds every mode and the fit
+            follows the slowest-decaying one.
+        segment_duration: Signature length (s); default
+            ``SIGNATURE_PERIODS`` periods of the band centre (or
+            ``MAX_SIGNATURE`` without a band), at most a quarter of the
+            record
+        level: Trigger level in multiples of the RMS
+
+    Returns:
+        DampingEstimate
+    """
+    x = np.atleast_2d(np.asarray(values, dtype=np.float64))
+    n = x.shape[-1]
+    if band is not None:
+        x = _bandpass(x, fs, band)
+
+    if segment_duration is None:
+        if band is None:
+            duration = MAX_SIGNATURE
+        else:
+            duration = SIGNATURE_PERIODS / np.sqrt(band[0] * band[1])
+        segment = min(n // 4, int(duration * fs))
+    else:
+        segment = int(round(segment_duration * fs))
+    if segment < 8:
+        nan = np.full(x.shape[0], np.nan)
+        return DampingEstimate(
+            nan, nan.copy(), nan.copy(), np.zeros(x.shape[0], dtype=np.int64),
+            np.empty((x.shape[0], 0))
+        )
+
+    signature, triggers = random_decrement_signature(x, segment, level)
+    sigma = _decrement_fit(signature, fs)
+    frequency = np.atleast_1d(
+        zero_crossing_frequency(np.nan_to_num(signature), fs, hysteresis=0.0)
+    )
+    omega = 2 * np.pi * frequency
+    with np.errstate(divide='ignore', invalid='ignore'):
+        damping = sigma / np.sqrt(sigma ** 2 + omega ** 2)
+        damping = np.where((damping > 0) & (triggers > 0), damping, np.nan)
+        decay_time = np.where(np.isfinite(damping), 1 / sigma, np.nan)
+    return DampingEstimate(damping, frequency, decay_time, triggers, signature)
+
+
+@dataclass
+class DecayEstimate:
+    """Free-decay time constant of one analysis window."""
+    decay_time: float  # median envelope time constant (s), NaN without events
+    confidence: float  # 0-1, from the number of events and their spread
+    events: int  # free decays fitted
+    decay_times: np.ndarray  # per event (s)
+
+
+def envelope_decay_time(
+    values: np.ndarray,
+    fs: float,
+    band: Optional[Tuple[float, float]] = None,
+    max_decay: float = 30.0,
+    event_factor: float = 5.0,
+    floor_factor: float = 1.5,
+    rise_factor: float = 1.25
+) -> DecayEstimate:
+    """
+    Decay time of free vibration after traffic events.
+
+    The envelope is the magnitude of the analytic signal (Hilbert
+    transform) of every channel.  Events are envelope maxima above
+    ``event_factor`` times the channel's median envelope that are the
+    largest within ``max_decay`` seconds.  Each event's envelope is
+    followed until it reaches ``floor_factor`` times the median (back to
+    ambient) or rises again by ``rise_factor`` over its running minimum
+    (the next vehicle), and ``log(envelope)`` is fitted by least squares on
+    all events at once.
+
+    Args:
+        values: Accelerations, one channel (1-D) or channels x samples (2-D)
+        fs: Sampling rate of the channels (Hz)
+        band: Pass band (Hz) isolating one mode (recommended; several modes
+            make the envelope beat)
+        max_decay: Longest decay followed (s), also the event separation
+
+    Returns:
+        DecayEstimate
+    """
+    x = np.atleast_2d(np.asarray(values, dtype=np.float64))
+    x = x - x.mean(axis=-1, keepdims=True)
+    if band is not None:
+        x = _bandpass(x, fs, band)
+    n = x.shape[-1]
+    length = min(n, int(max_decay * fs))
+    if length < 8:
+        return DecayEstimate(np.nan, 0.0, 0, np.empty(0))
+
+    envelope = np.abs(signal.hilbert(x, axis=-1))
+    ambient = np.median(envelope, axis=-1, keepdims=True)
+    local_max = envelope == ndimage.maximum_filter1d(envelope, length, axis=-1)
+    is_peak = local_max & (envelope > event_factor * ambient)
+    channel, start = np.nonzero(is_peak)
+    if not len(start):
+        return DecayEstimate(np.nan, 0.0, 0, np.empty(0))
+
+    padded = np.pad(envelope, ((0, 0), (0, length - 1)), constant_values=np.nan)
+    segments = np.lib.stride_tricks.sliding_window_view(padded, length, axis=-1)
+    segments = segments[channel, start]
+    floor = np.maximum(floor_factor * ambient[channel], 0.1 * segments[:, :1])
+    with np.errstate(invalid='ignore'):
+        running_min = np.fmin.accumulate(segments, axis=-1)
+        ok = (segments > floor) & (segments <= rise_factor * running_min)
+    used = np.cumprod(ok, axis=-1).astype(bool)
+
+    slope, points = _log_linear_fit(segments, used, fs)
+    # A fit needs at least half a second of decay
+    valid = (points >= 0.5 * fs) & (slope < 0)
+    decay_times = -1.0 / slope[valid]
+    if not len(decay_times):
+        return DecayEstimate(np.nan, 0.0, 0, decay_times)
+
+    # The same vehicle shows on every channel of a coherent array, so
+    # events are counted once per second for the confidence
+    distinct = len(np.unique(start[valid] // max(1, int(fs))))
+    median = float(np.median(decay_times))
+    spread = 1.4826 * np.median(np.abs(decay_times - median)) / median
+    confidence = float(
+        np.clip(1 - spread, 0, 1) * min(1.0, distinct / MIN_DECAY_EVENTS)
+    )
+    return DecayEstimate(median, confidence, len(decay_times), decay_times)
@@ -0,0 +1,392 @@
+"""Fatigue damage from strain histories by rainflow counting.
+
+:class:`RainflowCounter` counts cycles incrementally with the four-point
+rule: turning points are pushed on a stack and a cycle is closed whenever
+the inner range of the top four points is no larger than both outer
+ranges.  The points that have not closed a cycle (the residual) stay on
+the stack between calls, so a cycle spanning any number of blocks is
+counted exactly once and each block costs O(its samples) however long the
+gauge has been monitored.  Closed cycles are accumulated into a stress
+range x mean :class:`FatigueLedger` and into Miner's damage sum.
+
+A :class:`FatigueLedger` is the whole cycle history of a gauge in a small
+fixed-bin array: ledgers of consecutive periods merge by addition, and the
+damage for any :class:`SNCurve` (e.g. another EN 1993-1-9 detail
+category) is one dot product, without revisiting the strain records.
+
+:func:`rainflow_cycles` counts a complete record by ASTM E1049 (three-point
+rule, residual as half cycles), with the same results as the ``rainflow``
+package.  Turning points are found with array operations, so the Python
+loop only visits those.
+"""
+
+import os
+from dataclasses import dataclass
+from pathlib import Path
+from typing import List, Optional, Tuple, Union
+
+import numpy as np
+from numpy.typing import ArrayLike
+
+# Steel, for microstrain -> MPa
+ELASTIC_MODULUS = 200e9  # Pa
+
+# S-N curve N = C / S^m, S in MPa (detail category 100 with m = 3)
+SN_CONSTANT = 2e12
+SN_EXPONENT = 3.0
+
+# Ledger bins (MPa): ranges from 0, means centred on 0; the outer bins
+# also hold anything beyond them
+RANGE_BIN_WIDTH = 1.0
+RANGE_BINS = 256
+MEAN_BIN_WIDTH = 10.0
+MEAN_BINS = 32
+
+
+def strain_to_stress(strain: ArrayLike) -> np.ndarray:
+    """Stress (MPa) of microstrain readings."""
+    return np.asarray(strain, dtype=np.float64) * 1e-6 * ELASTIC_MODULUS / 1e6
+
+
+def turning_point_indices(values: ArrayLike) -> np.ndarray:
+    """
+    Indices of the turning points of a series, both ends included.
+
+    Repeated values count once (a plateau is represented by its first
+    sample), and a point is a turning point where the direction reverses.
+    """
+    x = np.asarray(values, dtype=np.float64)
+    if not len(x):
+        return np.empty(0, dtype=np.intp)
+    kept = np.concatenate(([0], np.flatnonzero(np.diff(x)) + 1))
+    if len(kept) < 3:
+        return kept
+    dy = np.diff(x[kept])
+    reversal = np.flatnonzero(dy[:-1] * dy[1:] < 0) + 1
+    return kept[np.concatenate(([0], reversal, [len(kept) - 1]))]
+
+
+def turning_points(values: ArrayLike) -> np.ndarray:
+    """Turning points of a series (see :func:`turning_point_indices`)."""
+    x = np.asarray(values, dtype=np.float64)
+    return x[turning_point_indices(x)]
+
+
+def rainflow_cycles(values: ArrayLike) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Rainflow cycles of a complete record (ASTM E1049).
+
+    Args:
+        values: Load history (e.g. stress in MPa)
+
+    Returns:
+        ``(ranges, means, counts)`` per cycle in closing order; ``counts``
+        is 1.0 for full cycles and 0.5 for half cycles
+    """
+    ranges: List[float] = []
+    means: List[float] = []
+    counts: List[float] = []
+    stack: List[float] = []
+    for point in turning_points(values).tolist():
+        stack.append(point)
+        while len(stack) >= 3:
+            c, b, a = stack[-1], stack[-2], stack[-3]
+            y_range = b - a if b > a else a - b
+            if (c - b if c > b else b - c) < y_range:
+                break
+            ranges.append(y_range)
+            means.append(0.5 * (a + b))
+            if len(stack) == 3:
+                # Y contains the starting point: half cycle
+                counts.append(0.5)
+                del stack[0]
+            else:
+                counts.append(1.0)
+                del stack[-3:-1]
+
+    residual = np.array(stack)
+    return (
+        np.concatenate((ranges, np.abs(np.diff(residual)))),
+        np.concatenate((means, 0.5 * (residual[1:] + residual[:-1]))),
+        np.concatenate((counts, np.full(max(0, len(residual) - 1), 0.5)))
+    )
+
+
+def count_cycles(values: ArrayLike) -> List[Tuple[float, float]]:
+    """``(range, count)`` pairs by ascending range, as ``rainflow.count_cycles``."""
+    ranges, _, counts = rainflow_cycles(values)
+    unique, inverse = np.unique(ranges, return_inverse=True)
+    return list(zip(unique.tolist(), np.bincount(inverse, weights=counts).tolist()))
+
+
+@dataclass(frozen=True)
+class SNCurve:
+    """S-N curve ``N = reference_cycles * (reference_range / S)^exponent``.
+
+    Below the knee the slope changes to ``second_exponent``; ranges whose
+    life exceeds ``cutoff_cycles`` do no damage.  The defaults are a single
+    slope without cut-off.
+    """
+    reference_range: float  # MPa at reference_cycles (the detail category)
+    exponent: float = 3.0
+    reference_cycles: float = 2e6
+    knee_cycles: float = np.inf
+    second_exponent: float = 5.0
+    cutoff_cycles: float = np.inf
+
+    @classmethod
+    def eurocode(cls, detail_category: float) -> 'SNCurve':
+        """EN 1993-1-9 curve of a detail category.
+
+        m = 3, then 5 from 5e6 cycles, with the cut-off at 1e8.
+        """
+        return cls(detail_category, 3.0, 2e6, 5e6, 5.0, 1e8)
+
+    def cycles_to_failure(self, ranges: ArrayLike) -> np.ndarray:
+        """Cycles to failure of stress ranges (MPa); ``inf`` where no damage."""
+        S = np.asarray(ranges, dtype=np.float64)
+        ratio = self.reference_cycles / self.knee_cycles
+        knee_range = self.reference_range * ratio ** (1 / self.exponent)
+        # Without a knee the second branch is inf * 0, never selected
+        with np.errstate(divide='ignore', invalid='ignore'):
+            N = np.where(
+                S >= knee_range,
+                self.reference_cycles * (self.reference_range / S) ** self.exponent,
+                self.knee_cycles * (knee_range / S) ** self.second_exponent
+            )
+        return np.where(N > self.cutoff_cycles, np.inf, N)
+
+    def damage(self, ranges: ArrayLike, counts: ArrayLike = 1.0) -> float:
+        """Miner damage of ``counts`` cycles of each range."""
+        return float(np.sum(np.asarray(counts) / self.cycles_to_failure(ranges)))
+
+
+# The S-N curve calculate_alsa uses
+DEFAULT_SN_CURVE = SNCurve(100.0, SN_EXPONENT)
+
+
+class FatigueLedger:
+    """Cycle counts of one gauge binned by stress range and mean.
+
+    ``counts`` is a ``(range_bins, mean_bins)`` float array (half cycles
+    count 0.5).  Cycles beyond the outer bins go into them, and damage is
+    evaluated at the range bin centres, so ``range_bin_width`` bounds the
+    error per cycle.
+
+    Args:
+        range_bin_width: Stress range bin width (MPa)
+        range_bins: Range bins from 0
+        mean_bin_width: Mean stress bin width (MPa)
+        mean_bins: Mean bins, centred on 0
+    """
+
+    def __init__(
+        self,
+        range_bin_width: float = RANGE_BIN_WIDTH,
+        range_bins: int = RANGE_BINS,
+        mean_bin_width: float = MEAN_BIN_WIDTH,
+        mean_bins: int = MEAN_BINS
+    ):
+        if min(range_bin_width, range_bins, mean_bin_width, mean_bins) <= 0:
+            raise ValueError("bin widths and counts must be positive")
+        self.range_bin_width = float(range_bin_width)
+        self.mean_bin_width = float(mean_bin_width)
+        self.counts = np.zeros((range_bins, mean_bins))
+
+    @property
+    def bins(self) -> Tuple[float, int, float, int]:
+        """``(range_bin_width, range_bins, mean_bin_width, mean_bins)``."""
+        n_range, n_mean = self.counts.shape
+        return self.range_bin_width, n_range, self.mean_bin_width, n_mean
+
+    @property
+    def range_edges(self) -> np.ndarray:
+        return np.arange(self.counts.shape[0] + 1) * self.range_bin_width
+
+    @property
+    def mean_edges(self) -> np.ndarray:
+        n = self.counts.shape[1]
+        return (np.arange(n + 1) - n / 2) * self.mean_bin_width
+
+    @property
+    def range_centres(self) -> np.ndarray:
+        return (np.arange(self.counts.shape[0]) + 0.5) * self.range_bin_width
+
+    @property
+    def cycles(self) -> float:
+        return float(self.counts.sum())
+
+    def add(self, ranges: ArrayLike, means: ArrayLike, counts: ArrayLike = 1.0):
+        """Add cycles in place."""
+        ranges, means, counts = np.broadcast_arrays(
+            np.asarray(ranges, dtype=np.float64), np.asarray(means, dtype=np.float64),
+            np.asarray(counts, dtype=np.float64)
+        )
+        if not ranges.size:
+            return
+        n_range, n_mean = self.counts.shape
+        i = np.floor(ranges / self.range_bin_width)
+        j = np.floor(means / self.mean_bin_width + n_mean / 2)
+        i = np.clip(i, 0, n_range - 1).astype(np.intp)
+        j = np.clip(j, 0, n_mean - 1).astype(np.intp)
+        binned = np.bincount(
+            (i * n_mean + j).ravel(), weights=counts.ravel(), minlength=self.counts.size
+        )
+        self.counts += binned.reshape(self.counts.shape)
+
+    def range_histogram(self) -> np.ndarray:
+        """Cycles per range bin, over all means."""
+        return self.counts.sum(axis=1)
+
+    def damage(self, curve: SNCurve = DEFAULT_SN_CURVE) -> float:
+        """Miner damage of every cycle in the ledger for ``curve``."""
+        return curve.damage(self.range_centres, self.range_histogram())
+
+    def copy(self) -> 'FatigueLedger':
+        ledger = FatigueLedger(*self.bins)
+        ledger.counts[:] = self.counts
+        return ledger
+
+    def _check(self, other: 'FatigueLedger'):
+        if self.bins != other.bins:
+            raise ValueError(f"Ledger bins differ: {self.bins} and {other.bins}")
+
+    def __iadd__(self, other: 'FatigueLedger') -> 'FatigueLedger':
+        self._check(other)
+        self.counts += other.counts
+        return self
+
+    def __add__(self, other: 'FatigueLedger') -> 'FatigueLedger':
+        ledger = self.copy()
+        ledger += other
+        return ledger
+
+    def save(self, path: Union[str, Path]):
+        """Write the ledger atomically as ``.npy``, the bin widths in front."""
+        path = Path(path)
+        tmp = path.with_suffix('.tmp')
+        header = np.array([self.range_bin_width, self.mean_bin_width])
+        with open(tmp, 'wb') as f:
+            data = np.concatenate((header, self.counts.shape, self.counts.ravel()))
+            np.save(f, data, allow_pickle=False)
+        os.replace(tmp, path)
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> 'FatigueLedger':
+        data = np.load(path, allow_pickle=False)
+        range_bin_width, mean_bin_width, range_bins, mean_bins = data[:4]
+        ledger = cls(range_bin_width, int(range_bins), mean_bin_width, int(mean_bins))
+        ledger.counts[:] = data[4:].reshape(ledger.counts.shape)
+        return ledger
+
+
+class RainflowCounter:
+    """Streaming four-point rainflow count of one gauge's stress history.
+
+    The newest point on the stack is provisional: it is replaced when the
+    next block continues in the same direction.  Cycles closed against it
+    stay valid, since extending it only widens the outer range.
+
+    Args:
+        curve: S-N curve of the exact running damage
+        ledger: Ledger receiving the closed cycles (default bins if None)
+    """
+
+    def __init__(
+        self,
+        curve: SNCurve = DEFAULT_SN_CURVE,
+        ledger: Optional[FatigueLedger] = None
+    ):
+        self.curve = curve
+        self.ledger = FatigueLedger() if ledger is None else ledger
+        self.damage = 0.0
+        self.cycles = 0
+        self.samples = 0
+        self._stack: list = []
+
+    def extend(self, stress: ArrayLike) -> float:
+        """
+        Count the cycles closed by new stress samples (MPa).
+
+        Non-finite samples are skipped.
+
+        Returns:
+            Damage added by this block
+        """
+        x = np.asarray(stress, dtype=np.float64).ravel()
+        x = x[np.isfinite(x)]
+        if not len(x):
+            return 0.0
+        self.samples += len(x)
+
+        stack = self._stack
+        head = stack[-2:]
+        combined = np.concatenate((head, x))
+        index = turning_point_indices(combined)
+        if len(head) == 2:
+            # head[0] is a confirmed turning point; head[1] only if it still is
+            if index[1] == 1:
+                index = index[2:]
+            else:
+                stack.pop()
+                index = index[1:]
+        elif head:
+            index = index[1:]
+
+        ranges, means = [], []
+        for point in combined[index].tolist():
+            stack.append(point)
+            while len(stack) >= 4:
+                inner = abs(stack[-2] - stack[-3])
+                outer = min(abs(stack[-3] - stack[-4]), abs(stack[-1] - stack[-2]))
+                if inner <= outer:
+                    ranges.append(inner)
+                    means.append(0.5 * (stack[-2] + stack[-3]))
+                    del stack[-3:-1]
+                else:
+                    break
+        if not ranges:
+            return 0.0
+        self.ledger.add(ranges, means)
+        damage = self.curve.damage(ranges)
+        self.damage += damage
+        self.cycles += len(ranges)
+        return damage
+
+    @property
+    def residual(self) -> np.ndarray:
+        """Turning points that have not closed a cycle yet, oldest first."""
+        return np.array(self._stack)
+
+    @property
+    def residual_damage(self) -> float:
+        """Damage of the residual counted as half cycles (ASTM E1049)."""
+        return self.curve.damage(np.abs(np.diff(self.residual)), 0.5)
+
+    @property
+    def total_damage(self) -> float:
+        """Closed cycles plus the residual half cycles."""
+        return self.damage + self.residual_damage
+
+    @property
+    def histogram(self) -> np.ndarray:
+        """Closed cycles per stress range bin (edges ``ledger.range_edges``)."""
+        return self.ledger.range_histogram()
+
+    def ledger_with_residual(self) -> FatigueLedger:
+        """A copy of the ledger with the residual added as half cycles."""
+        ledger = self.ledger.copy()
+        residual = self.residual
+        ledger.add(np.abs(np.diff(residual)), 0.5 * (residual[1:] + residual[:-1]), 0.5)
+        return ledger
+
+    def damage_rate(self) -> Optional[float]:
+        """Total damage per sample, or None before the first sample."""
+        return self.total_damage / self.samples if self.samples else None
+
+    def reset(self):
+        self.ledger.counts[:] = 0
+        self.damage = 0.0
+        self.cycles = 0
+        self.samples = 0
+        self._stack = []
@@ -0,0 +1,565 @@
+"""Operational modal analysis of ambient bridge vibration.
+
+Two output-only identification methods work on a multichannel
+accelerometer record (channels x samples):
+
+* :func:`fdd` - frequency-domain decomposition.  Welch cross-spectral
+  matrices for all frequency lines are built in one batched product and
+  decomposed with one batched SVD.  Peaks of the first singular value give
+  the modes; damping comes from the enhanced FDD (EFDD) decay of the
+  single-degree-of-freedom bell around each peak.
+* :func:`ssi_cov` - covariance-driven stochastic subspace identification.
+  Output correlations fill a block Toeplitz matrix whose SVD gives the
+  observability matrix; poles are computed for a range of model orders and
+  only those that stay put across orders (a stabilization diagram) are
+  kept.
+
+:class:`ModeTracker` follows identified modes from window to window by
+frequency proximity and mode-shape correlation (MAC), and keeps a baseline
+for each tracked mode so frequency drift and damping change can be
+reported against it.
+"""
+
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Callable, Deque, Dict, List, Optional, Tuple
+
+import numpy as np
+from scipy import signal
+from scipy.optimize import linear_sum_assignment
+
+# Observations kept per mode track: an hour of 10 s windows
+TRACK_HISTORY = 360
+
+# Physically meaningful damping ratios for a bridge mode
+MAX_DAMPING = 0.2
+
+# Relative frequency / relative damping / MAC limits for a stable pole
+STABLE_FREQUENCY = 0.01
+STABLE_DAMPING = 0.2
+STABLE_MAC = 0.95
+
+
+@dataclass
+class IdentifiedMode:
+    """One mode identified from ambient vibration."""
+    frequency: float  # Hz
+    damping: float  # ratio of critical
+    shape: np.ndarray  # complex, one entry per channel, unit max modulus
+    confidence: float = 1.0  # 0-1
+
+    @property
+    def decay_time(self) -> float:
+        """Time constant of the free-decay envelope, 1 / (zeta * omega)."""
+        return 1.0 / (2 * np.pi * self.frequency * max(self.damping, 1e-6))
+
+
+@dataclass
+class ModalResult:
+    """Modes identified from one record, sorted by frequency."""
+    modes: List[IdentifiedMode]
+    method: str
+    sampling_rate: float
+    n_samples: int
+
+    @property
+    def frequencies(self) -> np.ndarray:
+        return np.array([m.frequency for m in self.modes])
+
+    @property
+    def dampings(self) -> np.ndarray:
+        return np.array([m.damping for m in self.modes])
+
+    @property
+    def fundamental(self) -> Optional[IdentifiedMode]:
+        return self.modes[0] if self.modes else None
+
+
+def mac(a: np.ndarray, b: np.ndarray) -> float:
+    """Modal assurance criterion between two (complex) mode shapes.
+
+    Entries missing (NaN) in either shape are left out.
+    """
+    a, b = np.asarray(a), np.asarray(b)
+    both = np.isfinite(a) & np.isfinite(b)
+    if not both.all():
+        a, b = a[both], b[both]
+    denominator = np.vdot(a, a).real * np.vdot(b, b).real
+    return float(abs(np.vdot(a, b)) ** 2 / denominator) if denominator > 0 else 0.0
+
+
+def _normalize_shape(shape: np.ndarray) -> np.ndarray:
+    """Rotate a complex shape to its dominant phase and scale to unit max."""
+    k = np.argmax(np.abs(shape))
+    if shape[k] == 0:
+        return shape
+    return shape / shape[k]
+
+
+def _as_record(data: np.ndarray) -> np.ndarray:
+    y = np.asarray(data, dtype=np.float64)
+    if y.ndim == 1:
+        y = y[None, :]
+    if y.ndim != 2:
+        raise ValueError("data must be 1-D (one channel) or 2-D (channels x samples)")
+    return y - y.mean(axis=1, keepdims=True)
+
+
+def default_nperseg(n_samples: int, fs: float) -> int:
+    """Welch segment length: about 100 s, with at least four segments."""
+    target = 2 ** int(np.ceil(np.log2(100 * fs)))
+    return int(max(16, min(target, 2 ** int(np.log2(max(n_samples // 4, 16))))))
+
+
+def cross_spectral_matrix(
+    data: np.ndarray,
+    fs: float,
+    nperseg: Optional[int] = None,
+    overlap: float = 0.5
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Welch estimate of the cross-spectral density matrix.
+
+    All segments of all channels are transformed in one rFFT and averaged
+    with one batched matrix product.
+
+    Returns:
+        ``(freqs, G)`` with ``G`` of shape (frequencies, channels, channels)
+    """
+    y = _as_record(data)
+    n = y.shape[1]
+    nperseg = min(nperseg or default_nperseg(n, fs), n)
+    step = max(1, int(nperseg * (1 - overlap)))
+    n_segments = 1 + (n - nperseg) // step
+
+    window = np.hanning(nperseg)
+    segments = np.lib.stride_tricks.sliding_window_view(y, nperseg, axis=1)
+    segments = segments[:, ::step][:, :n_segments]
+    spectra = np.fft.rfft(segments * window, axis=-1)  # channels, segments, freqs
+    spectra = spectra.transpose(2, 0, 1)  # freqs, channels, segments
+
+    scale = 1.0 / (fs * np.sum(window ** 2) * n_segments)
+    G = spectra @ spectra.conj().transpose(0, 2, 1) * scale
+    G[1:-1] *= 2  # one-sided
+    return np.fft.rfftfreq(nperseg, 1 / fs), G
+
+
+def _window_correlation(n: int) -> np.ndarray:
+    """Normalized autocorrelation of the length-``n`` Hann window."""
+    spectrum = np.fft.rfft(np.hanning(n), 2 * n)
+    correlation = np.fft.irfft(np.abs(spectrum) ** 2)[:n]
+    return np.maximum(correlation / correlation[0], 1e-3)
+
+
+def _efdd_damping(
+    freqs: np.ndarray,
+    s1: np.ndarray,
+    shapes: np.ndarray,
+    peak: int,
+    min_mac: float,
+    min_level: float = 0.01
+) -> Tuple[float, float]:
+    """Frequency and damping from the SDOF bell around a spectral peak.
+
+    The bell holds the lines whose first singular vector keeps a MAC above
+    ``min_mac`` with the peak and whose level stays above ``min_level`` of
+    it.  Its inverse FFT is the SDOF correlation function; after dividing
+    out the Hann window's own correlation, its extrema decay as
+    ``exp(-zeta omega t)``.
+    """
+    reference = shapes[peak]
+    floor = min_level * s1[peak]
+    lo = peak
+    while lo > 1 and s1[lo - 1] > floor and mac(shapes[lo - 1], reference) > min_mac:
+        lo -= 1
+    hi = peak
+    while (hi < len(s1) - 2 and s1[hi + 1] > floor
+           and mac(shapes[hi + 1], reference) > min_mac):
+        hi += 1
+
+    bell = np.zeros_like(s1)
+    bell[lo:hi + 1] = s1[lo:hi + 1]
+    correlation = np.fft.irfft(bell)
+    nperseg = len(correlation)
+    fs = 2 * freqs[-1]
+
+    half = nperseg // 2
+    window = _window_correlation(nperseg)[:half]
+    magnitude = np.abs(correlation[:half]) / window
+    extrema = signal.argrelmax(magnitude)[0]
+    if len(extrema) < 3:
+        return np.nan, np.nan
+    amplitudes = magnitude[extrema] / magnitude[0]
+    # Fit the decay from 90 % down to the first extremum under 10 %
+    below = np.flatnonzero(amplitudes < 0.1)
+    end = below[0] if len(below) else len(extrema)
+    used = extrema[:end][amplitudes[:end] < 0.9]
+    # Beyond half the window correlation the segment, not the mode, sets the decay
+    if len(used) < 3 or window[used[-1]] < 0.5:
+        return np.nan, np.nan
+
+    times = used / fs
+    slope = np.polyfit(times, np.log(magnitude[used]), 1)[0]
+    # Extrema every half period
+    frequency = (len(used) - 1) / (2 * (times[-1] - times[0]))
+    return frequency, -slope / (2 * np.pi * frequency)
+
+
+def fdd(
+    data: np.ndarray,
+    fs: float,
+    n_modes: int = 3,
+    fmin: float = 0.1,
+    fmax: Optional[float] = None,
+    nperseg: Optional[int] = None,
+    min_mac: float = 0.8
+) -> ModalResult:
+    """
+    Frequency-domain decomposition (with EFDD damping).
+
+    Damping needs segments several decay times long, i.e. records of ten
+    minutes or more for the slowest bridge modes; shorter records give
+    frequencies and shapes with NaN damping.
+
+    Args:
+        data: Accelerations, channels x samples (or one channel)
+        fs: Sampling rate (Hz)
+        n_modes: Number of peaks to keep (most prominent first)
+        fmin, fmax: Search band (Hz)
+        nperseg: Welch segment length (default :func:`default_nperseg`)
+        min_mac: Shape correlation that bounds the SDOF bell
+
+    Returns:
+        ModalResult
+    """
+    y = _as_record(data)
+    if y.shape[1] < 64:
+        return ModalResult([], 'fdd', fs, y.shape[1])
+    freqs, G = cross_spectral_matrix(y, fs, nperseg)
+    return fdd_spectra(freqs, G, fs, y.shape[1], n_modes, fmin, fmax, min_mac)
+
+
+def fdd_spectra(
+    freqs: np.ndarray,
+    G: np.ndarray,
+    fs: float,
+    n_samples: int = 0,
+    n_modes: int = 3,
+    fmin: float = 0.1,
+    fmax: Optional[float] = None,
+    min_mac: float = 0.8
+) -> ModalResult:
+    """
+    Frequency-domain decomposition of a precomputed CSD matrix.
+
+    Lets callers that accumulate spectra incrementally (see
+    :class:`~stalwart.analysis.streaming.CrossSpectralAccumulator`) skip
+    the raw record; arguments as for :func:`fdd`.
+    """
+    U, S, _ = np.linalg.svd(G, hermitian=True)
+    s1 = S[:, 0]
+    shapes = U[:, :, 0]
+
+    band = (freqs >= fmin) & (freqs <= (fmax or fs / 2))
+    log_s1 = np.log(np.maximum(s1, np.finfo(float).tiny))
+    peaks, properties = signal.find_peaks(
+        np.where(band, log_s1, log_s1[band].min()), prominence=1.0
+    )
+    order = np.argsort(properties['prominences'])[::-1][:n_modes]
+    bin_hz = freqs[1] - freqs[0]
+
+    modes = []
+    for peak, prominence in zip(peaks[order], properties['prominences'][order]):
+        alpha, beta, gamma = log_s1[peak - 1:peak + 2]
+        denominator = alpha - 2 * beta + gamma
+        delta = 0.5 * (alpha - gamma) / denominator if denominator < 0 else 0.0
+        frequency = (peak + np.clip(delta, -0.5, 0.5)) * bin_hz
+
+        efdd_frequency, damping = _efdd_damping(freqs, s1, shapes, peak, min_mac)
+        if np.isfinite(efdd_frequency) and abs(efdd_frequency - frequency) < bin_hz:
+            frequency = efdd_frequency
+        modes.append(IdentifiedMode(
+            frequency=float(frequency),
+            damping=float(damping),
+            shape=_normalize_shape(shapes[peak]),
+            confidence=float(min(1.0, prominence / 5.0))
+        ))
+
+    modes.sort(key=lambda m: m.frequency)
+    return ModalResult(modes, 'fdd', fs, n_samples)
+
+
+def _output_correlations(y: np.ndarray, max_lag: int) -> np.ndarray:
+    """Unbiased output correlation matrices R_0 .. R_max_lag."""
+    n = y.shape[1]
+    return np.stack([y[:, k:] @ y[:, :n - k].T / (n - k) for k in range(max_lag + 1)])
+
+
+def _poles(A: np.ndarray, C: np.ndarray, fs: float):
+    """Frequencies, damping ratios and shapes of a discrete state-space model."""
+    eigenvalues, eigenvectors = np.linalg.eig(A)
+    keep = eigenvalues.imag > 0  # one of each conjugate pair
+    eigenvalues, eigenvectors = eigenvalues[keep], eigenvectors[:, keep]
+    mu = np.log(eigenvalues) * fs
+    frequency = np.abs(mu) / (2 * np.pi)
+    damping = -mu.real / np.abs(mu)
+    return frequency, damping, (C @ eigenvectors).T
+
+
+def ssi_cov(
+    data: np.ndarray,
+    fs: float,
+    block_rows: int = 30,
+    max_order: int = 40,
+    fmin: float = 0.1,
+    fmax: Optional[float] = 10.0,
+    min_stable: float = 0.3
+) -> ModalResult:
+    """
+    Covariance-driven stochastic subspace identification.
+
+    The record is first decimated so ``fmax`` sits near a fifth of the new
+    sampling rate, which keeps the Toeplitz matrix small and its lags long
+    enough for slow bridge modes.
+
+    Args:
+        data: Accelerations, channels x samples (or one channel)
+        fs: Sampling rate (Hz)
+        block_rows: Block rows of the Toeplitz matrix (``i``)
+        max_order: Largest model order in the stabilization diagram
+        fmin, fmax: Band of interest (Hz)
+        min_stable: Fraction of model orders in which a mode must be
+            stable to be reported
+
+    Returns:
+        ModalResult
+    """
+    y = _as_record(data)
+    n_channels = y.shape[0]
+
+    q = int(fs / (5 * fmax)) if fmax else 1
+    if q > 1:
+        y = signal.decimate(y, q, ftype='fir', axis=1, zero_phase=True)
+        fs = fs / q
+
+    block_rows = max(block_rows, int(np.ceil(max_order / n_channels)) + 1)
+    if y.shape[1] < 4 * block_rows:
+        return ModalResult([], 'ssi_cov', fs * q, y.shape[1] * q)
+
+    R = _output_correlations(y, 2 * block_rows)
+    # T[a, b] = R[i + a - b]: future rows against past columns
+    T = np.block([
+        [R[block_rows + a - b] for b in range(block_rows)]
+        for a in range(block_rows)
+    ])
+    U, S, _ = np.linalg.svd(T)
+
+    orders = range(2, min(max_order, len(S)) + 1, 2)
+    stable: List[Tuple[float, float, np.ndarray]] = []
+    previous = None
+    for order in orders:
+        obs = U[:, :order] * np.sqrt(S[:order])
+        A = np.linalg.pinv(obs[:-n_channels]) @ obs[n_channels:]
+        frequency, damping, shapes = _poles(A, obs[:n_channels], fs)
+        valid = (
+            (frequency >= fmin) & (frequency <= (fmax or fs / 2))
+            & (damping > 0) & (damping < MAX_DAMPING)
+        )
+        current = list(zip(frequency[valid], damping[valid], shapes[valid]))
+        if previous:
+            for f, d, shape in current:
+                for pf, pd, pshape in previous:
+                    if (abs(f - pf) < STABLE_FREQUENCY * pf
+                            and abs(d - pd) < STABLE_DAMPING * pd
+                            and mac(shape, pshape) > STABLE_MAC):
+                        stable.append((f, d, shape))
+                        break
+        previous = current
+
+    modes = []
+    if stable:
+        stable.sort(key=lambda p: p[0])
+        clusters: List[List[Tuple[float, float, np.ndarray]]] = [[stable[0]]]
+        for pole in stable[1:]:
+            if pole[0] - clusters[-1][-1][0] < STABLE_FREQUENCY * pole[0]:
+                clusters[-1].append(pole)
+            else:
+                clusters.append([pole])
+
+        needed = max(2, min_stable * len(orders))
+        for cluster in clusters:
+            if len(cluster) < needed:
+                continue
+            frequencies = np.array([p[0] for p in cluster])
+            dampings = np.array([p[1] for p in cluster])
+            modes.append(IdentifiedMode(
+                frequency=float(np.median(frequencies)),
+                damping=float(np.median(dampings)),
+                shape=_normalize_shape(cluster[-1][2]),
+                confidence=float(min(1.0, len(cluster) / len(orders)))
+            ))
+
+    return ModalResult(modes, 'ssi_cov', fs * q, y.shape[1] * q)
+
+
+MODAL_METHODS: Dict[str, Callable[..., ModalResult]] = {
+    'fdd': fdd,
+    'ssi_cov': ssi_cov,
+}
+
+
+def identify_modes(
+    data: np.ndarray, fs: float, method: str = 'ssi_cov', **kwargs
+) -> ModalResult:
+    """Dispatch to one of :data:`MODAL_METHODS`."""
+    if method not in MODAL_METHODS:
+        raise ValueError(
+            f"Unknown modal method {method!r}; "
+            f"expected one of {sorted(MODAL_METHODS)}"
+        )
+    return MODAL_METHODS[method](data, fs, **kwargs)
+
+
+@dataclass
+class ModeTrack:
+    """Recent history of one mode followed across analysis windows.
+
+    ``frequencies`` and ``dampings`` hold the last ``TRACK_HISTORY``
+    observations; ``observations`` counts all of them.
+    """
+    track_id: int
+    frequencies: Deque[float] = field(
+        default_factory=lambda: deque(maxlen=TRACK_HISTORY)
+    )
+    dampings: Deque[float] = field(
+        default_factory=lambda: deque(maxlen=TRACK_HISTORY)
+    )
+    observations: int = 0
+    shape: Optional[np.ndarray] = None
+    baseline_frequency: Optional[float] = None
+    baseline_damping: Optional[float] = None
+    baseline_shape: Optional[np.ndarray] = None
+    missed: int = 0
+
+    @property
+    def frequency(self) -> float:
+        return self.frequencies[-1]
+
+    @property
+    def damping(self) -> float:
+        return self.dampings[-1]
+
+    @property
+    def frequency_drift(self) -> float:
+        """Change from the baseline frequency (%)."""
+        baseline = self.baseline_frequency
+        return (self.frequency - baseline) / baseline * 100
+
+    @property
+    def shape_mac(self) -> float:
+        """MAC between the current and the baseline mode shape."""
+        if self.shape is None or self.baseline_shape is None:
+            return 1.0
+        return mac(self.shape, self.baseline_shape)
+
+
+class ModeTracker:
+    """
+    Follow identified modes across analysis windows.
+
+    Each new mode is matched to an existing track when its frequency is
+    within ``tolerance`` (relative) and its shape MAC is at least
+    ``min_mac``; the assignment minimizes the combined cost over all pairs.
+    Unmatched modes open new tracks.  A track's baseline is the median of
+    its first ``baseline_windows`` observations.  Tracks missing from more
+    than ``max_missed`` windows are dropped, except the fundamental: it
+    stays dormant through sensor outages and quiet nights and keeps its
+    baseline, so the drift accumulated so far is not lost.
+    """
+
+    def __init__(
+        self,
+        tolerance: float = 0.1,
+        min_mac: float = 0.8,
+        baseline_windows: int = 1,
+        max_missed: int = 10
+    ):
+        if not 1 <= baseline_windows <= TRACK_HISTORY:
+            raise ValueError(f"baseline_windows must be in [1, {TRACK_HISTORY}]")
+        self.tolerance = tolerance
+        self.min_mac = min_mac
+        self.baseline_windows = baseline_windows
+        self.max_missed = max_missed
+        self.tracks: List[ModeTrack] = []
+        self._next_id = 0
+        self._fundamental_id: Optional[int] = None
+
+    def update(self, result: ModalResult) -> List[ModeTrack]:
+        """Assign the modes of a new window; returns the tracks they went to."""
+        modes = [m for m in result.modes if np.isfinite(m.frequency)]
+        assigned: Dict[int, ModeTrack] = {}
+
+        if self.tracks and modes:
+            cost = np.full((len(modes), len(self.tracks)), np.inf)
+            for i, mode in enumerate(modes):
+                for j, track in enumerate(self.tracks):
+                    distance = abs(mode.frequency - track.frequency) / track.frequency
+                    similarity = 0.0
+                    if len(mode.shape) == len(track.shape):
+                        similarity = mac(mode.shape, track.shape)
+                    if distance <= self.tolerance and similarity >= self.min_mac:
+                        cost[i, j] = distance / self.tolerance + (1 - similarity)
+            rows, cols = linear_sum_assignment(np.where(np.isfinite(cost), cost, 1e9))
+            for i, j in zip(rows, cols):
+                if np.isfinite(cost[i, j]):
+                    assigned[i] = self.tracks[j]
+
+        touched = []
+        for i, mode in enumerate(modes):
+            track = assigned.get(i)
+            if track is None:
+                track = ModeTrack(self._next_id)
+                self._next_id += 1
+                self.tracks.append(track)
+            self._observe(track, mode)
+            touched.append(track)
+
+        for track in self.tracks:
+            if track not in touched:
+                track.missed += 1
+        self.tracks = [
+            t for t in self.tracks
+            if t.missed <= self.max_missed or t.track_id == self._fundamental_id
+        ]
+        self.tracks.sort(key=lambda t: t.frequency)
+        if self.fundamental is None:
+            baselined = [t for t in self.tracks if t.baseline_frequency is not None]
+            self._fundamental_id = baselined[0].track_id if baselined else None
+        return touched
+
+    def _observe(self, track: ModeTrack, mode: IdentifiedMode):
+        track.frequencies.append(mode.frequency)
+        track.dampings.append(mode.damping)
+        track.observations += 1
+        track.shape = mode.shape
+        track.missed = 0
+        ready = track.observations >= self.baseline_windows
+        if track.baseline_frequency is None and ready:
+            track.baseline_frequency = float(np.median(track.frequencies))
+            if np.any(np.isfinite(track.dampings)):
+                track.baseline_damping = float(np.nanmedian(track.dampings))
+            track.baseline_shape = mode.shape
+
+    @property
+    def fundamental(self) -> Optional[ModeTrack]:
+        """The track followed as the fundamental mode.
+
+        This is the lowest baselined track when it was first chosen; it
+        stays the fundamental for good, so a spurious lower pole in a later
+        window cannot replace it.  ``missed`` tells whether it was seen in
+        the latest window.
+        """
+        for track in self.tracks:
+            if track.track_id == self._fundamental_id:
+                return track
+        return None
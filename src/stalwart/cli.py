@@ -57,16 +57,34 @@ def simulate():
     parser = argparse.ArgumentParser(description="Run simulation")
     parser.add_argument('--scenario', '-s', choices=['flutter', 'corrosion', 'fatigue', 'thermal'],
                        default='flutter', help='Simulation scenario')
-    parser.add_argument('--duration', '-d', type=int, default=60,
-                       help='Simulation duration (seconds)')
+    parser.add_argument('--duration', '-d', type=float, default=540,
+                       help='Simulated duration (days)')
+    parser.add_argument('--step', type=float, default=12,
+                       help='Simulated hours between analyses')
+    parser.add_argument('--seed', type=int, help='Random seed')
     
     args = parser.parse_args()
     
     setup_logger()
-    logger.info(f"Running {args.scenario} simulation for {args.duration} seconds")
+    logger.info(
+        f"Running {args.scenario} simulation for {args.duration} simulated days"
+    )
     
     from .simulation.scenarios import run_scenario
-    run_scenario(args.scenario, args.duration)
+    result = run_scenario(
+        args.scenario, args.duration, step_hours=args.step, seed=args.seed
+    )
+    
+    summary = result.to_dict()
+    print(f"Scenario: {summary['scenario']} ({summary['parameter']})")
+    print(f"Simulated: {summary['simulated_hours']:.0f} h "
+          f"in {summary['wall_time']:.1f} s "
+          f"({summary['throughput']:.0f} simulated h/s)")
+    print(f"First {summary['metric']} warning: "
+          f"{summary['first_warning_hours']} h, "
+          f"first critical: {summary['first_critical_hours']} h")
+    print(f"{summary['parameter']} left SAFE at: "
+          f"{summary['indicator_warning_hours']} h")
     
     return 0
 
@@ -0,0 +1,160 @@
+"""Multi-sensor alignment of TimeSeries onto a common clock."""
+
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Union
+
+import numpy as np
+
+from .measurement import (
+    TimeSeries, TIMESTAMP_DTYPE, VALUE_DTYPE, as_epoch_ns, parse_frequency
+)
+
+
+def asof_indices(
+    source_ns: np.ndarray,
+    clock_ns: np.ndarray,
+    tolerance_ns: Optional[int] = None,
+    direction: str = 'backward'
+) -> np.ndarray:
+    """Row of ``source_ns`` matched to each clock tick, or -1 if none.
+
+    Args:
+        source_ns: Sorted epoch-ns timestamps of the source series
+        clock_ns: Sorted epoch-ns clock ticks
+        tolerance_ns: Maximum allowed distance between tick and sample
+        direction: 'backward' (last sample at or before the tick) or
+            'nearest'
+    """
+    if direction not in ('backward', 'nearest'):
+        raise ValueError(f"Unknown direction: {direction!r}")
+
+    n = len(source_ns)
+    if n == 0:
+        return np.full(len(clock_ns), -1, dtype=np.int64)
+
+    after = np.searchsorted(source_ns, clock_ns, side='right')
+    idx = after - 1
+    if direction == 'nearest':
+        nxt = np.minimum(after, n - 1)
+        prev = np.maximum(idx, 0)
+        use_next = (idx < 0) | (
+            (after < n) & (source_ns[nxt] - clock_ns < clock_ns - source_ns[prev])
+        )
+        idx = np.where(use_next, nxt, idx)
+
+    valid = idx >= 0
+    if tolerance_ns is not None:
+        distance = np.abs(clock_ns - source_ns[np.maximum(idx, 0)])
+        valid &= distance <= tolerance_ns
+    return np.where(valid, idx, -1).astype(np.int64)
+
+
+class AlignedFrame:
+    """Several sensor series as-of joined onto one clock.
+
+    ``values`` is an (n_ticks, n_series) float64 matrix with NaN where a
+    series had no sample within tolerance of a tick.
+    """
+
+    def __init__(self, timestamps_ns: np.ndarray, values: np.ndarray, names: List[str]):
+        if values.shape != (len(timestamps_ns), len(names)):
+            raise ValueError("values must have shape (len(timestamps_ns), len(names))")
+        self.timestamps_ns = timestamps_ns
+        self.values = values
+        self.names = list(names)
+
+    @classmethod
+    def from_series(
+        cls,
+        series: Union[Sequence[TimeSeries], Mapping[str, TimeSeries]],
+        clock: Any = None,
+        tolerance: Any = None,
+        direction: str = 'backward'
+    ) -> 'AlignedFrame':
+        """As-of join several series onto a common clock.
+
+        Args:
+            series: Series to align, named by sensor_id or by mapping key
+            clock: None to use the first series' timestamps, a frequency
+                (e.g. '1s') for a regular grid, or explicit timestamps
+                (array or TimeSeries).
+                Generated clocks cover only the range where all series
+                overlap.
+            tolerance: Maximum gap between a tick and the matched sample
+                (duration, e.g. '50ms'); None for unbounded
+            direction: 'backward' or 'nearest'
+        """
+        if isinstance(series, Mapping):
+            names, items = list(series.keys()), list(series.values())
+        else:
+            items = list(series)
+            names = [ts.sensor_id for ts in items]
+
+        tolerance_ns = None if tolerance is None else parse_frequency(tolerance)
+        clock_ns = cls._build_clock(items, clock)
+
+        values = np.full((len(clock_ns), len(items)), np.nan, dtype=VALUE_DTYPE)
+        for j, ts in enumerate(items):
+            idx = asof_indices(ts.timestamps_ns, clock_ns, tolerance_ns, direction)
+            hit = idx >= 0
+            values[hit, j] = ts.values[idx[hit]]
+        return cls(clock_ns, values, names)
+
+    @staticmethod
+    def _build_clock(items: List[TimeSeries], clock: Any) -> np.ndarray:
+        if isinstance(clock, TimeSeries):
+            return clock.timestamps_ns
+        if isinstance(clock, (np.ndarray, list, tuple)):
+            return as_epoch_ns(clock)
+        if not items or any(len(ts) == 0 for ts in items):
+            return np.empty(0, dtype=TIMESTAMP_DTYPE)
+
+        start = max(int(ts.timestamps_ns[0]) for ts in items)
+        end = min(int(ts.timestamps_ns[-1]) for ts in items)
+        if end < start:
+            return np.empty(0, dtype=TIMESTAMP_DTYPE)
+
+        if clock is None:
+            reference = items[0].timestamps_ns
+            lo = int(np.searchsorted(reference, start, side='left'))
+            hi = int(np.searchsorted(reference, end, side='right'))
+            return reference[lo:hi]
+
+        return np.arange(start, end + 1, parse_frequency(clock), dtype=TIMESTAMP_DTYPE)
+
+    def __len__(self) -> int:
+        return len(self.timestamps_ns)
+
+    def __repr__(self) -> str:
+        return f"AlignedFrame(n={len(self)}, series={self.names})"
+
+    @property
+    def timestamps(self) -> np.ndarray:
+        """Clock ticks as datetime64[ns] (zero-copy view)."""
+        return self.timestamps_ns.view('datetime64[ns]')
+
+    @property
+    def valid(self) -> np.ndarray:
+        """Boolean mask of matched cells."""
+        return ~np.isnan(self.values)
+
+    def complete_rows(self) -> 'AlignedFrame':
+        """Only the ticks where every series was matched."""
+        keep = np.all(self.valid, axis=1)
+        return AlignedFrame(self.timestamps_ns[keep], self.values[keep], self.names)
+
+    def column(self, name: str) -> np.ndarray:
+        """One aligned series (strided view)."""
+        return self.values[:, self.names.index(name)]
+
+    def to_dataframe(self):
+        """Wrap as a pandas DataFrame without copying."""
+        import pandas as pd
+        index = pd.DatetimeIndex(self.timestamps, copy=False, name='timestamp')
+        return pd.DataFrame(self.values, index=index, columns=self.names, copy=False)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'names': self.names,
+            'timestamps_ns': self.timestamps_ns.tolist(),
+            'values': self.values.tolist()
+        }
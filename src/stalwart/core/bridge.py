@@ -28,6 +28,8 @@ class BridgeSpecs:
     climate_zone: str = "temperate"
     daily_traffic: int = 0
     truck_percentage: float = 0.0
+    frequency_estimator: str = "fft_peak"  # fft_peak, zero_crossing
+    modal_method: str = "ssi_cov"  # ssi_cov, fdd
 
 
 @dataclass
@@ -53,6 +55,7 @@ class Bridge:
         self.status = None
         self.measurements = []
         self.alerts = []
+        self.processor = None  # kept across updates for its baselines
         
         logger.info(f"Bridge {specs.bridge_id} initialized: {specs.name}")
     
@@ -75,8 +78,9 @@ class Bridge:
         """Update bridge health status based on new measurements."""
         from ..analysis.processor import AnalysisProcessor
         
-        processor = AnalysisProcessor(self)
-        self.status = processor.analyze(measurements)
+        if self.processor is None:
+            self.processor = AnalysisProcessor(self)
+        self.status = self.processor.analyze(measurements)
         return self.status
     
     def check_alerts(self) -> List[Dict[str, Any]]:
@@ -0,0 +1,279 @@
+"""Lossless Gorilla-style compression for sensor time series.
+
+Timestamps are stored as delta-of-delta, which is all zeros for a sensor
+sampling at a fixed rate.  Values are XORed with their predecessor's bit
+pattern, so repeated or slowly varying readings leave mostly-zero words.
+
+Gorilla writes a variable-length code for each value.  Here the leading- and
+trailing-zero trimming is done per block of ``block_size`` words instead.
+Each block stores one shift (trailing zeros) and one bit width, and every
+word in the block is packed at that width.  All blocks that share a width are
+packed and unpacked together with ``np.packbits``/``np.unpackbits``, so
+encode and decode loop over distinct widths (at most 65), not over samples.
+
+Most sensor channels are quantized by the ADC to a fixed number of
+decimals, and the bit patterns of such values are close to random in the
+low mantissa, so XOR alone recovers little.  :func:`encode_floats` therefore
+first checks whether the whole column round-trips exactly through
+``round(v * 10**k) / 10**k`` for a small ``k``.  If it does, the column is
+stored as zigzagged integer deltas; if not, it falls back to XOR encoding.
+The float output is bit-exact either way.
+
+Packed word stream layout (little-endian)::
+
+    count u64, block_size u32
+    shift u8[n_blocks], width u8[n_blocks]
+    payload: for each width in ascending order, the words of all blocks
+             with that width, packed LSB-first and padded to a byte
+"""
+
+import struct
+from typing import Tuple
+
+import numpy as np
+
+DEFAULT_BLOCK_SIZE = 1024
+
+_STREAM_HEADER = struct.Struct('<QI')
+_TIMESTAMP_HEADER = struct.Struct('<qq')
+_FLOAT_HEADER = struct.Struct('<BBQ')
+
+# Float column schemes
+SCHEME_XOR = 0
+SCHEME_DECIMAL = 1
+
+# Largest decimal exponent tried by the decimal scheme
+MAX_DECIMALS = 10
+
+
+def _bit_length32(words: np.ndarray) -> np.ndarray:
+    """Bit length of values below 2**32 (exact via frexp)."""
+    return np.frexp(words.astype(np.float64))[1].astype(np.int64)
+
+
+def bit_length(words: np.ndarray) -> np.ndarray:
+    """Vectorized bit length of uint64 words (0 for 0)."""
+    words = np.asarray(words, dtype=np.uint64)
+    high = words >> np.uint64(32)
+    low = words & np.uint64(0xFFFFFFFF)
+    return np.where(high > 0, 32 + _bit_length32(high), _bit_length32(low))
+
+
+def trailing_zeros(words: np.ndarray) -> np.ndarray:
+    """Vectorized count of trailing zero bits of uint64 words (0 for 0)."""
+    words = np.asarray(words, dtype=np.uint64)
+    lowest = words & (~words + np.uint64(1))
+    return np.maximum(bit_length(lowest) - 1, 0)
+
+
+def zigzag_encode(values: np.ndarray) -> np.ndarray:
+    """Map signed int64 to uint64 so small magnitudes get small codes."""
+    values = np.asarray(values, dtype=np.int64)
+    return ((values << 1) ^ (values >> 63)).view(np.uint64)
+
+
+def zigzag_decode(words: np.ndarray) -> np.ndarray:
+    """Inverse of :func:`zigzag_encode`."""
+    words = np.asarray(words, dtype=np.uint64)
+    sign = np.uint64(0) - (words & np.uint64(1))
+    return ((words >> np.uint64(1)) ^ sign).view(np.int64)
+
+
+def pack_words(words: np.ndarray, block_size: int = DEFAULT_BLOCK_SIZE) -> bytes:
+    """Pack uint64 words with per-block zero trimming."""
+    words = np.ascontiguousarray(words, dtype=np.uint64)
+    n = len(words)
+    if block_size <= 0 or block_size > 0xFFFFFFFF:
+        raise ValueError("block_size must be in 1..2**32-1")
+
+    header = _STREAM_HEADER.pack(n, block_size)
+    if n == 0:
+        return header
+
+    starts = np.arange(0, n, block_size)
+    combined = np.bitwise_or.reduceat(words, starts)
+    shifts = trailing_zeros(combined)
+    widths = np.where(combined > 0, bit_length(combined) - shifts, 0)
+
+    block_of = np.arange(n) // block_size
+    shifted = words >> shifts[block_of].astype(np.uint64)
+
+    parts = [
+        header,
+        shifts.astype(np.uint8).tobytes(),
+        widths.astype(np.uint8).tobytes(),
+    ]
+    for width in np.unique(widths):
+        if width == 0:
+            continue
+        group = shifted[widths[block_of] == width]
+        bytes_ = group.view(np.uint8).reshape(-1, 8)
+        bits = np.unpackbits(bytes_, axis=1, bitorder='little')
+        parts.append(np.packbits(bits[:, :width], bitorder='little').tobytes())
+    return b''.join(parts)
+
+
+def unpack_words(data: bytes, offset: int = 0) -> Tuple[np.ndarray, int]:
+    """Unpack words written by :func:`pack_words`.
+
+    Returns:
+        Tuple of (uint64 words, offset just past the stream)
+    """
+    buf = np.frombuffer(data, dtype=np.uint8)
+    n, block_size = _STREAM_HEADER.unpack_from(data, offset)
+    offset += _STREAM_HEADER.size
+    words = np.zeros(n, dtype=np.uint64)
+    if n == 0:
+        return words, offset
+
+    n_blocks = -(-n // block_size)
+    shifts = buf[offset:offset + n_blocks].astype(np.uint64)
+    widths = buf[offset + n_blocks:offset + 2 * n_blocks].astype(np.int64)
+    offset += 2 * n_blocks
+
+    block_of = np.arange(n) // block_size
+    value_widths = widths[block_of]
+    for width in np.unique(widths):
+        if width == 0:
+            continue
+        mask = value_widths == width
+        count = int(np.count_nonzero(mask))
+        nbytes = -(-count * int(width) // 8)
+        bits = np.unpackbits(
+            buf[offset:offset + nbytes], count=count * int(width), bitorder='little'
+        )
+        full = np.zeros((count, 64), dtype=np.uint8)
+        full[:, :width] = bits.reshape(count, width)
+        packed = np.packbits(full, axis=1, bitorder='little')
+        words[mask] = packed.view(np.uint64).ravel()
+        offset += nbytes
+
+    words <<= shifts[block_of]
+    return words, offset
+
+
+def encode_timestamps(
+    timestamps_ns: np.ndarray, block_size: int = DEFAULT_BLOCK_SIZE
+) -> bytes:
+    """Delta-of-delta encode a sorted int64 epoch-ns column."""
+    t = np.asarray(timestamps_ns, dtype=np.int64)
+    first = int(t[0]) if len(t) else 0
+    delta = int(t[1] - t[0]) if len(t) > 1 else 0
+    dod = np.diff(t, n=2) if len(t) > 2 else np.empty(0, dtype=np.int64)
+    header = _TIMESTAMP_HEADER.pack(first, delta)
+    return header + pack_words(zigzag_encode(dod), block_size)
+
+
+def decode_timestamps(data: bytes, count: int) -> np.ndarray:
+    """Decode a column written by :func:`encode_timestamps`."""
+    first, delta = _TIMESTAMP_HEADER.unpack_from(data, 0)
+    dod, _ = unpack_words(data, _TIMESTAMP_HEADER.size)
+    t = np.empty(count, dtype=np.int64)
+    if count == 0:
+        return t
+    t[0] = first
+    if count > 1:
+        deltas = np.empty(count - 1, dtype=np.int64)
+        deltas[0] = delta
+        np.cumsum(zigzag_decode(dod), out=deltas[1:])
+        deltas[1:] += delta
+        np.cumsum(deltas, out=t[1:])
+        t[1:] += first
+    return t
+
+
+def _float_words(values: np.ndarray) -> np.ndarray:
+    """Bit patterns of a float32/float64 column as uint64."""
+    if values.dtype == np.float32:
+        return values.view(np.uint32).astype(np.uint64)
+    return values.view(np.uint64)
+
+
+def _words_to_floats(words: np.ndarray, dtype: np.dtype) -> np.ndarray:
+    if dtype == np.float32:
+        return words.astype(np.uint32).view(np.float32)
+    return words.view(np.float64)
+
+
+def _decimal_ints(values: np.ndarray, exponent: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Scale values to integers at 10**exponent.
+
+    Returns:
+        Tuple of (int64 values, indices that do not decode bit-exactly)
+    """
+    scale = 10.0 ** exponent
+    with np.errstate(over='ignore', invalid='ignore'):
+        scaled = values.astype(np.float64) * scale
+        representable = np.abs(scaled) < 2 ** 53
+    ints = np.round(np.where(representable, scaled, 0)).astype(np.int64)
+    decoded = (ints.astype(np.float64) / scale).astype(values.dtype)
+    exceptions = np.flatnonzero(_float_words(decoded) != _float_words(values))
+    return ints, exceptions
+
+
+def _decimal_exponent(values: np.ndarray) -> int:
+    """Smallest k for which values are integers / 10**k, allowing a few exceptions.
+
+    Exceptions (negative zero, NaN, stray full-precision values) are stored
+    verbatim, so at most ``len(values) // 64`` of them are accepted.
+    """
+    probe = values[:64]
+    for k in range(MAX_DECIMALS + 1):
+        if len(_decimal_ints(probe, k)[1]) > 2:
+            continue
+        if len(_decimal_ints(values, k)[1]) <= len(values) // 64:
+            return k
+    return -1
+
+
+def encode_floats(values: np.ndarray, block_size: int = DEFAULT_BLOCK_SIZE) -> bytes:
+    """Encode a float64 or float32 column losslessly.
+
+    Uses the decimal scheme when the column is decimal-quantized, XOR
+    against the predecessor otherwise.
+    """
+    values = np.ascontiguousarray(values)
+    if values.dtype != np.float32:
+        values = values.astype(np.float64, copy=False)
+
+    exponent = _decimal_exponent(values) if len(values) else -1
+    if exponent >= 0:
+        ints, exceptions = _decimal_ints(values, exponent)
+        ints[exceptions] = 0
+        deltas = np.diff(ints, prepend=ints[0])
+        header = _FLOAT_HEADER.pack(
+            SCHEME_DECIMAL, exponent, int(ints[0]) & 0xFFFFFFFFFFFFFFFF
+        )
+        return b''.join([
+            header,
+            pack_words(zigzag_encode(deltas), block_size),
+            pack_words(np.diff(exceptions, prepend=0).astype(np.uint64), block_size),
+            pack_words(_float_words(values)[exceptions], block_size),
+        ])
+
+    words = _float_words(values)
+    first = int(words[0]) if len(words) else 0
+    xors = np.zeros(len(words), dtype=np.uint64)
+    if len(words) > 1:
+        np.bitwise_xor(words[1:], words[:-1], out=xors[1:])
+    return _FLOAT_HEADER.pack(SCHEME_XOR, 0, first) + pack_words(xors, block_size)
+
+
+def decode_floats(data: bytes, dtype: np.dtype = np.float64) -> np.ndarray:
+    """Decode a column written by :func:`encode_floats`."""
+    scheme, exponent, first = _FLOAT_HEADER.unpack_from(data, 0)
+    words, offset = unpack_words(data, _FLOAT_HEADER.size)
+    dtype = np.dtype(dtype)
+
+    if scheme == SCHEME_DECIMAL:
+        ints = np.cumsum(zigzag_decode(words))
+        ints += np.array(first, dtype=np.uint64).view(np.int64)
+        values = (ints.astype(np.float64) / 10.0 ** exponent).astype(dtype)
+        gaps, offset = unpack_words(data, offset)
+        raw, _ = unpack_words(data, offset)
+        values[np.cumsum(gaps.astype(np.int64))] = _words_to_floats(raw, dtype)
+        return values
+
+    if len(words):
+        words[0] = first
+    return _words_to_floats(np.bitwise_xor.accumulate(words), dtype)
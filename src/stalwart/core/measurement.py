@@ -1,10 +1,152 @@
 """Measurement data structures."""
 
 from dataclasses import dataclass
-from typing import List, Optional, Dict, Any
-from datetime import datetime
+from typing import List, Optional, Dict, Any, Iterator, Sequence, Tuple, Union
+from datetime import datetime, timedelta, timezone
 import numpy as np
 import json
+import re
+
+
+# Column dtypes of the array-backed TimeSeries
+TIMESTAMP_DTYPE = np.int64   # epoch nanoseconds
+VALUE_DTYPE = np.float64
+QUALITY_DTYPE = np.float32
+
+# Rows per chunk in the binary on-disk format
+DEFAULT_CHUNK_SIZE = 65536
+
+
+def to_epoch_ns(timestamp: datetime) -> int:
+    """Convert a datetime to integer epoch nanoseconds.
+
+    Naive datetimes are taken as-is (wall clock); aware datetimes are
+    converted to UTC first.
+    """
+    if timestamp.tzinfo is not None:
+        timestamp = timestamp.astimezone(timezone.utc).replace(tzinfo=None)
+    return int(np.datetime64(timestamp, 'ns').astype(TIMESTAMP_DTYPE))
+
+
+def from_epoch_ns(timestamp_ns: int) -> datetime:
+    """Convert integer epoch nanoseconds back to a naive datetime."""
+    return np.datetime64(int(timestamp_ns), 'ns').astype('datetime64[us]').item()
+
+
+def as_epoch_ns(timestamps: Any) -> np.ndarray:
+    """Coerce timestamps to an int64 epoch-ns array.
+
+    Accepts datetime64 arrays, integer epoch-ns arrays, float epoch
+    seconds or a sequence of datetime objects.
+    """
+    arr = np.asarray(timestamps)
+    if arr.dtype.kind == 'M':
+        return arr.astype('datetime64[ns]').view(TIMESTAMP_DTYPE)
+    if arr.dtype.kind in 'iu':
+        return arr.astype(TIMESTAMP_DTYPE, copy=False)
+    if arr.dtype.kind == 'f':
+        return np.round(arr * 1e9).astype(TIMESTAMP_DTYPE)
+    items = arr.ravel().tolist()
+    if any(t.tzinfo is not None for t in items):
+        return np.array([to_epoch_ns(t) for t in items], dtype=TIMESTAMP_DTYPE)
+    return np.array(items, dtype='datetime64[ns]').view(TIMESTAMP_DTYPE)
+
+
+def as_scalar_ns(timestamp: Any) -> int:
+    """Coerce one datetime, datetime64, epoch-ns int or epoch-s float to epoch ns."""
+    return int(as_epoch_ns([timestamp])[0])
+
+
+# Frequency string units, in nanoseconds
+_FREQUENCY_UNITS = {
+    'ns': 1,
+    'us': 1_000,
+    'ms': 1_000_000,
+    's': 1_000_000_000,
+    'sec': 1_000_000_000,
+    'min': 60_000_000_000,
+    'h': 3_600_000_000_000,
+    'd': 86_400_000_000_000,
+}
+
+AGGREGATIONS = ('mean', 'min', 'max', 'rms', 'count', 'last')
+
+
+def parse_frequency(frequency: Union[str, float, int, timedelta]) -> int:
+    """Convert a frequency/duration such as '10ms', '1s' or '1min' to nanoseconds.
+
+    Plain numbers are taken as seconds; timedelta and timedelta64 are
+    also accepted.
+    """
+    if isinstance(frequency, timedelta):
+        seconds = frequency.days * 86_400 + frequency.seconds
+        step = seconds * 1_000_000_000 + frequency.microseconds * 1_000
+    elif isinstance(frequency, np.timedelta64):
+        step = int(frequency.astype('timedelta64[ns]').astype(np.int64))
+    elif isinstance(frequency, (int, float)):
+        step = int(round(frequency * 1e9))
+    else:
+        match = re.fullmatch(r'\s*(\d+(?:\.\d+)?)?\s*([a-zA-Z]+)\s*', frequency)
+        if not match or match.group(2).lower() not in _FREQUENCY_UNITS:
+            raise ValueError(f"Unsupported frequency: {frequency!r}")
+        count = float(match.group(1)) if match.group(1) else 1.0
+        step = int(round(count * _FREQUENCY_UNITS[match.group(2).lower()]))
+
+    if step <= 0:
+        raise ValueError(f"Frequency must be positive: {frequency!r}")
+    return step
+
+
+def bin_aggregate(
+    timestamps_ns: np.ndarray,
+    values: np.ndarray,
+    step_ns: int,
+    aggregations: Sequence[str] = AGGREGATIONS
+) -> Dict[str, np.ndarray]:
+    """Aggregate sorted samples into fixed-width time buckets.
+
+    Buckets are aligned to the epoch (bucket index = t // step).  Empty
+    buckets are omitted.  All kernels work on bucket boundaries found in
+    a single pass over the sorted time axis, using ``ufunc.reduceat``.
+
+    Returns:
+        Dict with 'timestamp' (bucket start, epoch ns) plus one array per
+        requested aggregation.
+    """
+    unknown = set(aggregations) - set(AGGREGATIONS)
+    if unknown:
+        raise ValueError(f"Unknown aggregations: {sorted(unknown)}")
+
+    n = len(timestamps_ns)
+    if n == 0:
+        result = {'timestamp': np.empty(0, dtype=TIMESTAMP_DTYPE)}
+        for name in aggregations:
+            dtype = np.int64 if name == 'count' else VALUE_DTYPE
+            result[name] = np.empty(0, dtype=dtype)
+        return result
+
+    buckets = timestamps_ns // step_ns
+    starts = np.concatenate(([0], np.flatnonzero(buckets[1:] != buckets[:-1]) + 1))
+    counts = np.diff(np.append(starts, n))
+
+    result = {'timestamp': buckets[starts] * step_ns}
+    sums = None
+    for name in aggregations:
+        if name == 'count':
+            result[name] = counts
+        elif name == 'mean':
+            if sums is None:
+                sums = np.add.reduceat(values, starts)
+            result[name] = sums / counts
+        elif name == 'min':
+            result[name] = np.minimum.reduceat(values, starts)
+        elif name == 'max':
+            result[name] = np.maximum.reduceat(values, starts)
+        elif name == 'rms':
+            result[name] = np.sqrt(np.add.reduceat(values * values, starts) / counts)
+        elif name == 'last':
+            result[name] = values[starts + counts - 1]
+    return result
 
 
 @dataclass
@@ -16,7 +158,7 @@ class Measurement:
     value: float
     unit: str
     quality: float = 1.0  # 0-1, 1 = excellent quality
-    
+
     def to_dict(self) -> Dict[str, Any]:
         return {
             'sensor_id': self.sensor_id,
@@ -28,82 +170,470 @@ class Measurement:
         }
 
 
-@dataclass
 class TimeSeries:
-    """Time series of measurements."""
-    sensor_id: str
-    bridge_id: str
-    measurements: List[Measurement]
-    parameter: Optional[str] = None  # AFC, ALSA, etc. if computed
-    
-    def __post_init__(self):
-        if self.measurements:
-            self.measurements.sort(key=lambda x: x.timestamp)
-    
+    """Columnar time series of measurements from a single sensor.
+
+    Samples are stored as three parallel arrays (int64 epoch-ns timestamps,
+    float64 values, float32 quality) sorted by time.  Sensor, bridge, unit
+    and parameter are held once in the series header rather than per sample.
+
+    The ``measurements`` argument is kept as an adapter for code that still
+    builds lists of :class:`Measurement`; use :meth:`from_arrays` to build a
+    series directly from arrays.
+    """
+
+    def __init__(
+        self,
+        sensor_id: str,
+        bridge_id: str,
+        measurements: Optional[List[Measurement]] = None,
+        parameter: Optional[str] = None,  # AFC, ALSA, etc. if computed
+        unit: str = ""
+    ):
+        self.sensor_id = sensor_id
+        self.bridge_id = bridge_id
+        self.parameter = parameter
+        self.unit = unit
+
+        measurements = measurements or []
+        if measurements and not unit:
+            self.unit = measurements[0].unit
+
+        n = len(measurements)
+        timestamps = as_epoch_ns(
+            np.array([m.timestamp for m in measurements], dtype=object)
+        )
+        values = np.fromiter((m.value for m in measurements), VALUE_DTYPE, n)
+        quality = np.fromiter((m.quality for m in measurements), QUALITY_DTYPE, n)
+        self._set_columns(timestamps, values, quality, sort=True)
+
+    @classmethod
+    def from_arrays(
+        cls,
+        sensor_id: str,
+        bridge_id: str,
+        timestamps: Any,
+        values: Any,
+        quality: Optional[Any] = None,
+        parameter: Optional[str] = None,
+        unit: str = "",
+        copy: bool = True
+    ) -> 'TimeSeries':
+        """Build a time series directly from column arrays.
+
+        Args:
+            timestamps: datetime64 array, int64 epoch-ns or float epoch seconds
+            values: Sample values
+            quality: Per-sample quality (defaults to 1.0)
+            copy: If False, arrays already in the column dtypes are used
+                without copying
+        """
+        t = as_epoch_ns(timestamps)
+        v = np.asarray(values, dtype=VALUE_DTYPE)
+        if quality is None:
+            q = np.ones(len(v), dtype=QUALITY_DTYPE)
+        else:
+            q = np.asarray(quality, dtype=QUALITY_DTYPE)
+        if copy:
+            t, v, q = t.copy(), v.copy(), q.copy()
+        return cls._from_columns(
+            sensor_id, bridge_id, t, v, q, parameter, unit, sort=True
+        )
+
+    @classmethod
+    def _from_columns(
+        cls,
+        sensor_id: str,
+        bridge_id: str,
+        timestamps: np.ndarray,
+        values: np.ndarray,
+        quality: np.ndarray,
+        parameter: Optional[str] = None,
+        unit: str = "",
+        sort: bool = False
+    ) -> 'TimeSeries':
+        """Wrap column arrays already in the column dtypes, without copying."""
+        ts = cls.__new__(cls)
+        ts.sensor_id = sensor_id
+        ts.bridge_id = bridge_id
+        ts.parameter = parameter
+        ts.unit = unit
+        ts._set_columns(timestamps, values, quality, sort=sort)
+        return ts
+
+    def _set_columns(
+        self,
+        timestamps: np.ndarray,
+        values: np.ndarray,
+        quality: np.ndarray,
+        sort: bool = False
+    ):
+        """Install column arrays, sorting them by time if needed."""
+        if not (len(timestamps) == len(values) == len(quality)):
+            raise ValueError("timestamps, values and quality must have equal length")
+
+        if sort and len(timestamps) > 1 and np.any(timestamps[1:] < timestamps[:-1]):
+            order = np.argsort(timestamps, kind='stable')
+            timestamps = timestamps[order]
+            values = values[order]
+            quality = quality[order]
+
+        self._timestamps = timestamps
+        self._values = values
+        self._quality = quality
+        self._size = len(timestamps)
+
+    def _derive(
+        self, timestamps: np.ndarray, values: np.ndarray, quality: np.ndarray
+    ) -> 'TimeSeries':
+        """New series with the same header over the given (already sorted) columns."""
+        return TimeSeries._from_columns(
+            self.sensor_id, self.bridge_id, timestamps, values, quality,
+            self.parameter, self.unit
+        )
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __repr__(self) -> str:
+        return (f"TimeSeries(sensor_id={self.sensor_id!r}, "
+                f"bridge_id={self.bridge_id!r}, "
+                f"parameter={self.parameter!r}, n={self._size})")
+
     @property
     def values(self) -> np.ndarray:
-        return np.array([m.value for m in self.measurements])
-    
+        """Sample values (zero-copy view)."""
+        return self._values[:self._size]
+
     @property
-    def timestamps(self) -> List[datetime]:
-        return [m.timestamp for m in self.measurements]
-    
+    def quality(self) -> np.ndarray:
+        """Per-sample quality (zero-copy view)."""
+        return self._quality[:self._size]
+
+    @property
+    def timestamps_ns(self) -> np.ndarray:
+        """Timestamps as int64 epoch nanoseconds (zero-copy view)."""
+        return self._timestamps[:self._size]
+
+    @property
+    def timestamps(self) -> np.ndarray:
+        """Timestamps as a datetime64[ns] array (zero-copy view)."""
+        return self.timestamps_ns.view('datetime64[ns]')
+
+    @property
+    def measurements(self) -> List[Measurement]:
+        """Materialize samples as Measurement objects (compatibility adapter)."""
+        timestamps = self.timestamps.astype('datetime64[us]').tolist()
+        return [
+            Measurement(self.sensor_id, self.bridge_id, t, v, self.unit, q)
+            for t, v, q in zip(timestamps, self.values.tolist(), self.quality.tolist())
+        ]
+
     @property
     def start_time(self) -> Optional[datetime]:
-        return self.timestamps[0] if self.measurements else None
-    
+        return from_epoch_ns(self._timestamps[0]) if self._size else None
+
     @property
     def end_time(self) -> Optional[datetime]:
-        return self.timestamps[-1] if self.measurements else None
-    
+        return from_epoch_ns(self._timestamps[self._size - 1]) if self._size else None
+
     @property
     def duration(self) -> Optional[float]:
-        if self.start_time and self.end_time:
-            return (self.end_time - self.start_time).total_seconds()
+        if self._size:
+            return float(self._timestamps[self._size - 1] - self._timestamps[0]) / 1e9
         return None
-    
-    def resample(self, frequency: str = '1min') -> 'TimeSeries':
-        """Resample time series to specified frequency."""
-        # Placeholder - would need actual resampling logic
-        return self
-    
+
+    def resample(self, frequency: str = '1min', how: str = 'mean') -> 'TimeSeries':
+        """Resample time series to specified frequency.
+
+        Args:
+            frequency: Bucket width, e.g. '1s', '1min' (see parse_frequency)
+            how: Aggregation kernel: mean, min, max, rms, count or last
+
+        Returns:
+            New series with one sample per non-empty bucket, stamped at the
+            bucket start.  Quality is the bucket mean quality.
+        """
+        step = parse_frequency(frequency)
+        agg = bin_aggregate(self.timestamps_ns, self.values, step, (how,))
+        quality = bin_aggregate(
+            self.timestamps_ns, self.quality, step, ('mean',)
+        )['mean']
+        return self._derive(
+            agg['timestamp'],
+            agg[how].astype(VALUE_DTYPE, copy=False),
+            quality.astype(QUALITY_DTYPE)
+        )
+
+    def aggregate(
+        self,
+        frequency: str = '1min',
+        aggregations: Sequence[str] = AGGREGATIONS
+    ) -> Dict[str, np.ndarray]:
+        """Compute several bucket aggregations (mean/min/max/rms/count/last) at once."""
+        step = parse_frequency(frequency)
+        return bin_aggregate(self.timestamps_ns, self.values, step, aggregations)
+
+    def _view(self, lo: int, hi: int) -> 'TimeSeries':
+        """Series over rows [lo, hi) sharing this series' buffers."""
+        return self._derive(
+            self._timestamps[lo:hi], self._values[lo:hi], self._quality[lo:hi]
+        )
+
+    def slice(self, start: Any = None, end: Any = None) -> 'TimeSeries':
+        """Samples in ``[start, end)`` as a view (no copy).
+
+        Bounds may be datetimes, datetime64, epoch-ns ints or epoch-s
+        floats; None leaves that side open.  O(log n) via binary search.
+        """
+        t = self.timestamps_ns
+        lo = 0
+        if start is not None:
+            lo = int(np.searchsorted(t, as_scalar_ns(start), side='left'))
+        hi = self._size
+        if end is not None:
+            hi = int(np.searchsorted(t, as_scalar_ns(end), side='left'))
+        return self._view(lo, max(lo, hi))
+
+    def tail(self, duration: Any) -> 'TimeSeries':
+        """The last ``duration`` of data, e.g. ``tail('10min')``, as a view.
+
+        Covers ``(end_time - duration, end_time]``.
+        """
+        if not self._size:
+            return self._view(0, 0)
+        cutoff = int(self._timestamps[self._size - 1]) - parse_frequency(duration)
+        lo = int(np.searchsorted(self.timestamps_ns, cutoff, side='right'))
+        return self._view(lo, self._size)
+
+    def window_indices(
+        self,
+        window: Any,
+        step: Any = None,
+        start: Any = None,
+        end: Any = None
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Row bounds of fixed (``step`` None) or sliding windows.
+
+        Windows are ``[s, s + window)`` for ``s = start, start + step, ...``
+        up to the last sample (or ``end``); the last window may be partial.
+
+        Returns:
+            Tuple of (window start epoch ns, first row, end row) arrays
+        """
+        window_ns = parse_frequency(window)
+        step_ns = window_ns if step is None else parse_frequency(step)
+        empty = np.empty(0, dtype=np.int64)
+        if not self._size:
+            return empty, empty, empty
+
+        t = self.timestamps_ns
+        first = int(t[0]) if start is None else as_scalar_ns(start)
+        last = int(t[-1]) + 1 if end is None else as_scalar_ns(end)
+        if last <= first:
+            return empty, empty, empty
+
+        starts = np.arange(first, last, step_ns, dtype=np.int64)
+        lo = np.searchsorted(t, starts, side='left')
+        hi = np.searchsorted(t, np.minimum(starts + window_ns, last), side='left')
+        return starts, lo, hi
+
+    def windows(
+        self,
+        window: Any,
+        step: Any = None,
+        start: Any = None,
+        end: Any = None
+    ) -> Iterator['TimeSeries']:
+        """Iterate over fixed or sliding windows as views (see window_indices)."""
+        _, lo, hi = self.window_indices(window, step, start, end)
+        for i, j in zip(lo.tolist(), hi.tolist()):
+            yield self._view(i, j)
+
+    def extend(self, other: Union['TimeSeries', List[Measurement]]) -> int:
+        """Merge further samples from the same sensor into this series.
+
+        Accepts another TimeSeries or a list of Measurement.  See
+        :meth:`extend_arrays` for the merge and de-duplication rules.
+
+        Returns:
+            Number of samples actually added
+        """
+        if isinstance(other, TimeSeries):
+            if other.sensor_id != self.sensor_id:
+                raise ValueError(
+                    f"Cannot extend {self.sensor_id} "
+                    f"with data from {other.sensor_id}"
+                )
+            return self.extend_arrays(other.timestamps_ns, other.values, other.quality)
+
+        foreign = {m.sensor_id for m in other} - {self.sensor_id}
+        if foreign:
+            raise ValueError(
+                f"Cannot extend {self.sensor_id} with data from {sorted(foreign)}"
+            )
+        return self.extend_arrays(
+            as_epoch_ns(np.array([m.timestamp for m in other], dtype=object)),
+            np.fromiter((m.value for m in other), VALUE_DTYPE, len(other)),
+            np.fromiter((m.quality for m in other), QUALITY_DTYPE, len(other))
+        )
+
+    def extend_arrays(
+        self, timestamps: Any, values: Any, quality: Optional[Any] = None
+    ) -> int:
+        """Merge a batch of samples given as arrays.
+
+        In-order batches are appended in amortized O(k) into spare buffer
+        capacity.  A batch reaching back before the current end is merged
+        with only the overlapping tail of the series, O(k log m + m) for a
+        tail of m samples.  Exact retransmissions (a timestamp already
+        present in the series or repeated within the batch) are dropped,
+        keeping the first copy.
+
+        Out-of-order merges rewrite the tail in place, so views taken from
+        this series before the merge may see the reordered rows.
+
+        Returns:
+            Number of samples actually added
+        """
+        new_t = as_epoch_ns(timestamps)
+        new_v = np.asarray(values, dtype=VALUE_DTYPE)
+        if quality is None:
+            new_q = np.ones(len(new_v), dtype=QUALITY_DTYPE)
+        else:
+            new_q = np.asarray(quality, dtype=QUALITY_DTYPE)
+        if not (len(new_t) == len(new_v) == len(new_q)):
+            raise ValueError("timestamps, values and quality must have equal length")
+        if len(new_t) == 0:
+            return 0
+
+        # Sort the batch and drop duplicates within it
+        if np.any(new_t[1:] < new_t[:-1]):
+            order = np.argsort(new_t, kind='stable')
+            new_t, new_v, new_q = new_t[order], new_v[order], new_q[order]
+        keep = np.ones(len(new_t), dtype=bool)
+        keep[1:] = new_t[1:] != new_t[:-1]
+
+        # Only existing rows at or after the batch start can collide or interleave
+        n = self._size
+        existing = self.timestamps_ns
+        split = int(np.searchsorted(existing, new_t[0], side='left'))
+        tail_t = existing[split:]
+        if len(tail_t):
+            pos = np.searchsorted(tail_t, new_t, side='left')
+            hit = pos < len(tail_t)
+            hit[hit] = tail_t[pos[hit]] == new_t[hit]
+            keep &= ~hit
+        if not np.all(keep):
+            new_t, new_v, new_q = new_t[keep], new_v[keep], new_q[keep]
+        k = len(new_t)
+        if k == 0:
+            return 0
+
+        self._reserve(n + k)
+        if split == n:
+            self._timestamps[n:n + k] = new_t
+            self._values[n:n + k] = new_v
+            self._quality[n:n + k] = new_q
+        else:
+            m = n - split
+            tail_t = self._timestamps[split:n].copy()
+            tail_v = self._values[split:n].copy()
+            tail_q = self._quality[split:n].copy()
+
+            slots = np.searchsorted(tail_t, new_t, side='right') + np.arange(k)
+            from_tail = np.ones(m + k, dtype=bool)
+            from_tail[slots] = False
+            for buf, old, new in ((self._timestamps, tail_t, new_t),
+                                  (self._values, tail_v, new_v),
+                                  (self._quality, tail_q, new_q)):
+                region = buf[split:n + k]
+                region[slots] = new
+                region[from_tail] = old
+        self._size = n + k
+        return k
+
+    def _reserve(self, capacity: int):
+        """Ensure writable buffers with room for ``capacity`` rows."""
+        buffers = (self._timestamps, self._values, self._quality)
+        writeable = all(b.flags.writeable for b in buffers)
+        if len(self._timestamps) >= capacity and writeable:
+            return
+
+        new_capacity = max(capacity, 2 * len(self._timestamps), 16)
+        n = self._size
+        grown = []
+        for buf in buffers:
+            new_buf = np.empty(new_capacity, dtype=buf.dtype)
+            new_buf[:n] = buf[:n]
+            grown.append(new_buf)
+        self._timestamps, self._values, self._quality = grown
+
     def filter(self, min_quality: float = 0.5) -> 'TimeSeries':
         """Filter measurements by quality."""
-        filtered = [m for m in self.measurements if m.quality >= min_quality]
-        return TimeSeries(self.sensor_id, self.bridge_id, filtered, self.parameter)
-    
+        mask = self.quality >= min_quality
+        return self._derive(
+            self.timestamps_ns[mask], self.values[mask], self.quality[mask]
+        )
+
     def to_dataframe(self):
-        """Convert to pandas DataFrame."""
+        """Convert to pandas DataFrame wrapping the column arrays (no copy)."""
         import pandas as pd
-        df = pd.DataFrame([
-            {'timestamp': m.timestamp, 'value': m.value, 'quality': m.quality}
-            for m in self.measurements
-        ])
-        df.set_index('timestamp', inplace=True)
-        return df
-    
+        index = pd.DatetimeIndex(self.timestamps, copy=False, name='timestamp')
+        return pd.DataFrame(
+            {'value': self.values, 'quality': self.quality},
+            index=index,
+            copy=False
+        )
+
     def to_dict(self) -> Dict[str, Any]:
         return {
             'sensor_id': self.sensor_id,
             'bridge_id': self.bridge_id,
             'parameter': self.parameter,
             'measurements': [m.to_dict() for m in self.measurements],
-            'count': len(self.measurements),
+            'count': self._size,
             'start_time': self.start_time.isoformat() if self.start_time else None,
             'end_time': self.end_time.isoformat() if self.end_time else None
         }
-    
-    def save_to_file(self, filename: str):
-        """Save time series to JSON file."""
-        with open(filename, 'w') as f:
-            json.dump(self.to_dict(), f, indent=2)
-    
+
+    def save_to_file(
+        self,
+        filename: str,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        compression: Optional[str] = None
+    ):
+        """Save time series to the binary chunked column format.
+
+        Args:
+            chunk_size: Rows per chunk
+            compression: None keeps columns memory-mappable; 'gorilla'
+                stores each chunk with the lossless codec in
+                :mod:`stalwart.core.codec`
+
+        See :mod:`stalwart.core.storage` for the file layout.
+        """
+        from .storage import write_timeseries
+        write_timeseries(filename, self, chunk_size=chunk_size, compression=compression)
+
     @classmethod
-    def load_from_file(cls, filename: str):
-        """Load time series from JSON file."""
+    def load_from_file(
+        cls, filename: str, start: Any = None, end: Any = None
+    ) -> 'TimeSeries':
+        """Load time series from file.
+
+        Uncompressed binary files are memory-mapped, so columns are read
+        lazily.  When a range is given, only the chunks overlapping
+        ``[start, end)`` are touched (and, for compressed files, decoded).
+        Legacy JSON files are still accepted.
+        """
+        from .storage import is_binary_timeseries, read_timeseries
+        if is_binary_timeseries(filename):
+            return read_timeseries(filename, start=start, end=end)
+
         with open(filename, 'r') as f:
             data = json.load(f)
-        
+
         measurements = []
         for m_data in data['measurements']:
             m = Measurement(
@@ -115,10 +645,13 @@ class TimeSeries:
                 quality=m_data.get('quality', 1.0)
             )
             measurements.append(m)
-        
-        return cls(
+
+        ts = cls(
             sensor_id=data['sensor_id'],
             bridge_id=data['bridge_id'],
             measurements=measurements,
             parameter=data.get('parameter')
         )
+        if start is not None or end is not None:
+            ts = ts.slice(start, end)
+        return ts
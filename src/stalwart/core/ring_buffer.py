@@ -0,0 +1,152 @@
+"""Fixed-capacity reading history for sensors."""
+
+from typing import Any, Dict, Optional, Tuple
+
+import numpy as np
+
+from .measurement import TIMESTAMP_DTYPE, VALUE_DTYPE
+
+
+class RunningStats:
+    """Running count, mean, variance, min and max (Welford / Chan et al.)."""
+
+    def __init__(self):
+        self.clear()
+
+    def clear(self):
+        self.count = 0
+        self.mean = 0.0
+        self._m2 = 0.0
+        self.min = np.inf
+        self.max = -np.inf
+
+    def update(self, value: float):
+        """Add a single value."""
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self._m2 += delta * (value - self.mean)
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+
+    def update_batch(self, values: np.ndarray):
+        """Add a block of values in one vectorized step."""
+        k = len(values)
+        if k == 0:
+            return
+        batch_mean = float(np.mean(values))
+        batch_m2 = float(np.sum((values - batch_mean) ** 2))
+
+        n = self.count
+        total = n + k
+        delta = batch_mean - self.mean
+        self.mean += delta * k / total
+        self._m2 += batch_m2 + delta * delta * n * k / total
+        self.count = total
+        self.min = min(self.min, float(np.min(values)))
+        self.max = max(self.max, float(np.max(values)))
+
+    @property
+    def variance(self) -> float:
+        """Sample variance (0 for fewer than two values)."""
+        return self._m2 / (self.count - 1) if self.count > 1 else 0.0
+
+    @property
+    def std(self) -> float:
+        return float(np.sqrt(self.variance))
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'count': self.count,
+            'mean': self.mean if self.count else None,
+            'variance': self.variance,
+            'min': self.min if self.count else None,
+            'max': self.max if self.count else None
+        }
+
+
+class RingBuffer:
+    """Preallocated circular buffer of (epoch-ns timestamp, value) readings.
+
+    Each column is stored twice back to back (a mirrored buffer), so the
+    latest ``n`` readings always form one contiguous slice and
+    :meth:`latest` can return views instead of copies.  Running statistics
+    cover every value added since the last :meth:`clear`, including those
+    already overwritten.
+    """
+
+    def __init__(self, capacity: int = 1000):
+        if capacity <= 0:
+            raise ValueError("capacity must be positive")
+        self.capacity = capacity
+        self._timestamps = np.zeros(2 * capacity, dtype=TIMESTAMP_DTYPE)
+        self._values = np.zeros(2 * capacity, dtype=VALUE_DTYPE)
+        self._head = 0  # next write slot
+        self._size = 0
+        self.stats = RunningStats()
+
+    def __len__(self) -> int:
+        return self._size
+
+    def clear(self):
+        self._head = 0
+        self._size = 0
+        self.stats.clear()
+
+    def append(self, timestamp_ns: int, value: float):
+        """Add one reading in O(1)."""
+        head, cap = self._head, self.capacity
+        self._timestamps[head] = self._timestamps[head + cap] = timestamp_ns
+        self._values[head] = self._values[head + cap] = value
+        self._head = (head + 1) % cap
+        self._size = min(self._size + 1, cap)
+        self.stats.update(value)
+
+    def extend(self, timestamps_ns: np.ndarray, values: np.ndarray):
+        """Add a block of readings with slice writes."""
+        k = len(values)
+        if k == 0:
+            return
+        self.stats.update_batch(values)
+
+        cap = self.capacity
+        if k >= cap:
+            timestamps_ns, values = timestamps_ns[-cap:], values[-cap:]
+            for buf, new in ((self._timestamps, timestamps_ns), (self._values, values)):
+                buf[:cap] = new
+                buf[cap:] = new
+            self._head = 0
+            self._size = cap
+            return
+
+        head = self._head
+        first = cap - head  # rows that land in the lower half
+        for buf, new in ((self._timestamps, timestamps_ns), (self._values, values)):
+            buf[head:head + k] = new
+            buf[head + cap:min(head + k, cap) + cap] = new[:first]
+            if k > first:
+                buf[:head + k - cap] = new[first:]
+        self._head = (head + k) % cap
+        self._size = min(self._size + k, cap)
+
+    def latest(self, n: Optional[int] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """The newest ``n`` readings (default all) oldest-first, as views.
+
+        Returns:
+            Tuple of (epoch-ns timestamps, values)
+        """
+        n = self._size if n is None else min(n, self._size)
+        end = self._head + self.capacity
+        return self._timestamps[end - n:end], self._values[end - n:end]
+
+    @property
+    def values(self) -> np.ndarray:
+        """All buffered values oldest-first (view)."""
+        return self.latest()[1]
+
+    @property
+    def timestamps_ns(self) -> np.ndarray:
+        """All buffered timestamps oldest-first (view)."""
+        return self.latest()[0]
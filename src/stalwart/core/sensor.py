@@ -1,15 +1,27 @@
 """Sensor data structures and interfaces."""
 
-from dataclasses import dataclass
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError as FutureTimeout
+from dataclasses import dataclass, field
 from typing import Optional, List, Dict, Any
 from datetime import datetime
 import json
+import time
 import numpy as np
 
+from .measurement import to_epoch_ns, from_epoch_ns
+from .ring_buffer import RingBuffer
+from ..acquisition.drivers import SensorDriver, SampleBlock, SimulatedDriver
+from ..acquisition.sensors import ModalDriver, TrafficStrainDriver, TemperatureDriver
 from ..utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Readings kept in memory per sensor
+HISTORY_CAPACITY = 1000
+
+# Default per-sensor read deadline for SensorArray cycles (seconds)
+READ_TIMEOUT = 1.0
+
 
 @dataclass
 class SensorSpecs:
@@ -32,14 +44,22 @@ class SensorSpecs:
 class Sensor:
     """Base sensor class."""
     
-    def __init__(self, sensor_id: str, specs: SensorSpecs, location: str = ""):
+    def __init__(
+        self,
+        sensor_id: str,
+        specs: SensorSpecs,
+        location: str = "",
+        history_capacity: int = HISTORY_CAPACITY,
+        driver: Optional[SensorDriver] = None
+    ):
         self.sensor_id = sensor_id
         self.specs = specs
         self.location = location
+        self.driver = driver or SimulatedDriver.from_specs(specs)
         self.bridge_id = None
         self.last_reading = None
         self.last_reading_time = None
-        self.readings = []
+        self.history = RingBuffer(history_capacity)
         self.status = "active"  # active, inactive, error, calibrating
         self.error_count = 0
         
@@ -47,31 +67,70 @@ class Sensor:
     
     def read(self) -> Optional[float]:
         """Read current sensor value."""
-        # This would interface with actual hardware
-        # Placeholder implementation
-        import random
-        value = random.uniform(self.specs.range_min, self.specs.range_max)
+        value = self.driver.read()
         
         self.last_reading = value
         self.last_reading_time = datetime.now()
-        self.readings.append((self.last_reading_time, value))
-        
-        # Keep only last 1000 readings in memory
-        if len(self.readings) > 1000:
-            self.readings = self.readings[-1000:]
+        self.history.append(to_epoch_ns(self.last_reading_time), value)
         
         return value
     
-    def read_batch(self, duration: float, sampling_rate: Optional[float] = None) -> List[float]:
-        """Read batch of sensor data for specified duration."""
+    def read_block(
+        self,
+        duration: float,
+        sampling_rate: Optional[float] = None,
+        start_time_ns: Optional[int] = None
+    ) -> SampleBlock:
+        """Acquire ``duration`` seconds of samples in one driver call."""
         rate = sampling_rate or self.specs.sampling_rate
-        n_samples = int(duration * rate)
+        return self.read_samples(int(round(duration * rate)), rate, start_time_ns)
+    
+    def read_samples(
+        self,
+        n_samples: int,
+        sampling_rate: Optional[float] = None,
+        start_time_ns: Optional[int] = None
+    ) -> SampleBlock:
+        """Acquire exactly ``n_samples`` in one driver call.
         
-        values = []
-        for _ in range(n_samples):
-            values.append(self.read())
+        The whole block is written to the reading history in one slice
+        write.
         
-        return values
+        Args:
+            start_time_ns: Epoch ns of the first sample (default now)
+        """
+        rate = sampling_rate or self.specs.sampling_rate
+        if start_time_ns is None:
+            start_time_ns = to_epoch_ns(datetime.now())
+        
+        block = self.driver.read_block(n_samples, rate, start_time_ns)
+        if len(block):
+            self.history.extend(block.timestamps_ns, block.values)
+            self.last_reading = float(block.values[-1])
+            self.last_reading_time = from_epoch_ns(
+                block.end_time_ns - block.sample_period_ns
+            )
+        
+        return block
+    
+    def read_batch(
+        self, duration: float, sampling_rate: Optional[float] = None
+    ) -> np.ndarray:
+        """Read batch of sensor data for specified duration."""
+        return self.read_block(duration, sampling_rate).values
+    
+    @property
+    def readings(self) -> List[tuple]:
+        """Buffered readings as (datetime, value) tuples, oldest first."""
+        timestamps, values = self.history.latest()
+        return [
+            (from_epoch_ns(t), v)
+            for t, v in zip(timestamps.tolist(), values.tolist())
+        ]
+    
+    def latest(self, n: Optional[int] = None) -> tuple:
+        """Newest ``n`` readings as zero-copy (epoch-ns timestamps, values) views."""
+        return self.history.latest(n)
     
     def calibrate(self, reference_value: float):
         """Calibrate sensor against reference."""
@@ -93,7 +152,8 @@ class Sensor:
             'last_reading': self.last_reading,
             'last_reading_time': self.last_reading_time,
             'calibration_due': self.specs.calibration_due,
-            'readings_count': len(self.readings)
+            'readings_count': len(self.history),
+            'statistics': self.history.stats.to_dict()
         }
         
         # Check if calibration is overdue
@@ -105,7 +165,7 @@ class Sensor:
     
     def reset(self):
         """Reset sensor to initial state."""
-        self.readings = []
+        self.history.clear()
         self.error_count = 0
         self.status = "active"
         logger.info(f"Sensor {self.sensor_id} reset")
@@ -142,16 +202,19 @@ class Accelerometer(Sensor):
             power_consumption=kwargs.get('power', 50.0),
             ip_rating=kwargs.get('ip_rating', "IP67")
         )
-        super().__init__(sensor_id, specs, location)
+        driver = kwargs.get('driver') or ModalDriver(sampling_rate=specs.sampling_rate)
+        super().__init__(sensor_id, specs, location,
+                         kwargs.get('history_capacity', HISTORY_CAPACITY),
+                         driver)
     
     def get_fft(self, duration: float = 10.0) -> tuple:
         """Get FFT of accelerometer data."""
-        data = self.read_batch(duration, 100)
+        block = self.read_block(duration)
         from scipy import fft
         
-        n = len(data)
-        freqs = fft.fftfreq(n, 1/100)
-        fft_vals = np.abs(fft.fft(data))
+        n = len(block)
+        freqs = fft.rfftfreq(n, 1 / block.sampling_rate)
+        fft_vals = np.abs(fft.rfft(block.values))
         
         # Return positive frequencies only
         positive = freqs > 0
@@ -175,7 +238,12 @@ class StrainGauge(Sensor):
             power_consumption=kwargs.get('power', 20.0),
             ip_rating=kwargs.get('ip_rating', "IP68")
         )
-        super().__init__(sensor_id, specs, location)
+        driver = kwargs.get('driver') or TrafficStrainDriver(
+            sampling_rate=specs.sampling_rate
+        )
+        super().__init__(sensor_id, specs, location,
+                         kwargs.get('history_capacity', HISTORY_CAPACITY),
+                         driver)
 
 
 class TemperatureSensor(Sensor):
@@ -195,7 +263,12 @@ class TemperatureSensor(Sensor):
             power_consumption=kwargs.get('power', 5.0),
             ip_rating=kwargs.get('ip_rating', "IP67")
         )
-        super().__init__(sensor_id, specs, location)
+        driver = kwargs.get('driver') or TemperatureDriver(
+            sampling_rate=specs.sampling_rate
+        )
+        super().__init__(sensor_id, specs, location,
+                         kwargs.get('history_capacity', HISTORY_CAPACITY),
+                         driver)
 
 
 class CorrosionProbe(Sensor):
@@ -215,7 +288,9 @@ class CorrosionProbe(Sensor):
             power_consumption=kwargs.get('power', 100.0),
             ip_rating=kwargs.get('ip_rating', "IP68")
         )
-        super().__init__(sensor_id, specs, location)
+        super().__init__(sensor_id, specs, location,
+                         kwargs.get('history_capacity', HISTORY_CAPACITY),
+                         kwargs.get('driver'))
 
 
 class LVDT(Sensor):
@@ -235,7 +310,9 @@ class LVDT(Sensor):
             power_consumption=kwargs.get('power', 25.0),
             ip_rating=kwargs.get('ip_rating', "IP67")
         )
-        super().__init__(sensor_id, specs, location)
+        super().__init__(sensor_id, specs, location,
+                         kwargs.get('history_capacity', HISTORY_CAPACITY),
+                         kwargs.get('driver'))
 
 
 class Anemometer(Sensor):
@@ -255,31 +332,148 @@ class Anemometer(Sensor):
             power_consumption=kwargs.get('power', 40.0),
             ip_rating=kwargs.get('ip_rating', "IP66")
         )
-        super().__init__(sensor_id, specs, location)
+        super().__init__(sensor_id, specs, location,
+                         kwargs.get('history_capacity', HISTORY_CAPACITY),
+                         kwargs.get('driver'))
+
+
+@dataclass
+class ReadCycle:
+    """Result of one concurrent read of a sensor array.
+    
+    Sensors that missed their deadline, raised, or were still busy with a
+    previous read are listed in ``missing`` and read as None.
+    """
+    started_at: datetime
+    readings: Dict[str, Optional[float]]
+    latency: Dict[str, Optional[float]]  # seconds, None if missing
+    missing: List[str] = field(default_factory=list)
+    errors: Dict[str, str] = field(default_factory=dict)
+    wall_time: float = 0.0  # seconds
+    
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'started_at': self.started_at.isoformat(),
+            'readings': self.readings,
+            'latency': self.latency,
+            'missing': self.missing,
+            'errors': self.errors,
+            'wall_time': self.wall_time
+        }
+
+
+def _timed_read(sensor: Sensor) -> tuple:
+    start = time.perf_counter()
+    value = sensor.read()
+    return value, time.perf_counter() - start
 
 
 class SensorArray:
-    """Array of sensors for coordinated monitoring."""
+    """Array of sensors for coordinated monitoring.
+    
+    Sensors are read concurrently on a thread pool, so a slow bus device
+    only delays its own reading.  A read still running from an earlier
+    cycle is not resubmitted; the sensor is reported missing until it
+    returns.
+    """
     
-    def __init__(self, array_id: str, sensors: List[Sensor] = None):
+    def __init__(
+        self,
+        array_id: str,
+        sensors: List[Sensor] = None,
+        timeout: float = READ_TIMEOUT,
+        timeouts: Optional[Dict[str, float]] = None,
+        max_workers: Optional[int] = None
+    ):
         self.array_id = array_id
         self.sensors = sensors or []
         self.bridge_id = None
+        self.timeout = timeout
+        self.timeouts = dict(timeouts or {})  # per-sensor overrides
+        self.max_workers = max_workers
+        self._executor = None
+        self._workers = 0
+        self._pending: Dict[str, Future] = {}
     
-    def add_sensor(self, sensor: Sensor):
-        """Add sensor to array."""
+    def add_sensor(self, sensor: Sensor, timeout: Optional[float] = None):
+        """Add sensor to array, optionally with its own read deadline."""
         self.sensors.append(sensor)
+        if timeout is not None:
+            self.timeouts[sensor.sensor_id] = timeout
     
-    def read_all(self) -> Dict[str, float]:
-        """Read all sensors in array."""
-        readings = {}
+    def _pool(self) -> ThreadPoolExecutor:
+        workers = self.max_workers or max(1, len(self.sensors))
+        if self._executor is None or self._workers < workers:
+            # Grow with the array; reads in flight finish on the old pool
+            if self._executor is not None:
+                self._executor.shutdown(wait=False)
+            self._executor = ThreadPoolExecutor(
+                max_workers=workers, thread_name_prefix=f"read-{self.array_id}"
+            )
+            self._workers = workers
+        return self._executor
+    
+    def read_cycle(self, timeout: Optional[float] = None) -> ReadCycle:
+        """Read all sensors concurrently, each against its own deadline.
+        
+        Args:
+            timeout: Deadline in seconds for sensors without a per-sensor
+                override (default ``self.timeout``)
+        """
+        default_timeout = self.timeout if timeout is None else timeout
+        started_at = datetime.now()
+        start = time.perf_counter()
+        
+        pool = self._pool()
+        futures = {}
+        for sensor in self.sensors:
+            pending = self._pending.get(sensor.sensor_id)
+            if pending is not None and not pending.done():
+                continue
+            futures[sensor.sensor_id] = pool.submit(_timed_read, sensor)
+        self._pending.update(futures)
+        
+        cycle = ReadCycle(started_at, {}, {})
         for sensor in self.sensors:
+            sid = sensor.sensor_id
+            cycle.readings[sid] = None
+            cycle.latency[sid] = None
+            future = futures.get(sid)
+            if future is None:
+                cycle.missing.append(sid)
+                cycle.errors[sid] = "previous read still in progress"
+                continue
+            
+            deadline = start + self.timeouts.get(sid, default_timeout)
             try:
-                readings[sensor.sensor_id] = sensor.read()
+                remaining = max(0.0, deadline - time.perf_counter())
+                value, latency = future.result(timeout=remaining)
+            except FutureTimeout:
+                logger.warning(f"Sensor {sid} missed its read deadline")
+                cycle.missing.append(sid)
+                cycle.errors[sid] = "timeout"
+                continue
             except Exception as e:
-                logger.error(f"Error reading sensor {sensor.sensor_id}: {e}")
-                readings[sensor.sensor_id] = None
-        return readings
+                logger.error(f"Error reading sensor {sid}: {e}")
+                cycle.missing.append(sid)
+                cycle.errors[sid] = str(e)
+                continue
+            cycle.readings[sid] = value
+            cycle.latency[sid] = latency
+        
+        cycle.wall_time = time.perf_counter() - start
+        return cycle
+    
+    def read_all(self, timeout: Optional[float] = None) -> Dict[str, float]:
+        """Read all sensors in array (None for missing sensors)."""
+        return self.read_cycle(timeout).readings
+    
+    def close(self):
+        """Shut down the read thread pool without waiting for stuck reads."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+            self._pending.clear()
     
     def get_sensors_by_type(self, sensor_type: str) -> List[Sensor]:
         """Get all sensors of a specific type."""
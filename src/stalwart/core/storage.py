@@ -0,0 +1,282 @@
+"""Binary chunked on-disk format for TimeSeries.
+
+File layout (all integers little-endian)::
+
+    preamble   16 bytes   magic b'STWTS\\x00\\x00\\x00', version u16,
+                          reserved u16, header length u32
+    header     JSON       sensor/bridge/unit/parameter, row count,
+                          chunk size, codec and block offsets
+    -- padding to 64 bytes; all offsets below are relative to here --
+    index      n_chunks x (t_first, t_last, row_start, row_count) int64
+
+Uncompressed files (``codec`` null) then hold one fixed-width block per
+column, each aligned to 64 bytes, so a reader can memory-map it directly::
+
+    timestamps count x int64 epoch ns
+    values     count x float64
+    quality    count x float32
+
+Compressed files (``codec`` 'gorilla') instead hold::
+
+    blocks     n_chunks x 3 columns x (offset, nbytes) int64
+    payload    per chunk, the encoded timestamps, values and quality
+               streams (see :mod:`stalwart.core.codec`)
+
+The chunk index lets a time-range read locate the chunks it needs without
+touching the rest of the file.
+"""
+
+import json
+import struct
+from typing import Any, Dict, Optional, Tuple
+
+import numpy as np
+
+from .measurement import (
+    TimeSeries, DEFAULT_CHUNK_SIZE, as_scalar_ns
+)
+from . import codec as _codec
+
+MAGIC = b'STWTS\x00\x00\x00'
+FORMAT_VERSION = 1
+
+CODECS = (None, 'gorilla')
+
+_PREAMBLE = struct.Struct('<8sHHI')
+_ALIGNMENT = 64
+
+INDEX_DTYPE = np.dtype([
+    ('t_first', '<i8'),
+    ('t_last', '<i8'),
+    ('row_start', '<i8'),
+    ('row_count', '<i8'),
+])
+
+COLUMN_DTYPES = {
+    'timestamps': np.dtype('<i8'),
+    'values': np.dtype('<f8'),
+    'quality': np.dtype('<f4'),
+}
+
+
+def _align(offset: int) -> int:
+    return (offset + _ALIGNMENT - 1) // _ALIGNMENT * _ALIGNMENT
+
+
+def build_chunk_index(timestamps_ns: np.ndarray, chunk_size: int) -> np.ndarray:
+    """Build the chunk index for a sorted timestamp column."""
+    n = len(timestamps_ns)
+    row_start = np.arange(0, n, chunk_size, dtype=np.int64)
+    row_end = np.minimum(row_start + chunk_size, n)
+
+    index = np.empty(len(row_start), dtype=INDEX_DTYPE)
+    index['row_start'] = row_start
+    index['row_count'] = row_end - row_start
+    index['t_first'] = timestamps_ns[row_start]
+    index['t_last'] = timestamps_ns[row_end - 1]
+    return index
+
+
+def is_binary_timeseries(filename: str) -> bool:
+    """Check whether a file starts with the binary TimeSeries magic."""
+    with open(filename, 'rb') as f:
+        return f.read(len(MAGIC)) == MAGIC
+
+
+def _encode_chunks(
+    columns: Dict[str, np.ndarray], index: np.ndarray
+) -> Tuple[np.ndarray, bytes]:
+    """Encode every chunk of every column with the gorilla codec."""
+    blocks = np.empty((len(index), len(COLUMN_DTYPES), 2), dtype='<i8')
+    parts = []
+    offset = 0
+    chunks = zip(index['row_start'], index['row_count'])
+    for i, (row_start, row_count) in enumerate(chunks):
+        rows = slice(int(row_start), int(row_start + row_count))
+        encoded = [
+            _codec.encode_timestamps(columns['timestamps'][rows]),
+            _codec.encode_floats(columns['values'][rows]),
+            _codec.encode_floats(columns['quality'][rows]),
+        ]
+        for j, data in enumerate(encoded):
+            blocks[i, j] = (offset, len(data))
+            offset += len(data)
+        parts.extend(encoded)
+    return blocks, b''.join(parts)
+
+
+def write_timeseries(
+    filename: str,
+    ts: TimeSeries,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    compression: Optional[str] = None
+):
+    """Write a time series to the binary chunked format.
+
+    Args:
+        chunk_size: Rows per chunk
+        compression: None for memory-mappable raw columns, or 'gorilla'
+    """
+    if chunk_size <= 0:
+        raise ValueError("chunk_size must be positive")
+    if compression not in CODECS:
+        raise ValueError(
+            f"Unknown compression {compression!r}; expected one of {CODECS}"
+        )
+
+    columns = {
+        'timestamps': ts.timestamps_ns,
+        'values': ts.values,
+        'quality': ts.quality,
+    }
+    index = build_chunk_index(columns['timestamps'], chunk_size)
+
+    blocks = [('index', index.tobytes())]
+    if compression is None:
+        blocks += [
+            (name, np.ascontiguousarray(array, dtype=COLUMN_DTYPES[name]).tobytes())
+            for name, array in columns.items()
+        ]
+    else:
+        chunk_blocks, payload = _encode_chunks(columns, index)
+        blocks += [('blocks', chunk_blocks.tobytes()), ('payload', payload)]
+
+    # Block offsets relative to the start of the data section
+    offsets = {}
+    offset = 0
+    for name, data in blocks:
+        offsets[name] = offset
+        offset = _align(offset + len(data))
+
+    header = json.dumps({
+        'sensor_id': ts.sensor_id,
+        'bridge_id': ts.bridge_id,
+        'parameter': ts.parameter,
+        'unit': ts.unit,
+        'count': len(ts),
+        'chunk_size': chunk_size,
+        'n_chunks': len(index),
+        'codec': compression,
+        'offsets': offsets,
+    }).encode('utf-8')
+    data_start = _align(_PREAMBLE.size + len(header))
+
+    with open(filename, 'wb') as f:
+        f.write(_PREAMBLE.pack(MAGIC, FORMAT_VERSION, 0, len(header)))
+        f.write(header)
+        for name, data in blocks:
+            f.seek(data_start + offsets[name])
+            f.write(data)
+        f.truncate(data_start + offset)
+
+
+def read_header(filename: str) -> Tuple[Dict[str, Any], int]:
+    """Read the header of a binary time series file.
+
+    Returns:
+        Tuple of (header dict, absolute offset of the data section)
+    """
+    with open(filename, 'rb') as f:
+        magic, version, _, header_len = _PREAMBLE.unpack(f.read(_PREAMBLE.size))
+        if magic != MAGIC:
+            raise ValueError(f"{filename} is not a STALWART time series file")
+        if version > FORMAT_VERSION:
+            raise ValueError(f"Unsupported time series format version {version}")
+        header = json.loads(f.read(header_len).decode('utf-8'))
+    return header, _align(_PREAMBLE.size + header_len)
+
+
+def _map(filename: str, dtype: np.dtype, offset: int, shape: Any) -> np.ndarray:
+    if np.prod(shape) == 0:
+        return np.empty(shape, dtype=dtype)
+    return np.memmap(filename, dtype=dtype, mode='r', offset=offset, shape=shape)
+
+
+def _decode_chunks(
+    filename: str,
+    header: Dict[str, Any],
+    data_start: int,
+    index: np.ndarray,
+    chunks: range
+) -> Dict[str, np.ndarray]:
+    """Decode the given chunks of a compressed file into contiguous columns."""
+    offsets = header['offsets']
+    blocks = _map(filename, np.dtype('<i8'), data_start + offsets['blocks'],
+                  (header['n_chunks'], len(COLUMN_DTYPES), 2))
+    payload_start = data_start + offsets['payload']
+
+    decoded = {name: [] for name in COLUMN_DTYPES}
+    with open(filename, 'rb') as f:
+        for chunk in chunks:
+            count = int(index['row_count'][chunk])
+            streams = []
+            for offset, nbytes in blocks[chunk]:
+                f.seek(payload_start + int(offset))
+                streams.append(f.read(int(nbytes)))
+            decoded['timestamps'].append(_codec.decode_timestamps(streams[0], count))
+            decoded['values'].append(_codec.decode_floats(streams[1], np.float64))
+            decoded['quality'].append(_codec.decode_floats(streams[2], np.float32))
+
+    return {
+        name: np.concatenate(parts) if parts else np.empty(0, dtype=COLUMN_DTYPES[name])
+        for name, parts in decoded.items()
+    }
+
+
+def read_timeseries(filename: str, start: Any = None, end: Any = None) -> TimeSeries:
+    """Open a binary time series file.
+
+    Uncompressed columns are memory-mapped: no sample data is read here
+    and pages are loaded on first access.  Compressed files decode only
+    the chunks overlapping ``[start, end)``.
+    """
+    header, data_start = read_header(filename)
+    offsets = header['offsets']
+    count = header['count']
+    start_ns = None if start is None else as_scalar_ns(start)
+    end_ns = None if end is None else as_scalar_ns(end)
+
+    index = None
+    first_chunk, last_chunk = 0, header['n_chunks']
+    if header.get('codec') or start_ns is not None or end_ns is not None:
+        index = _map(
+            filename, INDEX_DTYPE, data_start + offsets['index'],
+            (header['n_chunks'],)
+        )
+        if start_ns is not None:
+            first_chunk = int(np.searchsorted(index['t_last'], start_ns, side='left'))
+        if end_ns is not None:
+            last_chunk = int(np.searchsorted(index['t_first'], end_ns, side='left'))
+        last_chunk = max(first_chunk, last_chunk)
+
+    if header.get('codec'):
+        columns = _decode_chunks(
+            filename, header, data_start, index, range(first_chunk, last_chunk)
+        )
+    else:
+        columns = {
+            name: _map(filename, dtype, data_start + offsets[name], (count,))
+            for name, dtype in COLUMN_DTYPES.items()
+        }
+        if index is not None:
+            starts = np.append(index['row_start'], count)
+            lo = int(starts[min(first_chunk, len(index))])
+            hi = int(starts[min(last_chunk, len(index))])
+            columns = {name: array[lo:hi] for name, array in columns.items()}
+
+    # Trim partial chunks at either end of the range
+    lo, hi = 0, len(columns['timestamps'])
+    if start_ns is not None:
+        head = columns['timestamps'][:header['chunk_size']]
+        lo = int(np.searchsorted(head, start_ns))
+    if end_ns is not None:
+        tail = max(lo, hi - header['chunk_size'])
+        hi = tail + int(np.searchsorted(columns['timestamps'][tail:hi], end_ns))
+
+    return TimeSeries._from_columns(
+        header['sensor_id'], header['bridge_id'],
+        columns['timestamps'][lo:hi],
+        columns['values'][lo:hi],
+        columns['quality'][lo:hi],
+        header.get('parameter'), header.get('unit', '')
+    )
@@ -11,7 +11,9 @@ from .core.sensor import (
     Accelerometer, StrainGauge, TemperatureSensor,
     CorrosionProbe, LVDT, Anemometer
 )
+from .acquisition.scheduler import AcquisitionScheduler
 from .analysis.processor import AnalysisProcessor
+from .analysis.streaming import StreamingProcessor
 from .api.app import start_api
 from .dashboard.app import start_dashboard
 
@@ -116,37 +118,38 @@ def load_bridge(bridge_id: str) -> Bridge:
     return create_test_bridge()
 
 
-def monitor_bridge(bridge: Bridge, duration: int):
-    """Continuous bridge monitoring."""
+def monitor_bridge(bridge: Bridge, duration: int, analysis_interval: float = 10.0):
+    """Continuous bridge monitoring.
+    
+    Every sensor is acquired at its own sampling rate by the acquisition
+    scheduler; the blocks collected are fed to a streaming processor every
+    ``analysis_interval`` seconds.
+    """
     import time
+    from concurrent.futures import ThreadPoolExecutor
     
     logger.info(f"Starting continuous monitoring for {duration} seconds")
     logger.info("Press Ctrl+C to stop")
     
-    processor = AnalysisProcessor(bridge)
+    processor = StreamingProcessor(bridge)
+    collected = []
+    
+    def collect(sensor, block):
+        collected.append((sensor, block))
+    
+    executor = ThreadPoolExecutor(max_workers=max(1, len(bridge.sensors)))
+    scheduler = AcquisitionScheduler(
+        bridge.sensors, on_block=collect, executor=executor
+    )
     
     try:
-        start_time = time.time()
-        while time.time() - start_time < duration:
-            # Read sensors
-            measurements = []
-            for sensor in bridge.sensors:
-                try:
-                    value = sensor.read()
-                    from .core.measurement import Measurement
-                    m = Measurement(
-                        sensor_id=sensor.sensor_id,
-                        bridge_id=bridge.specs.bridge_id,
-                        timestamp=datetime.now(),
-                        value=value,
-                        unit="unknown"
-                    )
-                    measurements.append(m)
-                except Exception as e:
-                    logger.error(f"Error reading sensor {sensor.sensor_id}: {e}")
+        end_time = time.time() + duration
+        while time.time() < end_time:
+            scheduler.run(duration=min(analysis_interval, end_time - time.time()))
             
             # Analyze
-            status = processor.analyze(measurements)
+            status = processor.process(collected)
+            collected.clear()
             
             # Check alerts
             alerts = bridge.check_alerts()
@@ -155,12 +158,13 @@ def monitor_bridge(bridge: Bridge, duration: int):
             print(f"\n[{status.timestamp.strftime('%H:%M:%S')}] "
                   f"Health: {status.overall_health:.1f}% "
                   f"Risk: {status.risk_level}")
-            
-            time.sleep(10)  # Monitor every 10 seconds
     
     except KeyboardInterrupt:
         logger.info("Monitoring stopped by user")
     
+    finally:
+        executor.shutdown(wait=False)
+    
     logger.info("Monitoring complete")
 
 
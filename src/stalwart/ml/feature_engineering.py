@@ -4,6 +4,8 @@ import numpy as np
 from typing import List, Dict, Any, Optional, Tuple
 from datetime import datetime
 
+from ..core.measurement import TimeSeries, from_epoch_ns
+from ..core.alignment import AlignedFrame
 from ..utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -138,39 +140,43 @@ class SensorFusion:
     def create_synchronized_matrix(
         self,
         sensor_data: Dict[str, np.ndarray],
-        timestamps: Dict[str, List[datetime]]
+        timestamps: Dict[str, List[datetime]],
+        tolerance: Optional[float] = None
     ) -> Tuple[np.ndarray, List[datetime]]:
         """
         Create synchronized data matrix from multiple sensors.
         
+        Every sensor is as-of joined onto the clock of the first sensor,
+        over the time range all sensors cover.  Ticks where some sensor
+        has no sample within tolerance are dropped.
+        
         Args:
             sensor_data: Dictionary mapping sensor type to data array
             timestamps: Dictionary mapping sensor type to timestamps
+            tolerance: Maximum sample age in seconds; defaults to the
+                slowest sensor's median sampling period
         
         Returns:
             Tuple of (synchronized_data_matrix, common_timestamps)
         """
-        # Find common time range
-        all_times = []
-        for sensor, times in timestamps.items():
-            all_times.extend(times)
-        
-        if not all_times:
+        if not sensor_data or not any(len(t) for t in timestamps.values()):
             return np.array([]), []
         
-        # Convert timestamps to numeric
-        numeric_times = {}
-        for sensor, times in timestamps.items():
-            numeric_times[sensor] = np.array([t.timestamp() for t in times])
-        
-        # Use minimum length as common
-        min_len = min(len(data) for data in sensor_data.values())
+        series = {
+            sensor: TimeSeries.from_arrays(
+                sensor, "", timestamps[sensor], data, copy=False
+            )
+            for sensor, data in sensor_data.items()
+        }
         
-        # Truncate all to same length
-        synchronized_data = []
-        for sensor, data in sensor_data.items():
-            synchronized_data.append(data[:min_len])
+        if tolerance is None:
+            periods = [
+                np.median(np.diff(ts.timestamps_ns))
+                for ts in series.values() if len(ts) > 1
+            ]
+            tolerance = max(periods) / 1e9 if periods else None
         
-        common_times = list(timestamps[list(timestamps.keys())[0]])[:min_len]
+        frame = AlignedFrame.from_series(series, tolerance=tolerance).complete_rows()
+        common_times = [from_epoch_ns(t) for t in frame.timestamps_ns.tolist()]
         
-        return np.array(synchronized_data).T, common_times
+        return frame.values, common_times
@@ -0,0 +1,13 @@
+"""Accelerated bridge deterioration simulation."""
+
+from .scenarios import (
+    BridgeState, Scenario, FlutterScenario, CorrosionScenario,
+    FatigueScenario, ThermalScenario, SCENARIOS, ScenarioResult,
+    create_simulated_bridge, run_scenario
+)
+
+__all__ = [
+    'BridgeState', 'Scenario', 'FlutterScenario', 'CorrosionScenario',
+    'FatigueScenario', 'ThermalScenario', 'SCENARIOS', 'ScenarioResult',
+    'create_simulated_bridge', 'run_scenario'
+]
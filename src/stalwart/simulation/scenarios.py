@@ -0,0 +1,478 @@
+"""Accelerated deterioration scenarios.
+
+A scenario evolves the physical state of a bridge (wind, chloride
+ingress, fatigue damage, bearing seizure) over months of simulated time.
+At every step it pushes that state into the simulated sensor drivers,
+generates a short analysis window of vectorized signals at full sampling
+rate, and feeds it block by block to a :class:`StreamingProcessor`.  Only
+the analysis windows are synthesized, not the hours between them, which
+is what makes a run faster than real time.
+
+The early warning is the processor's: each step records the status of
+the metric the scenario should move (:attr:`Scenario.metric`) as the
+pipeline computed it from the sensor data.  The scenario's own indicator
+(AFC, CCF, ALSA or LTS, computed from the simulated state) is recorded
+alongside as the reference the detection lags behind.
+"""
+
+import math
+import time
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from ..analysis.metrics import (
+    STATUSES, MetricResult, calculate_afc, calculate_ccf, calculate_lts
+)
+from ..analysis.streaming import StreamingProcessor
+from ..acquisition.drivers import SampleBlock, SimulatedDriver
+from ..acquisition.scheduler import BLOCK_DURATION
+from ..acquisition.sensors import (
+    DEFAULT_MODES, Mode, ModalDriver, TrafficStrainDriver, TemperatureDriver
+)
+from ..core.bridge import Bridge, BridgeSpecs
+from ..core.measurement import to_epoch_ns
+from ..core.sensor import (
+    Accelerometer, Sensor, StrainGauge, TemperatureSensor, Anemometer
+)
+from ..utils.constants import THRESHOLDS
+from ..utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+HOURS_PER_YEAR = 8766.0
+
+# Design values shared by the scenarios
+DESIGN_DAMPING = 0.024
+DESIGN_AMPLITUDE = 0.1
+INSTALL_TEMPERATURE = 15.0
+DEFAULT_FLUTTER_SPEED = 70.0  # m/s, when the specs give none
+
+SIMULATION_START = datetime(2026, 1, 1)
+
+
+@dataclass
+class BridgeState:
+    """Physical state evolved by a scenario."""
+    stiffness_loss: float = 0.0
+    damping_change: float = 0.0  # added to every modal damping ratio
+    wind_speed: float = 5.0  # m/s
+    temperature: float = INSTALL_TEMPERATURE  # deg C, daily mean
+    chloride: float = 0.05  # % by mass of cement at rebar depth
+    fatigue_damage: float = 0.0  # Miner sum
+    joint_efficiency: float = 1.0  # fraction of free thermal expansion
+
+
+def graded(parameter: str, value: float) -> str:
+    """Status of a value against THRESHOLDS (higher is worse)."""
+    thresholds = THRESHOLDS[parameter]
+    if value < thresholds['warning']:
+        return "SAFE"
+    if value < thresholds['caution']:
+        return "WARNING"
+    if value < thresholds['critical']:
+        return "CAUTION"
+    return "CRITICAL"
+
+
+class Scenario(ABC):
+    """Base class: state evolution plus the indicator it drives.
+
+    ``parameter`` names the indicator computed from the simulated state,
+    ``metric`` the processor metric expected to detect the deterioration
+    from the sensor data.
+    """
+    name = ""
+    parameter = ""
+    metric = ""
+
+    @abstractmethod
+    def evolve(self, state: BridgeState, hours: float, step: float, total: float,
+               rng: np.random.Generator, bridge: Bridge):
+        """Advance ``state`` by ``step`` hours from ``hours`` elapsed of ``total``."""
+
+    @abstractmethod
+    def indicator(self, state: BridgeState, bridge: Bridge) -> MetricResult:
+        """The scenario's indicator for ``state``."""
+
+
+class FlutterScenario(Scenario):
+    """Storm season with mean wind rising towards the flutter speed.
+
+    Aerodynamic damping cancels structural damping as ``(U / U_cr)**2``.
+    """
+    name = "flutter"
+    parameter = "AFC"
+    metric = "TVR"
+
+    def __init__(self, start_wind: float = 8.0, end_fraction: float = 0.75):
+        self.start_wind = start_wind
+        self.end_fraction = end_fraction
+
+    def evolve(self, state, hours, step, total, rng, bridge):
+        critical = bridge.specs.critical_flutter_speed or DEFAULT_FLUTTER_SPEED
+        target = self.end_fraction * critical
+        mean = self.start_wind + (target - self.start_wind) * hours / total
+        state.wind_speed = max(0.0, mean * (1 + 0.15 * rng.standard_normal()))
+        ratio = min(1.0, (state.wind_speed / critical) ** 2)
+        state.damping_change = -DESIGN_DAMPING * ratio
+
+    def indicator(self, state, bridge):
+        damping = max(1e-3, DESIGN_DAMPING + state.damping_change)
+        return calculate_afc(
+            wind_speed=state.wind_speed,
+            vertical_amplitude=DESIGN_AMPLITUDE * DESIGN_DAMPING / damping,
+            damping_ratio=damping,
+            frequency=modal_frequency(bridge),
+            critical_flutter_speed=(
+                bridge.specs.critical_flutter_speed or DEFAULT_FLUTTER_SPEED
+            ),
+            design_amplitude=DESIGN_AMPLITUDE,
+            design_damping=DESIGN_DAMPING,
+            design_frequency=modal_frequency(bridge, damaged=False)
+        )
+
+
+class CorrosionScenario(Scenario):
+    """Chloride ingress by Fick diffusion, then section loss after initiation.
+
+    Diffusivity is set for aggressive (splash zone, de-icing salt) exposure
+    so initiation falls inside a multi-month run.
+    """
+    name = "corrosion"
+    parameter = "CCF"
+    metric = "FFD"
+
+    def __init__(self, surface_chloride: float = 0.6, cover: float = 0.05,
+                 diffusivity: float = 5e-11, initiation: float = 0.4,
+                 section_loss_rate: float = 0.03):
+        self.surface_chloride = surface_chloride
+        self.cover = cover  # m
+        self.diffusivity = diffusivity  # m^2/s
+        self.initiation = initiation  # % chloride
+        self.section_loss_rate = section_loss_rate  # per year after initiation
+
+    def evolve(self, state, hours, step, total, rng, bridge):
+        seconds = (hours + step) * 3600.0
+        depth = self.cover / (2 * math.sqrt(self.diffusivity * seconds))
+        state.chloride = max(state.chloride, self.surface_chloride * math.erfc(depth))
+        if state.chloride >= self.initiation:
+            loss = self.section_loss_rate * step / HOURS_PER_YEAR
+            state.stiffness_loss = min(0.5, state.stiffness_loss + loss)
+
+    def indicator(self, state, bridge):
+        return calculate_ccf(chloride_concentration=state.chloride)
+
+
+class FatigueScenario(Scenario):
+    """Miner damage from truck cycles, accelerating once cracks form."""
+    name = "fatigue"
+    parameter = "ALSA"
+    metric = "FFD"
+
+    def __init__(self, damage_per_year: float = 0.4, crack_growth: float = 3.0):
+        self.damage_per_year = damage_per_year
+        self.crack_growth = crack_growth
+
+    def evolve(self, state, hours, step, total, rng, bridge):
+        growth = 1 + self.crack_growth * state.fatigue_damage
+        rate = self.damage_per_year / HOURS_PER_YEAR * growth
+        state.fatigue_damage += rate * step * rng.lognormal(0.0, 0.2)
+        # Cracked sections lose stiffness once Miner damage passes one half
+        state.stiffness_loss = min(0.5, 0.2 * max(0.0, state.fatigue_damage - 0.5))
+
+    def indicator(self, state, bridge):
+        value = state.fatigue_damage
+        return MetricResult(value, graded('ALSA', value), 0.8, {'miner_sum': value})
+
+
+class ThermalScenario(Scenario):
+    """Continental seasonal temperature swing against a seizing bearing."""
+    name = "thermal"
+    parameter = "LTS"
+    metric = "LTS"
+
+    def __init__(self, annual_mean: float = 8.0, annual_amplitude: float = 20.0,
+                 seizure_per_year: float = 0.85, span_fraction: float = 0.5):
+        self.annual_mean = annual_mean
+        self.annual_amplitude = annual_amplitude
+        self.seizure_per_year = seizure_per_year
+        self.span_fraction = span_fraction  # expanding length / span
+
+    def evolve(self, state, hours, step, total, rng, bridge):
+        season = 2 * math.pi * (hours / HOURS_PER_YEAR - 0.3)  # coldest in mid-January
+        state.temperature = (self.annual_mean
+                             + self.annual_amplitude * math.sin(season)
+                             + rng.normal(0, 2))
+        seizure = self.seizure_per_year * step / HOURS_PER_YEAR
+        state.joint_efficiency = max(0.0, state.joint_efficiency - seizure)
+
+    def indicator(self, state, bridge):
+        delta = abs(state.temperature - INSTALL_TEMPERATURE)
+        span = bridge.specs.span_length * self.span_fraction
+        expected = 12e-6 * delta * span * 1000  # mm
+        return calculate_lts(delta, expected * state.joint_efficiency, expected)
+
+
+SCENARIOS: Dict[str, Callable[[], Scenario]] = {
+    'flutter': FlutterScenario,
+    'corrosion': CorrosionScenario,
+    'fatigue': FatigueScenario,
+    'thermal': ThermalScenario,
+}
+
+
+@dataclass
+class ScenarioResult:
+    """Per-step trace of a scenario run.
+
+    ``detected``/``detected_status`` are the processor's value and status
+    of ``metric`` (NaN and "" on steps without a result);
+    ``indicator``/``indicator_status`` the scenario's own indicator.
+    """
+    scenario: str
+    parameter: str
+    metric: str
+    hours: np.ndarray
+    health: np.ndarray
+    risk: List[str]
+    detected: np.ndarray
+    detected_status: List[str]
+    indicator: np.ndarray
+    indicator_status: List[str]
+    wall_time: float
+    samples: int = 0
+    states: List[Dict[str, Any]] = field(default_factory=list)
+
+    @property
+    def simulated_hours(self) -> float:
+        return float(self.hours[-1]) if len(self.hours) else 0.0
+
+    @property
+    def throughput(self) -> float:
+        """Simulated hours per wall-clock second."""
+        if self.wall_time <= 0:
+            return float('inf')
+        return self.simulated_hours / self.wall_time
+
+    def _first(self, statuses: List[str], levels: Tuple[str, ...]) -> Optional[float]:
+        for h, status in zip(self.hours, statuses):
+            if status in levels:
+                return float(h)
+        return None
+
+    @property
+    def first_warning_hours(self) -> Optional[float]:
+        """Simulated hours until the processor's metric first left SAFE."""
+        return self._first(self.detected_status, STATUSES[1:])
+
+    @property
+    def first_critical_hours(self) -> Optional[float]:
+        return self._first(self.detected_status, ("CRITICAL",))
+
+    @property
+    def indicator_warning_hours(self) -> Optional[float]:
+        """Simulated hours until the scenario's indicator first left SAFE."""
+        return self._first(self.indicator_status, STATUSES[1:])
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'scenario': self.scenario,
+            'parameter': self.parameter,
+            'metric': self.metric,
+            'simulated_hours': self.simulated_hours,
+            'wall_time': self.wall_time,
+            'throughput': self.throughput,
+            'samples': self.samples,
+            'first_warning_hours': self.first_warning_hours,
+            'first_critical_hours': self.first_critical_hours,
+            'indicator_warning_hours': self.indicator_warning_hours,
+            'final_health': float(self.health[-1]) if len(self.health) else None,
+            'final_risk': self.risk[-1] if self.risk else None
+        }
+
+
+def create_simulated_bridge(seed: Optional[int] = None) -> Bridge:
+    """Test bridge whose sensors use seeded synthetic drivers.
+
+    The accelerometers sit at fifths of the span and share one excitation
+    seed, so they see one coherent response; each scales the modes by the
+    simply supported mode shape ``sin(k pi x / L)`` at its position.
+    """
+    specs = BridgeSpecs(
+        name="Simulated Bridge",
+        bridge_id="SIM-001",
+        bridge_type="suspension",
+        span_length=500.0,
+        year_built=2000,
+        critical_flutter_speed=70.0,
+        daily_traffic=50000,
+        truck_percentage=10.0
+    )
+    bridge = Bridge(specs)
+    rng = np.random.default_rng(seed)
+
+    def child_seed():
+        return int(rng.integers(2 ** 32))
+
+    excitation_seed = child_seed()
+    for i in range(4):
+        x = (i + 1) / 5
+        modes = [
+            Mode(m.frequency, m.damping, m.amplitude * math.sin(k * math.pi * x))
+            for k, m in enumerate(DEFAULT_MODES, start=1)
+        ]
+        bridge.add_sensor(Accelerometer(
+            f"ACC-00{i}", f"deck-{i}", history_capacity=16,
+            driver=ModalDriver(modes, seed=excitation_seed)
+        ))
+    for i in range(2):
+        bridge.add_sensor(StrainGauge(f"STR-00{i}", f"girder-{i}", history_capacity=16,
+                                      driver=TrafficStrainDriver(seed=child_seed())))
+    bridge.add_sensor(TemperatureSensor("TEMP-001", "deck", history_capacity=16,
+                                        driver=TemperatureDriver(seed=child_seed())))
+    bridge.add_sensor(Anemometer("WIND-001", "mid-span", history_capacity=16,
+                                 driver=SimulatedDriver(0.0, 10.0, seed=child_seed())))
+    return bridge
+
+
+def modal_frequency(bridge: Bridge, damaged: bool = True) -> float:
+    """Fundamental frequency of the bridge's first modal driver (1 Hz if none)."""
+    for sensor in bridge.sensors:
+        if isinstance(sensor.driver, ModalDriver):
+            modes = sensor.driver.current_modes if damaged else sensor.driver.modes
+            return modes[0].frequency
+    return 1.0
+
+
+def _apply_state(bridge: Bridge, state: BridgeState):
+    """Push the scenario state into the simulated drivers."""
+    for sensor in bridge.sensors:
+        driver = sensor.driver
+        if isinstance(driver, (ModalDriver, TrafficStrainDriver)):
+            driver.set_damage(state.stiffness_loss, state.damping_change)
+        if isinstance(driver, TrafficStrainDriver):
+            driver.temperature_mean = state.temperature
+        elif isinstance(driver, TemperatureDriver):
+            driver.mean = state.temperature
+        elif (sensor.specs.sensor_type == 'anemometer'
+              and isinstance(driver, SimulatedDriver)):
+            driver.range_min = 0.85 * state.wind_speed
+            driver.range_max = 1.15 * state.wind_speed
+
+
+def _acquire(
+    bridge: Bridge, window: float, start_ns: int
+) -> List[Tuple[Sensor, SampleBlock]]:
+    """
+    ``window`` seconds of every sensor from ``start_ns``, in acquisition order.
+
+    Each sensor's window is synthesized in one vectorized read, then cut
+    into the blocks an :class:`~stalwart.acquisition.scheduler.AcquisitionScheduler`
+    would have delivered and ordered by the time they fall due.
+    """
+    due = []
+    for index, sensor in enumerate(bridge.sensors):
+        rate = sensor.specs.sampling_rate
+        block = sensor.read_samples(max(1, int(window * rate)), rate, start_ns)
+        size = max(1, int(round(rate * BLOCK_DURATION)))
+        period = block.sample_period_ns
+        for i in range(0, len(block), size):
+            part = SampleBlock(
+                block.values[i:i + size], block.start_time_ns + i * period, period
+            )
+            due.append((part.end_time_ns, index, sensor, part))
+    due.sort(key=lambda item: item[:2])
+    return [(sensor, part) for _, _, sensor, part in due]
+
+
+def _detected(
+    processor: StreamingProcessor, metric: str, since_ns: int
+) -> Tuple[float, str]:
+    """Value and status of ``metric`` if the processor rated it since ``since_ns``."""
+    history = processor.metrics_history.get(metric)
+    latest = history.latest if history is not None else None
+    if latest is None or int(latest['timestamp']) < since_ns or latest['status'] < 0:
+        return math.nan, ""
+    return float(latest['value']), STATUSES[latest['status']]
+
+
+def run_scenario(
+    scenario: str,
+    duration_days: float = 540.0,
+    step_hours: float = 12.0,
+    window: float = 60.0,
+    seed: Optional[int] = None,
+    bridge: Optional[Bridge] = None
+) -> ScenarioResult:
+    """Run a deterioration scenario faster than real time.
+
+    Args:
+        scenario: 'flutter', 'corrosion', 'fatigue' or 'thermal'
+        duration_days: Simulated duration
+        step_hours: Simulated time between analyses
+        window: Seconds of full-rate sensor data generated per analysis
+        seed: Seed for the state evolution and the sensor drivers
+        bridge: Bridge with simulated drivers (default
+            :func:`create_simulated_bridge`)
+    """
+    if scenario not in SCENARIOS:
+        raise ValueError(
+            f"Unknown scenario {scenario!r}; expected one of {sorted(SCENARIOS)}"
+        )
+    if step_hours <= 0 or duration_days <= 0:
+        raise ValueError("duration_days and step_hours must be positive")
+
+    model = SCENARIOS[scenario]()
+    bridge = bridge or create_simulated_bridge(seed)
+    processor = StreamingProcessor(bridge, window=window)
+    rng = np.random.default_rng(seed)
+    state = BridgeState()
+
+    total = duration_days * 24.0
+    n_steps = int(math.ceil(total / step_hours))
+    start_ns = to_epoch_ns(SIMULATION_START)
+    hours = np.empty(n_steps)
+    health = np.empty(n_steps)
+    detected = np.empty(n_steps)
+    indicator = np.empty(n_steps)
+    risk, detected_status, indicator_status, states = [], [], [], []
+    samples = 0
+
+    wall_start = time.perf_counter()
+    for k in range(n_steps):
+        elapsed = k * step_hours
+        step = min(step_hours, total - elapsed)
+        model.evolve(state, elapsed, step, total, rng, bridge)
+        _apply_state(bridge, state)
+
+        window_start = start_ns + int((elapsed + step) * 3600e9)
+        blocks = _acquire(bridge, window, window_start)
+        samples += sum(len(block) for _, block in blocks)
+        status = processor.process(blocks)
+        result = model.indicator(state, bridge)
+
+        hours[k] = elapsed + step
+        health[k] = status.overall_health
+        risk.append(status.risk_level)
+        detected[k], metric_status = _detected(processor, model.metric, window_start)
+        detected_status.append(metric_status)
+        indicator[k] = result.value
+        indicator_status.append(result.status)
+        states.append(dict(vars(state)))
+
+    wall_time = time.perf_counter() - wall_start
+    run = ScenarioResult(
+        scenario, model.parameter, model.metric, hours, health, risk, detected,
+        detected_status, indicator, indicator_status, wall_time, samples, states
+    )
+    logger.info(
+        f"Scenario {scenario}: {run.simulated_hours:.0f} simulated hours "
+        f"in {wall_time:.1f} s ({run.throughput:.0f} simulated h/s), "
+        f"first {run.metric} warning at {run.first_warning_hours} h "
+        f"({run.parameter} at {run.indicator_warning_hours} h)"
+    )
+    return run
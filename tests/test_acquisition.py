@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+"""Tests for STALWART acquisition modules."""
+
+import sys
+import unittest
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.stalwart.core.sensor import Accelerometer, StrainGauge, CorrosionProbe
+from src.stalwart.acquisition.scheduler import AcquisitionScheduler
+from src.stalwart.acquisition.sensors import (
+    Mode, ModalDriver, TrafficStrainDriver, TemperatureDriver
+)
+import numpy as np
+
+
+class FakeClock:
+    """Deterministic epoch-ns clock advanced by sleep()."""
+
+    def __init__(self, now_ns: int = 1_700_000_000_000_000_000):
+        self.now_ns = now_ns
+
+    def __call__(self) -> int:
+        return self.now_ns
+
+    def sleep(self, seconds: float):
+        self.now_ns += int(round(seconds * 1e9))
+
+
+class TestAcquisitionScheduler(unittest.TestCase):
+    """Test the multi-rate acquisition scheduler."""
+
+    def setUp(self):
+        self.clock = FakeClock()
+        self.blocks = {}
+        self.sensors = [
+            Accelerometer("ACC-001"),        # 100 Hz
+            StrainGauge("STR-001"),          # 10 Hz
+            CorrosionProbe("CORR-001")       # 0.01 Hz
+        ]
+        self.scheduler = AcquisitionScheduler(
+            self.sensors,
+            on_block=lambda sensor, block: (
+                self.blocks.setdefault(sensor.sensor_id, []).append(block)
+            ),
+            clock=self.clock,
+            sleep=self.clock.sleep
+        )
+
+    def test_block_sizes(self):
+        """Test per-channel block sizes follow the sampling rates."""
+        sizes = {c.sensor.sensor_id: c.block_size for c in self.scheduler.channels}
+        self.assertEqual(sizes, {"ACC-001": 100, "STR-001": 10, "CORR-001": 1})
+
+    def test_run(self):
+        """Test each channel is sampled at its own rate with contiguous blocks."""
+        self.scheduler.run(duration=200.5)
+
+        self.assertEqual(len(self.blocks["ACC-001"]), 200)
+        self.assertEqual(len(self.blocks["STR-001"]), 200)
+        self.assertEqual(len(self.blocks["CORR-001"]), 2)
+        self.assertTrue(all(len(b) == 100 for b in self.blocks["ACC-001"]))
+
+        timestamps = np.concatenate([b.timestamps_ns for b in self.blocks["ACC-001"]])
+        np.testing.assert_array_equal(np.diff(timestamps), 10_000_000)
+        self.assertEqual(self.sensors[2].history.stats.count, 2)
+
+    def test_co_due_batch(self):
+        """Test channels due at the same instant are read in one poll."""
+        self.scheduler.start()
+        self.clock.sleep(1.0)
+        read = self.scheduler.poll()
+        self.assertEqual(sorted(s.sensor_id for s, _ in read), ["ACC-001", "STR-001"])
+        self.assertEqual(self.scheduler.next_due_ns, self.clock() + 1_000_000_000)
+
+    def test_catch_up(self):
+        """Test a late channel catches up without gaps."""
+        self.scheduler.start()
+        self.clock.sleep(3.0)
+        for _ in range(3):
+            self.scheduler.poll()
+
+        acc = self.scheduler.channels[0]
+        self.assertEqual(acc.blocks_read, 3)
+        self.assertEqual(acc.late_blocks, 2)
+        starts = [b.start_time_ns for b in self.blocks["ACC-001"]]
+        np.testing.assert_array_equal(np.diff(starts), 1_000_000_000)
+
+
+def peak_frequency(values, fs, lo, hi):
+    """Frequency of the largest smoothed spectral peak in [lo, hi]."""
+    freqs = np.fft.rfftfreq(len(values), 1 / fs)
+    power = np.convolve(np.abs(np.fft.rfft(values)) ** 2, np.ones(32) / 32, 'same')
+    band = (freqs > lo) & (freqs < hi)
+    return freqs[band][np.argmax(power[band])]
+
+
+class TestSimulatedDrivers(unittest.TestCase):
+    """Test the synthetic bridge signal generators."""
+
+    def test_modal_driver(self):
+        """Test modal peaks and damage-induced frequency drop."""
+        driver = ModalDriver([Mode(1.5, 0.02, 0.01), Mode(4.0, 0.02, 0.005)], seed=1)
+        block = driver.read_block(2 ** 17, 100.0, 0)
+        self.assertEqual(len(block), 2 ** 17)
+        self.assertAlmostEqual(
+            peak_frequency(block.values, 100.0, 1.0, 2.5), 1.5, delta=0.05
+        )
+        self.assertAlmostEqual(
+            peak_frequency(block.values, 100.0, 3.0, 5.0), 4.0, delta=0.1
+        )
+
+        driver.inject_damage(stiffness_loss=0.19, onset_ns=block.end_time_ns)
+        damaged = driver.read_block(2 ** 17, 100.0, block.end_time_ns)
+        self.assertAlmostEqual(
+            peak_frequency(damaged.values, 100.0, 1.0, 2.5), 1.35, delta=0.05
+        )
+        with self.assertRaises(ValueError):
+            driver.inject_damage(stiffness_loss=0.9)
+
+    def test_traffic_strain(self):
+        """Test traffic pulses, thermal strain and damage amplification."""
+        settings = dict(
+            traffic_rate=0.2, noise_std=0.0, thermal_coefficient=0.0, seed=1
+        )
+        driver = TrafficStrainDriver(**settings)
+        values = driver.read_block(36000, 10.0, 0).values
+        self.assertGreater(values.max(), 10.0)
+        self.assertGreaterEqual(values.min(), 0.0)
+
+        damaged = TrafficStrainDriver(**settings)
+        damaged.inject_damage(stiffness_loss=0.5)
+        np.testing.assert_allclose(
+            damaged.read_block(36000, 10.0, 0).values, 2 * values
+        )
+
+        thermal = TrafficStrainDriver(traffic_rate=0.0, noise_std=0.0, seed=1)
+        day = thermal.read_block(24 * 60, 1 / 60, 0).values
+        self.assertAlmostEqual(day.max() - day.min(), 2 * 8.0 * 4.0, delta=0.5)
+
+    def test_temperature(self):
+        """Test the diurnal temperature cycle."""
+        driver = TemperatureDriver(noise_std=0.0)
+        values = driver.read_block(24, 1 / 3600, 0).values  # hourly, from midnight UTC
+        self.assertEqual(int(np.argmax(values)), 15)
+        self.assertAlmostEqual(values.max(), 23.0, places=3)
+
+    def test_sensor_defaults(self):
+        """Test sensors use the realistic drivers by default."""
+        self.assertIsInstance(Accelerometer("ACC-001").driver, ModalDriver)
+        self.assertIsInstance(StrainGauge("STR-001").driver, TrafficStrainDriver)
+
+
+if __name__ == '__main__':
+    unittest.main()
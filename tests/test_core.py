@@ -2,6 +2,9 @@
 """Tests for STALWART core modules."""
 
 import sys
+import os
+import json
+import tempfile
 import unittest
 from pathlib import Path
 
@@ -14,7 +17,12 @@ from src.stalwart.core.sensor import (
     CorrosionProbe, LVDT, Anemometer, SensorArray
 )
 from src.stalwart.core.measurement import Measurement, TimeSeries
-from datetime import datetime
+from src.stalwart.core.alignment import AlignedFrame
+from src.stalwart.core.codec import (
+    encode_timestamps, decode_timestamps, encode_floats, decode_floats
+)
+from datetime import datetime, timedelta
+import numpy as np
 
 
 class TestBridge(unittest.TestCase):
@@ -114,6 +122,61 @@ class TestSensors(unittest.TestCase):
         value = sensor.read()
         self.assertIsNotNone(value)
     
+    def test_reading_history(self):
+        """Test ring-buffer history and running statistics."""
+        sensor = TemperatureSensor("TEMP-001", "deck", history_capacity=50)
+        values = [sensor.read() for _ in range(120)]
+        
+        self.assertEqual(len(sensor.history), 50)
+        timestamps, latest = sensor.latest(10)
+        np.testing.assert_array_equal(latest, values[-10:])
+        self.assertEqual(len(sensor.readings), 50)
+        self.assertEqual(sensor.readings[-1][1], values[-1])
+        
+        health = sensor.check_health()
+        self.assertEqual(health['readings_count'], 50)
+        self.assertEqual(health['statistics']['count'], 120)
+        self.assertAlmostEqual(health['statistics']['mean'], np.mean(values))
+        self.assertAlmostEqual(health['statistics']['variance'], np.var(values, ddof=1))
+        self.assertEqual(health['statistics']['max'], max(values))
+        
+        sensor.reset()
+        self.assertEqual(len(sensor.history), 0)
+    
+    def test_read_block(self):
+        """Test vectorized block acquisition."""
+        sensor = Accelerometer("ACC-001", "mid-span", history_capacity=500)
+        block = sensor.read_block(2.0)
+        
+        self.assertEqual(len(block), 200)
+        self.assertEqual(block.sample_period_ns, 10_000_000)
+        self.assertTrue(np.all(block.values >= sensor.specs.range_min))
+        self.assertTrue(np.all(block.values <= sensor.specs.range_max))
+        np.testing.assert_array_equal(np.diff(block.timestamps_ns), 10_000_000)
+        
+        timestamps, values = sensor.latest()
+        np.testing.assert_array_equal(values, block.values)
+        np.testing.assert_array_equal(timestamps, block.timestamps_ns)
+        self.assertEqual(sensor.last_reading, block.values[-1])
+        self.assertEqual(sensor.history.stats.count, 200)
+        
+        self.assertEqual(len(sensor.read_batch(1.0, 100)), 100)
+        self.assertEqual(len(sensor.history), 300)
+        
+        ts = block.to_timeseries(sensor.sensor_id)
+        self.assertEqual(len(ts), 200)
+    
+    def test_driver_interface(self):
+        """Test a driver without read_block cannot be created."""
+        from src.stalwart.acquisition.drivers import SensorDriver
+        
+        class IncompleteDriver(SensorDriver):
+            def read(self):
+                return 0.0
+        
+        with self.assertRaises(TypeError):
+            IncompleteDriver()
+    
     def test_sensor_array(self):
         """Test sensor array."""
         array = SensorArray("ARRAY-001")
@@ -123,6 +186,43 @@ class TestSensors(unittest.TestCase):
         readings = array.read_all()
         self.assertEqual(len(readings), 2)
         self.assertIn("ACC-001", readings)
+        array.close()
+    
+    def test_sensor_array_deadlines(self):
+        """Test concurrent reads with a late and a failing sensor."""
+        import threading
+        from src.stalwart.acquisition.drivers import SimulatedDriver
+        
+        release = threading.Event()
+        
+        class StuckDriver(SimulatedDriver):
+            def read(self):
+                release.wait(5)
+                return super().read()
+        
+        class FailingDriver(SimulatedDriver):
+            def read(self):
+                raise IOError("bus error")
+        
+        array = SensorArray("ARRAY-001", timeout=0.2)
+        array.add_sensor(Accelerometer("ACC-001"))
+        array.add_sensor(Accelerometer("ACC-002", driver=StuckDriver(-1, 1)))
+        array.add_sensor(Accelerometer("ACC-003", driver=FailingDriver(-1, 1)))
+        
+        try:
+            cycle = array.read_cycle()
+            self.assertIsNotNone(cycle.readings["ACC-001"])
+            self.assertIsNotNone(cycle.latency["ACC-001"])
+            self.assertEqual(sorted(cycle.missing), ["ACC-002", "ACC-003"])
+            self.assertEqual(cycle.errors["ACC-002"], "timeout")
+            self.assertLess(cycle.wall_time, 2.0)
+            
+            # The stuck read is not resubmitted while still running
+            cycle = array.read_cycle()
+            self.assertEqual(cycle.errors["ACC-002"], "previous read still in progress")
+        finally:
+            release.set()
+            array.close()
 
 
 class TestMeasurement(unittest.TestCase):
@@ -157,6 +257,218 @@ class TestMeasurement(unittest.TestCase):
         ts = TimeSeries("ACC-001", "TEST-001", measurements)
         self.assertEqual(len(ts.measurements), 10)
         self.assertEqual(len(ts.values), 10)
+    
+    def test_timeseries_columns(self):
+        """Test array-backed time series columns."""
+        base = datetime(2026, 1, 1)
+        measurements = [
+            Measurement(
+                "ACC-001", "TEST-001", base + timedelta(seconds=10 - i),
+                float(i), "m/s²"
+            )
+            for i in range(10)
+        ]
+        ts = TimeSeries("ACC-001", "TEST-001", measurements)
+        
+        self.assertEqual(ts.timestamps_ns.dtype, np.int64)
+        self.assertEqual(ts.values.dtype, np.float64)
+        self.assertEqual(ts.quality.dtype, np.float32)
+        self.assertTrue(np.all(np.diff(ts.timestamps_ns) > 0))
+        self.assertEqual(ts.values[0], 9.0)
+        self.assertEqual(ts.start_time, base + timedelta(seconds=1))
+        self.assertEqual(ts.duration, 9.0)
+        self.assertEqual(ts.unit, "m/s²")
+        
+        # values is a view, not a fresh copy
+        self.assertTrue(np.shares_memory(ts.values, ts.values))
+    
+    def test_timeseries_from_arrays(self):
+        """Test building a time series from arrays."""
+        t = np.arange(5, dtype=np.int64) * 10_000_000
+        ts = TimeSeries.from_arrays("ACC-001", "TEST-001", t, np.arange(5.0))
+        self.assertEqual(len(ts), 5)
+        self.assertTrue(np.all(ts.quality == 1.0))
+        self.assertEqual(ts.measurements[2].value, 2.0)
+    
+    def test_timeseries_resample(self):
+        """Test bucketed resampling kernels."""
+        # 100 Hz for 3 seconds
+        t = np.arange(300, dtype=np.int64) * 10_000_000
+        v = np.arange(300, dtype=float)
+        ts = TimeSeries.from_arrays("ACC-001", "TEST-001", t, v)
+        
+        resampled = ts.resample('1s')
+        self.assertEqual(len(resampled), 3)
+        self.assertAlmostEqual(resampled.values[0], 49.5)
+        self.assertEqual(resampled.timestamps_ns[1], 1_000_000_000)
+        
+        agg = ts.aggregate('1s')
+        np.testing.assert_array_equal(agg['count'], [100, 100, 100])
+        np.testing.assert_array_equal(agg['min'], [0, 100, 200])
+        np.testing.assert_array_equal(agg['max'], [99, 199, 299])
+        np.testing.assert_array_equal(agg['last'], [99, 199, 299])
+        self.assertAlmostEqual(agg['rms'][0], np.sqrt(np.mean(v[:100] ** 2)))
+        
+        with self.assertRaises(ValueError):
+            ts.resample('1fortnight')
+    
+    def test_timeseries_slicing(self):
+        """Test time-range slicing, tail and windows."""
+        t = np.arange(300, dtype=np.int64) * 10_000_000
+        ts = TimeSeries.from_arrays("ACC-001", "TEST-001", t, np.arange(300.0))
+        
+        part = ts.slice(50_000_000, 150_000_000)
+        self.assertEqual(len(part), 10)
+        self.assertEqual(part.values[0], 5.0)
+        self.assertTrue(np.shares_memory(part.values, ts.values))
+        
+        last = ts.tail('1s')
+        self.assertEqual(len(last), 100)
+        self.assertEqual(last.values[0], 200.0)
+        self.assertEqual(len(ts.tail(timedelta(minutes=10))), 300)
+        
+        self.assertEqual([len(w) for w in ts.windows('1s')], [100, 100, 100])
+        sliding = list(ts.windows('1s', step='500ms'))
+        self.assertEqual(len(sliding), 6)
+        self.assertEqual(sliding[1].values[0], 50.0)
+    
+    def test_timeseries_extend(self):
+        """Test in-order appends, late merges and de-duplication."""
+        ts = TimeSeries.from_arrays("ACC-001", "TEST-001", [0, 10, 20], [0.0, 1.0, 2.0])
+        
+        self.assertEqual(ts.extend_arrays([30, 40], [3.0, 4.0]), 2)
+        self.assertEqual(len(ts), 5)
+        
+        # Late batch interleaving with the tail, with one retransmission
+        added = ts.extend_arrays([35, 15, 20], [3.5, 1.5, 99.0])
+        self.assertEqual(added, 2)
+        np.testing.assert_array_equal(ts.timestamps_ns, [0, 10, 15, 20, 30, 35, 40])
+        np.testing.assert_array_equal(ts.values, [0.0, 1.0, 1.5, 2.0, 3.0, 3.5, 4.0])
+        
+        late = [Measurement("ACC-001", "TEST-001", datetime(2026, 1, 1), 7.0, "g")]
+        self.assertEqual(ts.extend(late), 1)
+        self.assertEqual(ts.extend(late), 0)
+        
+        with self.assertRaises(ValueError):
+            ts.extend(TimeSeries.from_arrays("ACC-002", "TEST-001", [50], [5.0]))
+    
+    def test_timeseries_save_load(self):
+        """Test binary save/load round trip and range reads."""
+        t = np.arange(1000, dtype=np.int64) * 10_000_000
+        v = np.random.normal(0, 1, 1000)
+        ts = TimeSeries.from_arrays("ACC-001", "TEST-001", t, v, unit="g")
+        
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "acc.stw")
+            ts.save_to_file(path, chunk_size=64)
+            
+            loaded = TimeSeries.load_from_file(path)
+            self.assertEqual(loaded.sensor_id, "ACC-001")
+            self.assertEqual(loaded.unit, "g")
+            np.testing.assert_array_equal(loaded.values, v)
+            np.testing.assert_array_equal(loaded.timestamps_ns, t)
+            
+            window = TimeSeries.load_from_file(
+                path, start=2_000_000_000, end=3_005_000_000
+            )
+            self.assertEqual(len(window), 101)
+            self.assertEqual(window.timestamps_ns[0], 2_000_000_000)
+            np.testing.assert_array_equal(window.values, v[200:301])
+            del loaded, window
+    
+    def test_timeseries_load_legacy_json(self):
+        """Test loading the legacy JSON format."""
+        ts = TimeSeries("ACC-001", "TEST-001", [
+            Measurement("ACC-001", "TEST-001", datetime(2026, 1, 1), 1.5, "g")
+        ])
+        
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "acc.json")
+            with open(path, 'w') as f:
+                json.dump(ts.to_dict(), f)
+            
+            loaded = TimeSeries.load_from_file(path)
+            self.assertEqual(len(loaded), 1)
+            self.assertEqual(loaded.values[0], 1.5)
+    
+    def test_timeseries_to_dataframe(self):
+        """Test DataFrame conversion wraps the arrays."""
+        t = np.arange(10, dtype=np.int64) * 10_000_000
+        ts = TimeSeries.from_arrays("ACC-001", "TEST-001", t, np.arange(10.0))
+        df = ts.to_dataframe()
+        self.assertEqual(list(df.columns), ['value', 'quality'])
+        self.assertTrue(np.shares_memory(df['value'].to_numpy(), ts.values))
+    
+    def test_aligned_frame(self):
+        """Test as-of alignment of several series."""
+        fast = TimeSeries.from_arrays(
+            "ACC-001", "TEST-001", np.arange(0, 100, 10), np.arange(10.0)
+        )
+        slow = TimeSeries.from_arrays(
+            "TEMP-001", "TEST-001", np.arange(5, 200, 30), np.arange(7.0)
+        )
+        
+        frame = AlignedFrame.from_series([fast, slow])
+        self.assertEqual(frame.names, ["ACC-001", "TEMP-001"])
+        np.testing.assert_array_equal(frame.timestamps_ns, np.arange(10, 100, 10))
+        np.testing.assert_array_equal(
+            frame.column("TEMP-001")[:4], [0.0, 0.0, 0.0, 1.0]
+        )
+        
+        bounded = AlignedFrame.from_series([fast, slow], tolerance=10e-9)
+        self.assertTrue(np.isnan(bounded.column("TEMP-001")[1]))
+        self.assertLess(len(bounded.complete_rows()), len(bounded))
+        
+        grid = AlignedFrame.from_series([fast, slow], clock=20e-9)
+        np.testing.assert_array_equal(grid.timestamps_ns, [5, 25, 45, 65, 85])
+        self.assertEqual(grid.to_dataframe().shape, (5, 2))
+
+
+class TestCodec(unittest.TestCase):
+    """Test lossless time series codec."""
+    
+    def test_timestamps_roundtrip(self):
+        t = np.arange(5000, dtype=np.int64) * 10_000_000 + 1_700_000_000_000_000_000
+        t[100:] += 7  # one late sample shifts the rest
+        encoded = encode_timestamps(t)
+        self.assertLess(len(encoded), t.nbytes / 50)
+        np.testing.assert_array_equal(decode_timestamps(encoded, len(t)), t)
+    
+    def test_floats_roundtrip(self):
+        rng = np.random.default_rng(0)
+        cases = [
+            rng.normal(size=5000),
+            np.round(rng.normal(size=5000), 4),
+            np.ones(5000, dtype=np.float32),
+            np.array([0.25, -0.0, np.nan, np.inf, 1e-300] * 100),
+            np.empty(0),
+        ]
+        for values in cases:
+            decoded = decode_floats(encode_floats(values), values.dtype)
+            self.assertEqual(decoded.dtype, values.dtype)
+            np.testing.assert_array_equal(decoded.view(np.uint8), values.view(np.uint8))
+    
+    def test_quantized_values_compress(self):
+        rng = np.random.default_rng(0)
+        values = np.round(200 + 5 * rng.normal(size=10000), 1)
+        self.assertLess(len(encode_floats(values)), values.nbytes / 5)
+    
+    def test_compressed_file(self):
+        t = np.arange(1000, dtype=np.int64) * 10_000_000
+        v = np.round(np.sin(np.arange(1000) / 10), 3)
+        ts = TimeSeries.from_arrays("ACC-001", "TEST-001", t, v)
+        
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "acc.stw")
+            ts.save_to_file(path, chunk_size=128, compression='gorilla')
+            
+            loaded = TimeSeries.load_from_file(path)
+            np.testing.assert_array_equal(loaded.values, v)
+            
+            window = TimeSeries.load_from_file(
+                path, start=2_000_000_000, end=3_005_000_000
+            )
+            np.testing.assert_array_equal(window.values, v[200:301])
 
 
 if __name__ == "__main__":
@@ -12,7 +12,11 @@ from src.stalwart.analysis.metrics import (
     calculate_afc, calculate_alsa, calculate_cpii,
     calculate_ffd, calculate_lts, calculate_ccf,
     calculate_tvr, calculate_bd, calculate_sed,
-    calculate_health_index, MetricResult
+    calculate_health_index, MetricResult,
+    calculate_afc_batch, calculate_alsa_batch, calculate_cpii_batch,
+    calculate_ffd_batch, calculate_lts_batch, calculate_ccf_batch,
+    calculate_tvr_batch, calculate_bd_batch, calculate_sed_batch,
+    classify_status, STATUS_CODES
 )
 from src.stalwart.utils.constants import THRESHOLDS
 
@@ -40,6 +44,14 @@ class TestMetrics(unittest.TestCase):
         result = calculate_alsa(strain_measurements=strain_data, yield_strain=2000)
         self.assertIsInstance(result, MetricResult)
     
+    def test_alsa_damage(self):
+        # 10 cycles of 500 microstrain (100 MPa) over 21 samples
+        strain = np.tile([0.0, 500.0], 11)[:21]
+        result = calculate_alsa(strain_measurements=strain, yield_strain=2000)
+        self.assertAlmostEqual(result.details['damage_total'], 10 * 100.0 ** 3 / 2e12)
+        self.assertAlmostEqual(result.value, result.details['damage_total'] * 1e8 / 21)
+        self.assertEqual(result.details['cycles_counted'], 10)
+    
     def test_cpii_cable(self):
         result = calculate_cpii(wire_breaks=15, total_wires=15000, bridge_type="suspension")
         self.assertIsInstance(result, MetricResult)
@@ -128,5 +140,74 @@ class TestThresholds(unittest.TestCase):
         self.assertEqual(THRESHOLDS['FFD']['critical'], 8.0)
 
 
+class TestBatchMetrics(unittest.TestCase):
+    """Batch calculators agree with the scalar ones."""
+
+    def setUp(self):
+        self.rng = np.random.default_rng(3)
+
+    def assertMatchesScalar(self, batch, scalar, columns):
+        for i, args in enumerate(zip(*columns)):
+            expected = scalar(*args)
+            self.assertAlmostEqual(batch['value'][i], expected.value, places=9)
+            self.assertEqual(batch['status'][i], STATUS_CODES[expected.status])
+            self.assertAlmostEqual(
+                batch['confidence'][i], expected.confidence, places=6
+            )
+
+    def test_classify_status(self):
+        np.testing.assert_array_equal(
+            classify_status('FFD', [0.0, 3.0, 6.0, 9.0, np.nan]), [0, 1, 2, 3, 3]
+        )
+        np.testing.assert_array_equal(
+            classify_status('TVR', [1.0, 0.85, 0.6, 0.2, np.nan]), [0, 1, 2, 3, 3]
+        )
+
+    def test_matches_scalar(self):
+        n = 200
+
+        def u(lo, hi):
+            return self.rng.uniform(lo, hi, n)
+
+        def c(value):
+            return np.full(n, value)
+
+        cases = [
+            (calculate_afc_batch, calculate_afc,
+             [u(0, 60), u(0, 0.2), u(0.01, 0.03), u(1.0, 1.4), c(70.0), c(0.1),
+              c(0.024), c(1.2)]),
+            (calculate_cpii_batch, calculate_cpii,
+             [self.rng.integers(0, 300, n), c(15000)]),
+            (calculate_ffd_batch, calculate_ffd,
+             [u(1.0, 1.3), c(1.2), u(-10, 35), c(15.0)]),
+            (calculate_lts_batch, calculate_lts, [u(0, 40), u(0, 1), c(1.0)]),
+            (calculate_ccf_batch, calculate_ccf, [u(0, 0.6), u(0, 60), c(50.0)]),
+            (calculate_tvr_batch, calculate_tvr,
+             [u(0.01, 0.03), c(0.024), u(3, 8), c(5.0)]),
+            (calculate_bd_batch, calculate_bd, [u(-30, 30), c(100.0)]),
+            (calculate_sed_batch, calculate_sed, [u(0, 400), c(200.0)]),
+        ]
+        for batch, scalar, columns in cases:
+            with self.subTest(metric=scalar.__name__):
+                result = batch(*columns)
+                self.assertEqual(result.shape, (n,))
+                self.assertMatchesScalar(result, scalar, columns)
+
+    def test_optional_and_broadcast(self):
+        result = calculate_ffd_batch([1.18, 1.2, 1.25], 1.2)
+        self.assertMatchesScalar(result, calculate_ffd, [[1.18, 1.2, 1.25], [1.2] * 3])
+        cpii = calculate_cpii_batch([5, 0], 15000, bridge_type="girder")
+        self.assertEqual(cpii['value'].tolist(), [1.0, 1.0])
+        self.assertEqual(calculate_ccf_batch(np.zeros(4))['value'].tolist(), [0.0] * 4)
+
+    def test_alsa(self):
+        strain = self.rng.normal(200, 50, (5, 1000))
+        result = calculate_alsa_batch(strain, yield_strain=2000)
+        self.assertEqual(result.shape, (5,))
+        self.assertMatchesScalar(
+            result, lambda row: calculate_alsa(row, yield_strain=2000), [strain]
+        )
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -279,6 +279,27 @@ class TestFeatureExtractor(unittest.TestCase):
         self.assertIsInstance(features, np.ndarray)
 
 
+class TestSensorFusion(unittest.TestCase):
+    """Test multi-sensor synchronization."""
+    
+    def test_synchronized_matrix(self):
+        start = datetime(2026, 1, 1)
+        fast_times = [start + timedelta(seconds=i) for i in range(60)]
+        slow_times = [start + timedelta(seconds=10 * i + 5) for i in range(6)]
+        
+        fusion = SensorFusion()
+        matrix, times = fusion.create_synchronized_matrix(
+            {'accelerometer': np.arange(60.0), 'temperature': np.arange(6.0)},
+            {'accelerometer': fast_times, 'temperature': slow_times}
+        )
+        
+        # Accelerometer clock from the first temperature sample to the last
+        self.assertEqual(matrix.shape, (51, 2))
+        self.assertEqual(times[0], start + timedelta(seconds=5))
+        self.assertEqual(matrix[0, 1], 0.0)
+        self.assertEqual(matrix[10, 1], 1.0)
+
+
 if __name__ == "__main__":
     import pandas as pd
     unittest.main()
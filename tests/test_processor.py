@@ -1,10 +1,13 @@
 #!/usr/bin/env python3
 """Tests for STALWART analysis processor."""
 
+import os
 import sys
+import tempfile
 import unittest
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
-from datetime import datetime
+from datetime import datetime, timedelta
 import numpy as np
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -13,7 +16,27 @@ from src.stalwart.core.bridge import Bridge, BridgeSpecs
 from src.stalwart.core.sensor import Accelerometer, StrainGauge
 from src.stalwart.core.measurement import Measurement
 from src.stalwart.analysis.processor import AnalysisProcessor
+from src.stalwart.analysis.baseline import BaselineModel, BaselineStore
+from src.stalwart.analysis.fleet import FleetAnalyzer
+from src.stalwart.analysis.history import MetricHistory
+from src.stalwart.analysis.streaming import (
+    CrossSpectralAccumulator, SlidingWindow, StreamingProcessor
+)
+from src.stalwart.analysis.structural.damping import DecayEstimate
+from src.stalwart.analysis.structural.fatigue import SNCurve
+from src.stalwart.analysis.structural.modal import cross_spectral_matrix
+from src.stalwart.simulation.scenarios import create_simulated_bridge
+from src.stalwart.acquisition.sensors import Mode, ModalDriver
 from src.stalwart.analysis.metrics import MetricResult
+from src.stalwart.analysis.signal_processing import (
+    FREQUENCY_ESTIMATORS, estimate_frequency, zero_crossing_frequency
+)
+
+
+def read_tick(sensor, k):
+    """Ten seconds of samples from ``sensor`` starting at ``k`` * 10 s."""
+    rate = sensor.specs.sampling_rate
+    return sensor.read_samples(max(1, int(10 * rate)), rate, k * 10 ** 10)
 
 
 class TestAnalysisProcessor(unittest.TestCase):
@@ -39,6 +62,32 @@ class TestAnalysisProcessor(unittest.TestCase):
     def test_processor_initialization(self):
         self.assertEqual(self.processor.bridge, self.bridge)
         self.assertIn('AFC', self.processor.metrics_history)
+
+    def test_metrics_history(self):
+        """Test every analysis is recorded per metric."""
+        measurements = [
+            Measurement("STR-001", "TEST-001", datetime.now(), v, "με")
+            for v in (150.0, 180.0)
+        ]
+        self.processor.analyze(measurements)
+        status = self.processor.analyze(measurements)
+        history = self.processor.metrics_history['SED']
+        self.assertEqual(len(history), 2)
+        self.assertEqual(history.latest['value'], status.parameters['SED'])
+        self.assertEqual(len(self.processor.metrics_history['FFD']), 0)
+
+        # Replayed data keeps its own time
+        processor = AnalysisProcessor(self.bridge)
+        history = processor.metrics_history['SED']
+        for day in (1, 2, 3):
+            when = datetime(2024, 3, day, 12)
+            status = processor.analyze(
+                [Measurement("STR-001", "TEST-001", when, 150.0, "με")]
+            )
+            self.assertEqual(status.timestamp, when)
+        replayed = history.range(datetime(2024, 3, 1), datetime(2024, 3, 3))
+        self.assertEqual(len(replayed), 2)
+        self.assertEqual(len(history.downsample('1D', start=datetime(2024, 3, 1))), 3)
     
     def test_organize_measurements(self):
         measurements = [
@@ -62,6 +111,94 @@ class TestAnalysisProcessor(unittest.TestCase):
         freq = self.processor._estimate_frequency_simple(signal.tolist(), fs)
         self.assertAlmostEqual(freq, 1.2, delta=0.1)
     
+    def test_estimate_frequency_resolution(self):
+        """Test both estimators resolve FFD-scale shifts on 60 s records."""
+        fs = 100
+        t = np.arange(0, 60, 1/fs)
+        rng = np.random.default_rng(0)
+        true = 1.2 + 0.003 * np.arange(6)
+        noise = 0.05 * rng.standard_normal((6, len(t)))
+        signals = np.sin(2 * np.pi * true[:, None] * t) + noise
+
+        for method in FREQUENCY_ESTIMATORS:
+            freqs = estimate_frequency(signals, fs, method)
+            self.assertEqual(freqs.shape, (6,))
+            np.testing.assert_allclose(freqs, true, atol=0.005, err_msg=method)
+
+        self.assertTrue(np.isnan(zero_crossing_frequency(np.zeros(50), fs)))
+        with self.assertRaises(ValueError):
+            estimate_frequency(signals, fs, 'wavelet')
+
+    def test_frequency_method_per_bridge(self):
+        """Test the estimator follows the bridge specs and sensor rates."""
+        self.bridge.specs.frequency_estimator = 'zero_crossing'
+        processor = AnalysisProcessor(self.bridge)
+        self.assertEqual(processor.frequency_method, 'zero_crossing')
+
+        t = np.arange(0, 30, 1/100)
+        now = datetime.now()
+        measurements = [
+            Measurement(sensor_id, "TEST-001", now, v, "m/s²")
+            for sensor_id in ("ACC-001", "ACC-002")
+            for v in np.sin(2 * np.pi * 0.85 * t)
+        ]
+        self.assertAlmostEqual(
+            processor._estimate_frequency(measurements), 0.85, delta=0.005
+        )
+        self.assertEqual(processor._estimate_frequency([]), 1.2)
+
+        with self.assertRaises(ValueError):
+            AnalysisProcessor(self.bridge, frequency_method='wavelet')
+
+    def test_modal_ffd(self):
+        """Test FFD and TVR follow the tracked fundamental mode."""
+        specs = BridgeSpecs("Modal Bridge", "MODAL-001", "suspension", 500.0, 2000)
+        bridge = Bridge(specs)
+        for i, amplitude in enumerate((0.6, 1.0, 0.6)):
+            modes = [Mode(0.8, 0.02, 0.004 * amplitude), Mode(2.3, 0.015, 0.002)]
+            bridge.add_sensor(
+                Accelerometer(f"ACC-00{i}", driver=ModalDriver(modes, seed=5))
+            )
+        processor = AnalysisProcessor(bridge)
+        self.assertEqual(processor.modal_method, 'ssi_cov')
+
+        def window(start_ns):
+            return [
+                m for sensor in bridge.sensors
+                for m in sensor.read_block(120.0, start_time_ns=start_ns).to_timeseries(
+                    sensor.sensor_id, "MODAL-001").measurements
+            ]
+
+        status = processor.analyze(window(0))
+        self.assertEqual(status.parameters['FFD'], 0.0)
+
+        for sensor in bridge.sensors:
+            sensor.driver.set_damage(stiffness_loss=0.1, damping_increase=-0.01)
+        status = processor.analyze(window(3600 * 10 ** 9))
+        self.assertAlmostEqual(
+            status.parameters['FFD'], (np.sqrt(0.9) - 1) * 100, delta=1.5
+        )
+        self.assertLess(status.parameters['TVR'], 0.85)
+
+        with self.assertRaises(ValueError):
+            AnalysisProcessor(bridge, modal_method='era')
+
+    def test_tvr_single_reference(self):
+        """Test TVR keeps one decay reference with or without measured decays."""
+        confident = DecayEstimate(12.0, 0.9, 8, np.full(8, 12.0))
+        weak = DecayEstimate(30.0, 0.1, 1, np.array([30.0]))
+        results = [
+            self.processor._tvr(0.8, 0.8, 0.02, 0.02, decay)
+            for decay in (confident, None, weak, confident)
+        ]
+        references = {r.details['baseline_decay_time'] for r in results}
+        self.assertEqual(references, {1 / (2 * np.pi * 0.8 * 0.02)})
+        self.assertEqual(
+            [r.details['decay_source'] for r in results],
+            ['measured', 'damping', 'damping', 'measured']
+        )
+        self.assertEqual(results[0].details['decay_time'], 12.0)
+
     def test_estimate_damping_simple(self):
         fs = 100
         t = np.arange(0, 10, 1/fs)
@@ -123,5 +260,437 @@ class TestAnalysisProcessor(unittest.TestCase):
         self.assertEqual(level, "CRITICAL")
 
 
+class TestBaseline(unittest.TestCase):
+    """Test temperature-compensated baselines and their persistence."""
+
+    @staticmethod
+    def commissioned(bridge_id="TEST-001", seed=0):
+        """A week of hourly observations of a mode losing 0.3 %/C."""
+        rng = np.random.default_rng(seed)
+        model = BaselineModel(bridge_id, min_samples=100)
+        for hour in range(170):
+            temperature = 15 + 10 * np.sin(2 * np.pi * hour / 24) + rng.normal(0, 2)
+            frequency = 0.8 * (1 - 0.003 * (temperature - 15)) + rng.normal(0, 0.001)
+            damping = 0.02 + 0.0002 * (temperature - 15)
+            model.update(hour * 3600 * 10 ** 9, temperature, frequency, damping)
+        return model
+
+    def test_regression(self):
+        """Test the RLS fit, freezing and clamping."""
+        model = self.commissioned()
+        self.assertTrue(model.frozen)
+        self.assertAlmostEqual(model.temperature_coefficient, -0.003, delta=0.0002)
+        self.assertAlmostEqual(model.evaluate(25.0).frequency, 0.8 * 0.97, delta=0.001)
+        self.assertAlmostEqual(model.evaluate(25.0).damping, 0.022, delta=1e-4)
+
+        # Frozen: damage is not learned
+        before = model.evaluate().frequency
+        self.assertFalse(model.update(10 ** 15, 15.0, 0.5, 0.05))
+        self.assertEqual(model.evaluate().frequency, before)
+
+        # No extrapolation beyond the commissioning temperatures
+        self.assertEqual(model.evaluate(80.0).temperature, model.temperature_range[1])
+
+        fresh = BaselineModel("X", commissioning=3600.0, min_samples=2)
+        self.assertFalse(fresh.update(0, 10.0, 0.8, np.nan))
+        self.assertTrue(np.isnan(fresh.evaluate().damping))
+
+    def test_store(self):
+        """Test a stored baseline loads back unchanged."""
+        model = self.commissioned()
+        with tempfile.TemporaryDirectory() as directory:
+            store = BaselineStore(directory)
+            self.assertIsNone(store.load("TEST-001"))
+            store.save(model)
+            self.assertLess(store.path("TEST-001").stat().st_size, 1024)
+            loaded = store.load("TEST-001")
+        self.assertTrue(loaded.frozen)
+        self.assertEqual(loaded.temperature_range, model.temperature_range)
+        self.assertEqual(loaded.evaluate(22.0), model.evaluate(22.0))
+
+    def test_store_rejects_paths(self):
+        """Test bridge ids cannot reach outside the store directory."""
+        with tempfile.TemporaryDirectory() as directory:
+            store = BaselineStore(Path(directory) / "store")
+            for bridge_id in ("../BR-001", "fleet/BR-001", "/tmp/BR-001", "..", ""):
+                with self.subTest(bridge_id=bridge_id):
+                    with self.assertRaises(ValueError):
+                        store.save(BaselineModel(bridge_id))
+                    with self.assertRaises(ValueError):
+                        store.load(bridge_id)
+            self.assertEqual(os.listdir(directory), ["store"])
+            self.assertEqual(store.path("BR-001").parent, store.directory)
+
+    @staticmethod
+    def modal_bridge():
+        """A bridge of three accelerometers on a 0.8 Hz fundamental."""
+        specs = BridgeSpecs("Modal Bridge", "MODAL-001", "suspension", 500.0, 2000)
+        bridge = Bridge(specs)
+        for i, amplitude in enumerate((0.6, 1.0, 0.6)):
+            modes = [Mode(0.8, 0.02, 0.004 * amplitude), Mode(2.3, 0.015, 0.002)]
+            bridge.add_sensor(
+                Accelerometer(f"ACC-00{i}", driver=ModalDriver(modes, seed=5))
+            )
+        return bridge
+
+    @staticmethod
+    def acceleration_window(bridge, seconds=120.0):
+        return [
+            m for sensor in bridge.sensors
+            for m in sensor.read_block(seconds, start_time_ns=0).to_timeseries(
+                sensor.sensor_id, "MODAL-001").measurements
+        ]
+
+    def test_compensated_ffd(self):
+        """Test FFD compares with the model at the measured temperature."""
+        bridge = self.modal_bridge()
+        window = self.acceleration_window(bridge)
+        window.append(Measurement("TEMP-001", "MODAL-001", datetime.now(), 25.0, "C"))
+
+        with tempfile.TemporaryDirectory() as directory:
+            store = BaselineStore(directory)
+            store.save(self.commissioned("MODAL-001"))
+            processor = AnalysisProcessor(bridge, baseline_store=store)
+            self.assertTrue(processor.baseline.frozen)
+            status = processor.analyze(window)
+        # 0.8 Hz measured where the healthy bridge would be at 0.776 Hz
+        self.assertAlmostEqual(
+            status.parameters['FFD'], (1 / 0.97 - 1) * 100, delta=1.0
+        )
+
+        processor = AnalysisProcessor(bridge)
+        self.assertFalse(processor.baseline.frozen)
+        self.assertEqual(processor.analyze(window).parameters['FFD'], 0.0)
+        self.assertEqual(processor.baseline.regressions['frequency'].samples, 1)
+
+    def test_tvr_baseline_persisted(self):
+        """Test TVR keeps the stored decay baseline across a restart."""
+        bridge = self.modal_bridge()
+        model = self.commissioned("MODAL-001")
+        with tempfile.TemporaryDirectory() as directory:
+            store = BaselineStore(directory)
+            store.save(model)
+            processor = AnalysisProcessor(bridge, baseline_store=store)
+            before = processor._vibration_metrics(
+                self.acceleration_window(bridge, 600.0), 25.0
+            )['TVR']
+
+            # Restarted on a bridge that has already lost damping
+            for sensor in bridge.sensors:
+                sensor.driver.set_damage(damping_increase=-0.01)
+            processor = AnalysisProcessor(bridge, baseline_store=store)
+            after = processor._vibration_metrics(
+                self.acceleration_window(bridge, 600.0), 25.0
+            )['TVR']
+
+        self.assertAlmostEqual(
+            before.details['baseline_decay_time'], model.evaluate(25.0).decay_time
+        )
+        self.assertEqual(
+            after.details['baseline_decay_time'],
+            before.details['baseline_decay_time']
+        )
+        self.assertGreater(
+            after.details['decay_time'], before.details['decay_time']
+        )
+        self.assertLess(after.value, before.value)
+
+    def test_commissioning_saves_throttled(self):
+        """Test a commissioning baseline is saved on a throttle and on freeze."""
+        class CountingStore(BaselineStore):
+            saves = 0
+
+            def save(self, model):
+                CountingStore.saves += 1
+                super().save(model)
+
+        bridge = Bridge(
+            BridgeSpecs("Modal Bridge", "MODAL-001", "suspension", 500.0, 2000)
+        )
+        with tempfile.TemporaryDirectory() as directory:
+            store = CountingStore(directory)
+            store.save(BaselineModel("MODAL-001", commissioning=3650.0, min_samples=2))
+            CountingStore.saves = 0
+            processor = AnalysisProcessor(bridge, baseline_store=store)
+            # An hour of 10 s windows, then the frozen model
+            for second in range(0, 3660, 10):
+                processor._reference(second * 10 ** 9, 15.0, 0.8, 0.02, 0.8, 0.02)
+            self.assertTrue(processor.baseline.frozen)
+            # Every 600 s of data, and on freezing at 3650 s
+            self.assertEqual(CountingStore.saves, 8)
+            processor._reference(4300 * 10 ** 9, 15.0, 0.8, 0.02, 0.8, 0.02)
+            self.assertEqual(CountingStore.saves, 8)
+            self.assertTrue(store.load("MODAL-001").frozen)
+
+
+class TestMetricHistory(unittest.TestCase):
+    """Test the bounded metric history."""
+
+    def setUp(self):
+        self.history = MetricHistory(capacity=200)
+        statuses = ["SAFE", "WARNING", "CAUTION", "CRITICAL", "UNKNOWN"]
+        for i in range(300):
+            self.history.append(i * 10 ** 9, float(i), statuses[i % 5], 0.5)
+
+    def test_bounded(self):
+        """Test the oldest records are dropped once full."""
+        self.assertEqual(len(self.history), 200)
+        np.testing.assert_array_equal(self.history.values, np.arange(100, 300))
+        np.testing.assert_array_equal(
+            self.history.records['status'][:5], [0, 1, 2, 3, -1]
+        )
+        self.assertEqual(self.history._records.nbytes, 2 * 200 * 21)
+
+        # A clock step back keeps the history sorted
+        self.history.append(5 * 10 ** 9, 1.0, "SAFE")
+        self.assertEqual(self.history.latest['timestamp'], 299 * 10 ** 9)
+
+    def test_range_and_downsample(self):
+        """Test time range queries and bucket aggregation."""
+        records = self.history.range(150 * 10 ** 9, 160 * 10 ** 9)
+        np.testing.assert_array_equal(records['value'], np.arange(150, 160))
+        self.assertEqual(len(self.history.range(end=0)), 0)
+
+        buckets = self.history.downsample('10s', start=150 * 10 ** 9)
+        self.assertEqual(len(buckets), 15)
+        np.testing.assert_array_equal(buckets['value'], np.arange(150, 300, 10) + 4.5)
+        np.testing.assert_array_equal(buckets['status'], 3)
+        np.testing.assert_allclose(buckets['confidence'], 0.5)
+        frame = self.history.to_dataframe(end=110 * 10 ** 9)
+        self.assertEqual(list(frame['value']), list(range(100, 110)))
+
+
+class TestStreamingProcessor(unittest.TestCase):
+    """Test sliding-window state and the streaming processor."""
+
+    def test_sliding_window(self):
+        """Test running moments match the window after evictions."""
+        rng = np.random.default_rng(0)
+        values = 1e4 + rng.standard_normal(2500)
+        window = SlidingWindow(1000)
+        for lo in range(0, len(values), 70):
+            block = values[lo:lo + 70]
+            window.extend(np.arange(lo, lo + len(block)), block)
+        np.testing.assert_array_equal(window.values, values[-1000:])
+        self.assertAlmostEqual(window.mean, values[-1000:].mean(), places=9)
+        self.assertAlmostEqual(window.variance, values[-1000:].var(ddof=1), places=6)
+
+    def test_sliding_window_maximum(self):
+        """Test the running maximum follows evictions and oversized blocks."""
+        rng = np.random.default_rng(1)
+        window = SlidingWindow(300)
+        self.assertTrue(np.isnan(window.maximum))
+        values = np.empty(0)
+        # Drifting down so old maxima must be evicted; ties and long blocks
+        for size in (1, 70, 70, 5, 400, 1, 90, 90, 90, 301, 3):
+            block = np.round(rng.standard_normal(size) - len(values) / 500, 1)
+            window.extend(np.arange(len(values), len(values) + size), block)
+            values = np.append(values, block)
+            self.assertEqual(window.maximum, values[-300:].max())
+            self.assertLessEqual(len(window._maxima), len(window))
+
+    def test_cross_spectral_accumulator(self):
+        """Test the sliding CSD equals Welch over the segments in the window."""
+        rng = np.random.default_rng(1)
+        record = rng.standard_normal((3, 5000))
+        acc = CrossSpectralAccumulator(3, 100.0, 256, max_segments=8)
+        # Channels arrive in blocks of different sizes, in order of completion
+        blocks = sorted(
+            (min(lo + size, record.shape[1]), channel, lo, size)
+            for channel, size in enumerate((300, 170, 512))
+            for lo in range(0, record.shape[1], size)
+        )
+        for _, channel, lo, size in blocks:
+            acc.extend(channel, record[channel, lo:lo + size])
+
+        self.assertEqual(acc.count, 8)
+        # Welch over the segments in the window, each with its own mean removed
+        first = (acc.pushed - acc.count) * acc.step
+        starts = first + acc.step * np.arange(acc.count)
+        expected = np.mean([
+            cross_spectral_matrix(record[:, lo:lo + 256], 100.0, nperseg=256)[1]
+            for lo in starts
+        ], axis=0)
+        np.testing.assert_allclose(acc.csd[0], np.fft.rfftfreq(256, 0.01))
+        np.testing.assert_allclose(acc.csd[1], expected, rtol=1e-9, atol=1e-12)
+        self.assertTrue(acc.present.all())
+
+    def test_dead_channel(self):
+        """Test a silent channel is dropped and rejoins aligned."""
+        rng = np.random.default_rng(2)
+        record = rng.standard_normal((3, 20000))
+        acc = CrossSpectralAccumulator(3, 100.0, 256, max_segments=8)
+        for lo in range(0, 10000, 100):
+            for channel in (0, 1):
+                acc.extend(channel, record[channel, lo:lo + 100], start=lo)
+        # Segments go on without channel 2 and the buffers stay bounded
+        self.assertEqual(acc.count, 8)
+        self.assertLessEqual(max(acc.pending), 256 + 2 * 100)
+        np.testing.assert_array_equal(acc.present, [True, True, False])
+        G = acc.csd[1]
+        self.assertTrue(np.all(G[:, 2, :] == 0))
+
+        # Channel 2 resumes at the same time as the others
+        for lo in range(10000, 20000, 100):
+            for channel in (0, 1, 2):
+                acc.extend(channel, record[channel, lo:lo + 100], start=lo)
+        self.assertTrue(acc.present.all())
+        first = (acc.pushed - acc.count) * acc.step
+        starts = first + acc.step * np.arange(acc.count)
+        self.assertGreaterEqual(starts[0], 10000)
+        expected = np.mean([
+            cross_spectral_matrix(record[:, lo:lo + 256], 100.0, nperseg=256)[1]
+            for lo in starts
+        ], axis=0)
+        np.testing.assert_allclose(acc.csd[1], expected, rtol=1e-9, atol=1e-12)
+
+    def test_streaming_ffd(self):
+        """Test streamed 10 s blocks track a stiffness loss."""
+        bridge = create_simulated_bridge(seed=3)
+        processor = StreamingProcessor(bridge, window=300.0)
+
+        def tick(k):
+            return [(s, read_tick(s, k)) for s in bridge.sensors]
+
+        for k in range(28):
+            status = processor.process(tick(k))
+        # No spectral metrics until the window is full
+        self.assertNotIn('FFD', status.parameters)
+        for k in range(28, 36):
+            status = processor.process(tick(k))
+        self.assertAlmostEqual(status.parameters['FFD'], 0.0, delta=1.0)
+        self.assertIn('ALSA', status.parameters)
+        # Statuses and history carry the time of the newest sample
+        self.assertEqual(
+            status.timestamp,
+            datetime(1970, 1, 1, 0, 6) - timedelta(microseconds=10000)
+        )
+        self.assertEqual(
+            processor.metrics_history['FFD'].timestamps_ns[-1],
+            36 * 10 ** 10 - 10 ** 7
+        )
+        # Fatigue damage accumulates over every block, not just the window
+        damage = processor.cumulative_damage()
+        gauges = bridge.get_sensors_by_type('strain_gauge')
+        self.assertEqual(set(damage), {s.sensor_id for s in gauges})
+        self.assertTrue(all(d > 0 for d in damage.values()))
+        self.assertTrue(all(c.samples == 36 * 100 for c in processor.fatigue.values()))
+        # Any detail category from the ledgers, without the strain records
+        lenient = processor.cumulative_damage(SNCurve(160.0))
+        self.assertTrue(all(lenient[s] < damage[s] for s in damage))
+
+        for sensor in bridge.get_sensors_by_type('accelerometer'):
+            sensor.driver.set_damage(stiffness_loss=0.1)
+        for k in range(36, 66):
+            status = processor.process(tick(k))
+        self.assertAlmostEqual(
+            status.parameters['FFD'], (np.sqrt(0.9) - 1) * 100, delta=1.5
+        )
+
+        with self.assertRaises(ValueError):
+            processor.ingest(Accelerometer("ACC-999", "elsewhere"), tick(0)[0][1])
+
+    def test_dead_accelerometer(self):
+        """Test modal analysis goes on when one accelerometer is silent."""
+        bridge = create_simulated_bridge(seed=5)
+        processor = StreamingProcessor(bridge, window=120.0)
+        dead = bridge.get_sensors_by_type('accelerometer')[-1]
+        for k in range(60):
+            status = processor.process(
+                (s, read_tick(s, k)) for s in bridge.sensors if s is not dead
+            )
+        acc = processor.spectra[dead.specs.sampling_rate]
+        self.assertEqual(acc.count, acc.max_segments)
+        self.assertLessEqual(max(acc.pending), acc.nperseg + 2 * 1000)
+        self.assertIn('FFD', status.parameters)
+        self.assertTrue(np.isnan(processor.last_modal_result.modes[0].shape[-1]))
+
+    def test_bridge_keeps_processor(self):
+        """Test Bridge.update_status reuses one processor."""
+        bridge = create_simulated_bridge(seed=4)
+        bridge.update_status([])
+        processor = bridge.processor
+        bridge.update_status([])
+        self.assertIs(bridge.processor, processor)
+
+
+class TestFleetAnalyzer(unittest.TestCase):
+    """Test sharded fleet analysis."""
+
+    @staticmethod
+    def fleet(n):
+        bridges = []
+        for i in range(n):
+            bridge = create_simulated_bridge(seed=i)
+            bridge.specs.bridge_id = f"BR-{i:03d}"
+            bridges.append(bridge)
+        return bridges
+
+    @staticmethod
+    def round_of(bridges, k=0):
+        return {
+            b.specs.bridge_id: {s.sensor_id: read_tick(s, k) for s in b.sensors}
+            for b in bridges
+        }
+
+    def test_process_pool_matches_in_process(self):
+        """Test shared-memory workers give the in-process statuses."""
+        source = self.fleet(3)
+        rounds = [self.round_of(source, k) for k in range(8)]
+
+        results = {}
+        for workers in (0, 2):
+            fleet = FleetAnalyzer(self.fleet(3), max_workers=workers, window=60.0)
+            with fleet:
+                shards = sorted(map(len, fleet.shards))
+                self.assertEqual(shards, [1, 2] if workers else [3])
+                for blocks in rounds:
+                    status = fleet.analyze(blocks)
+            self.assertEqual(status.errors, {})
+            self.assertEqual(set(status.latency), {'BR-000', 'BR-001', 'BR-002'})
+            self.assertTrue(all(latency > 0 for latency in status.latency.values()))
+            results[workers] = status
+
+        for bridge_id, status in results[0].statuses.items():
+            self.assertIn('FFD', status.parameters)
+            expected = results[2].statuses[bridge_id].parameters
+            self.assertEqual(status.parameters, expected)
+        table = results[2].to_dataframe()
+        self.assertEqual(list(table.index), ['BR-000', 'BR-001', 'BR-002'])
+        self.assertIn('latency_ms', table.columns)
+
+    def test_failing_bridge_isolated(self):
+        """Test one failing bridge does not discard its shard's results."""
+        blocks = self.round_of(self.fleet(3))
+        blocks['BR-001']['NO-SUCH-SENSOR'] = blocks['BR-001'].pop('ACC-000')
+        for workers in (0, 1):
+            fleet = FleetAnalyzer(self.fleet(3), max_workers=workers, window=60.0)
+            with fleet:
+                status = fleet.analyze(blocks)
+            self.assertEqual(set(status.errors), {'BR-001'})
+            self.assertEqual(set(status.statuses), {'BR-000', 'BR-002'})
+
+    def test_dead_worker_replaced(self):
+        """Test a shard whose worker died gets a new one."""
+        bridges = self.fleet(2)
+        with FleetAnalyzer(self.fleet(2), max_workers=2, window=60.0) as fleet:
+            fleet.analyze(self.round_of(bridges, 0))
+            with self.assertRaises(BrokenProcessPool):
+                fleet._executors[0].submit(os._exit, 1).result()
+            for k in (1, 2):
+                status = fleet.analyze(self.round_of(bridges, k))
+                self.assertEqual(status.errors, {})
+                self.assertEqual(set(status.statuses), {'BR-000', 'BR-001'})
+
+    def test_invalid_fleet(self):
+        """Test duplicate and unknown bridges are rejected."""
+        bridges = self.fleet(2)
+        with self.assertRaises(ValueError):
+            FleetAnalyzer(bridges + bridges[:1], max_workers=0)
+        fleet = FleetAnalyzer(bridges, max_workers=0)
+        with self.assertRaises(ValueError):
+            fleet.analyze({'BR-999': {}})
+
+
 if __name__ == "__main__":
     unittest.main()
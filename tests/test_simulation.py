@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""Tests for STALWART simulation scenarios."""
+
+import sys
+import unittest
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.stalwart.simulation.scenarios import (
+    SCENARIOS, BridgeState, Scenario, create_simulated_bridge, run_scenario
+)
+import numpy as np
+
+
+class TestScenarios(unittest.TestCase):
+    """Test scenario state evolution and the simulation engine."""
+
+    def test_state_reaches_warning(self):
+        """Test every scenario warns within 18 simulated months."""
+        bridge = create_simulated_bridge(seed=1)
+        total = 540 * 24.0
+        for name, factory in SCENARIOS.items():
+            model = factory()
+            state = BridgeState()
+            rng = np.random.default_rng(1)
+            statuses = []
+            for hours in np.arange(0, total, 24.0):
+                model.evolve(state, hours, 24.0, total, rng, bridge)
+                statuses.append(model.indicator(state, bridge).status)
+            self.assertEqual(statuses[0], "SAFE", name)
+            self.assertTrue(any(s != "SAFE" for s in statuses), name)
+
+    def test_run_scenario(self):
+        """Test an accelerated run drives the processor and the drivers."""
+        bridge = create_simulated_bridge(seed=2)
+        result = run_scenario('corrosion', duration_days=4, step_hours=24,
+                              window=10, seed=2, bridge=bridge)
+
+        self.assertEqual(len(result.hours), 4)
+        self.assertEqual(result.simulated_hours, 96.0)
+        self.assertEqual(len(result.risk), 4)
+        self.assertTrue(np.all(np.diff(result.indicator) >= 0))
+        self.assertEqual(result.metric, 'FFD')
+        self.assertEqual(len(result.detected_status), 4)
+        # Steps where the fundamental was not tracked have no FFD
+        self.assertEqual(result.detected_status[0], "SAFE")
+        self.assertTrue(all(s in ("SAFE", "") for s in result.detected_status))
+        self.assertIsNone(result.first_warning_hours)
+        self.assertGreater(result.throughput, 1.0)
+        self.assertEqual(result.samples, 4 * (4 * 1000 + 2 * 100 + 10 + 40))
+
+        # Sensor clocks follow simulated time
+        last = bridge.sensors[0].last_reading_time
+        self.assertEqual((last.year, last.month, last.day), (2026, 1, 5))
+
+    def test_processor_warns(self):
+        """Test the early warning comes from the processor's metric."""
+        bridge = create_simulated_bridge(seed=5)
+        # Fatigue cracking cuts stiffness once Miner damage passes one half
+        factory = SCENARIOS['fatigue']
+        SCENARIOS['fatigue'] = lambda: factory(damage_per_year=40.0)
+        try:
+            result = run_scenario('fatigue', duration_days=10, step_hours=24,
+                                  seed=5, bridge=bridge)
+        finally:
+            SCENARIOS['fatigue'] = factory
+
+        self.assertIsNotNone(result.indicator_warning_hours)
+        self.assertIsNotNone(result.first_warning_hours)
+        step = list(result.hours).index(result.first_warning_hours)
+        self.assertNotEqual(result.detected_status[step], "SAFE")
+        self.assertGreater(result.states[step]['stiffness_loss'], 0.0)
+        self.assertIsNotNone(result.first_critical_hours)
+
+    def test_scenario_interface(self):
+        """Test a scenario without an indicator cannot be created."""
+        class IncompleteScenario(Scenario):
+            def evolve(self, state, hours, step, total, rng, bridge):
+                pass
+
+        with self.assertRaises(TypeError):
+            IncompleteScenario()
+
+    def test_unknown_scenario(self):
+        """Test unknown scenario names are rejected."""
+        with self.assertRaises(ValueError):
+            run_scenario('earthquake', duration_days=1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,337 @@
+#!/usr/bin/env python3
+"""Tests for STALWART structural (modal) analysis."""
+
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.stalwart.acquisition.sensors import Mode, ModalDriver
+from src.stalwart.analysis.structural import damping
+from src.stalwart.analysis.structural.damping import (
+    envelope_decay_time, random_decrement, random_decrement_signature
+)
+from src.stalwart.analysis.structural.fatigue import (
+    DEFAULT_SN_CURVE, FatigueLedger, RainflowCounter, SNCurve, count_cycles,
+    rainflow_cycles, turning_points
+)
+from src.stalwart.analysis.structural.modal import (
+    TRACK_HISTORY, IdentifiedMode, ModalResult, ModeTracker,
+    cross_spectral_matrix, fdd, identify_modes, mac, ssi_cov
+)
+import numpy as np
+
+MODES = [(0.8, 0.02), (2.3, 0.015), (4.1, 0.012)]
+
+
+def modal_record(seconds, fs=100.0, stiffness_loss=0.0, seed=0):
+    """Six-channel response of a simply supported span to ambient excitation."""
+    x = np.linspace(0.1, 0.9, 6)
+    shapes = np.array([np.sin((k + 1) * np.pi * x) for k in range(len(MODES))])
+    n = int(seconds * fs)
+    y = np.zeros((6, n))
+    for k, mode in enumerate(MODES):
+        driver = ModalDriver([Mode(*mode)], noise_std=0.0, traffic_rate=0.0,
+                             seed=seed + k)
+        driver.set_damage(stiffness_loss)
+        y += np.outer(shapes[k], driver.read_block(n, fs, 0).values)
+    noise = np.random.default_rng(seed).standard_normal(y.shape)
+    return y + 0.05 * y.std() * noise, shapes
+
+
+class TestModalIdentification(unittest.TestCase):
+    """Test FDD, SSI-COV and mode tracking."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.record, cls.shapes = modal_record(3600)
+
+    def test_cross_spectral_matrix(self):
+        """Test the CSD matrix is Hermitian with the auto-spectra on the diagonal."""
+        freqs, G = cross_spectral_matrix(self.record[:, :60000], 100.0, nperseg=1024)
+        self.assertEqual(G.shape, (513, 6, 6))
+        np.testing.assert_allclose(G, G.conj().transpose(0, 2, 1))
+        self.assertTrue(np.all(np.diagonal(G, axis1=1, axis2=2).real >= 0))
+
+    def test_fdd(self):
+        """Test FDD frequencies, shapes and EFDD damping on an hour of data."""
+        result = fdd(self.record, 100.0)
+        self.assertEqual(result.method, 'fdd')
+        np.testing.assert_allclose(result.frequencies, [f for f, _ in MODES], rtol=0.01)
+        for mode, shape in zip(result.modes, self.shapes):
+            self.assertGreater(mac(mode.shape, shape), 0.95)
+        np.testing.assert_allclose(result.dampings, [d for _, d in MODES], atol=0.008)
+
+        # Too short for the slow modes to decay within a segment
+        self.assertTrue(np.isnan(fdd(self.record[:, :6000], 100.0).modes[0].damping))
+
+    def test_ssi_cov(self):
+        """Test SSI-COV frequencies, damping and shapes."""
+        result = identify_modes(self.record, 100.0, 'ssi_cov')
+        self.assertEqual(len(result.modes), 3)
+        np.testing.assert_allclose(
+            result.frequencies, [f for f, _ in MODES], rtol=0.005
+        )
+        np.testing.assert_allclose(result.dampings, [d for _, d in MODES], atol=0.005)
+        for mode, shape in zip(result.modes, self.shapes):
+            self.assertGreater(mac(mode.shape, shape), 0.95)
+
+        with self.assertRaises(ValueError):
+            identify_modes(self.record, 100.0, 'erafdd')
+        self.assertEqual(ssi_cov(self.record[:, :50], 100.0).modes, [])
+
+    def test_mode_tracking(self):
+        """Test tracks follow a stiffness loss and keep their baseline."""
+        tracker = ModeTracker()
+        for loss in (0.0, 0.0, 0.04, 0.08):
+            seed = int(loss * 100) + 10
+            record, _ = modal_record(300, stiffness_loss=loss, seed=seed)
+            tracker.update(ssi_cov(record, 100.0))
+
+        self.assertEqual(len(tracker.tracks), 3)
+        fundamental = tracker.fundamental
+        self.assertEqual(len(fundamental.frequencies), 4)
+        self.assertAlmostEqual(fundamental.baseline_frequency, 0.8, delta=0.01)
+        self.assertAlmostEqual(
+            fundamental.frequency_drift, (np.sqrt(0.92) - 1) * 100, delta=1.0
+        )
+        self.assertGreater(fundamental.shape_mac, 0.95)
+
+    def test_fundamental_survives_gap(self):
+        """Test the fundamental keeps its baseline through a long outage."""
+        tracker = ModeTracker(max_missed=3)
+        shape, other = np.ones(3, dtype=complex), np.array([1, 0, -1], dtype=complex)
+
+        def window(*modes):
+            identified = [IdentifiedMode(f, 0.02, m) for f, m in modes]
+            return ModalResult(identified, 'fdd', 100.0, 0)
+
+        tracker.update(window((1.0, shape), (3.0, other)))
+        fundamental = tracker.fundamental
+        for _ in range(10):
+            # Only the second mode, then a spurious lower pole
+            tracker.update(window((3.0, other)))
+        tracker.update(window((0.5, other), (3.0, other)))
+        self.assertIs(tracker.fundamental, fundamental)
+        self.assertEqual(fundamental.missed, 11)
+
+        tracker.update(window((0.96, shape), (3.0, other)))
+        self.assertIs(tracker.fundamental, fundamental)
+        self.assertEqual(fundamental.missed, 0)
+        self.assertAlmostEqual(fundamental.frequency_drift, -4.0)
+
+    def test_track_history_bounded(self):
+        """Test tracks keep a bounded history however long they live."""
+        tracker = ModeTracker()
+        shape = np.ones(3, dtype=complex)
+        for k in range(TRACK_HISTORY + 50):
+            mode = IdentifiedMode(1.0 + 1e-4 * (k % 7), 0.02, shape)
+            tracker.update(ModalResult([mode], 'fdd', 100.0, 0))
+        fundamental = tracker.fundamental
+        self.assertEqual(len(fundamental.frequencies), TRACK_HISTORY)
+        self.assertEqual(fundamental.observations, TRACK_HISTORY + 50)
+        self.assertEqual(fundamental.baseline_frequency, 1.0)
+
+
+class TestRandomDecrement(unittest.TestCase):
+    """Test the random decrement damping estimator."""
+
+    def test_signature(self):
+        """Test triggers and chunked averaging."""
+        record, _ = modal_record(300)
+        signature, triggers = random_decrement_signature(record, 1000)
+        self.assertEqual(signature.shape, (6, 1000))
+        self.assertTrue(np.all(triggers > 0))
+        # Every segment starts just above the trigger level
+        level = signature[:, 0] / record.std(axis=1)
+        self.assertTrue(np.all((level >= np.sqrt(2)) & (level < 1.2 * np.sqrt(2))))
+
+        chunk = damping._GATHER_ELEMENTS
+        try:
+            damping._GATHER_ELEMENTS = 3000
+            chunked, _ = random_decrement_signature(record, 1000)
+        finally:
+            damping._GATHER_ELEMENTS = chunk
+        np.testing.assert_allclose(chunked, signature)
+
+        with self.assertRaises(ValueError):
+            random_decrement_signature(record, 10 ** 6)
+
+    def test_damping(self):
+        """Test damping of the fundamental on all channels at once."""
+        record, _ = modal_record(1200)
+        estimate = random_decrement(record, 100.0, band=(0.56, 1.04))
+        self.assertEqual(estimate.damping.shape, (6,))
+        np.testing.assert_allclose(estimate.damping, 0.02, atol=0.004)
+        np.testing.assert_allclose(estimate.frequency, 0.8, atol=0.01)
+        np.testing.assert_allclose(
+            estimate.decay_time, 1 / (estimate.damping * 2 * np.pi * 0.8),
+            rtol=0.01
+        )
+
+        single = ModalDriver([Mode(1.2, 0.03)], noise_std=0.0, traffic_rate=0.0, seed=1)
+        values = single.read_block(360000, 100.0, 0).values
+        self.assertAlmostEqual(
+            random_decrement(values, 100.0).damping[0], 0.03, delta=0.008
+        )
+
+        with self.assertRaises(ValueError):
+            random_decrement(record, 100.0, band=(1.0, 0.5))
+
+
+class TestEnvelopeDecay(unittest.TestCase):
+    """Test the Hilbert-envelope decay-time estimator."""
+
+    @staticmethod
+    def free_decays(tau, fs, starts, seconds=300, seed=0):
+        """Ambient noise with free 1.5 Hz decays starting at ``starts`` (s)."""
+        t = np.arange(int(seconds * fs)) / fs
+        x = 0.02 * np.random.default_rng(seed).standard_normal(len(t))
+        for start in starts:
+            after = t >= start
+            elapsed = t[after] - start
+            x[after] += np.exp(-elapsed / tau) * np.sin(2 * np.pi * 1.5 * elapsed)
+        return x
+
+    def test_decay_time(self):
+        """Test the median decay time and confidence at two sampling rates."""
+        starts = np.arange(10, 290, 40)
+        for fs in (50.0, 200.0):
+            record = self.free_decays(4.0, fs, starts)
+            estimate = envelope_decay_time(record, fs, band=(1.0, 2.0))
+            self.assertEqual(estimate.events, len(starts))
+            self.assertAlmostEqual(estimate.decay_time, 4.0, delta=0.4)
+            self.assertGreater(estimate.confidence, 0.8)
+
+        # Channels stacked as rows share the events
+        record = np.vstack(
+            [self.free_decays(4.0, 100.0, starts, seed=s) for s in range(3)]
+        )
+        estimate = envelope_decay_time(record, 100.0, band=(1.0, 2.0))
+        self.assertEqual(estimate.events, 3 * len(starts))
+
+    def test_no_events(self):
+        """Test ambient noise and single events give low confidence."""
+        noise = self.free_decays(4.0, 100.0, [])
+        estimate = envelope_decay_time(noise, 100.0, band=(1.0, 2.0))
+        self.assertTrue(np.isnan(estimate.decay_time))
+        self.assertEqual(estimate.confidence, 0.0)
+
+        record = self.free_decays(4.0, 100.0, [20], seconds=60)
+        single = envelope_decay_time(record, 100.0, band=(1.0, 2.0))
+        self.assertEqual(single.events, 1)
+        self.assertLess(single.confidence, 0.5)
+
+
+class TestRainflowCounter(unittest.TestCase):
+    """Test the streaming four-point rainflow counter."""
+
+    def test_cycles_and_residual(self):
+        """Test cycles spanning blocks are closed once and the residual is kept."""
+        np.testing.assert_array_equal(
+            turning_points([0, 1, 3, 3, 2, 2, 5, 5]), [0, 3, 2, 5]
+        )
+        history = [0, 2, 5, 2, 4, 1, 6, 0]
+        splits = ([history], [[0, 2, 5], [2], [4, 1, 6, 0]], [[x] for x in history])
+        for blocks in splits:
+            counter = RainflowCounter()
+            for block in blocks:
+                counter.extend(block)
+            self.assertEqual(counter.cycles, 2)
+            np.testing.assert_array_equal(np.flatnonzero(counter.histogram), [2, 4])
+            np.testing.assert_array_equal(counter.residual, [0, 6, 0])
+            self.assertAlmostEqual(counter.damage, (2 ** 3 + 4 ** 3) / 2e12)
+            self.assertAlmostEqual(counter.residual_damage, 6 ** 3 / 2e12)
+            self.assertEqual(counter.samples, len(history))
+
+    def test_astm_e1049(self):
+        """Test the whole-record count on the ASTM E1049 example."""
+        history = [-2, 1, -3, 5, -1, 3, -4, 4, -2]
+        self.assertEqual(
+            count_cycles(history),
+            [(3.0, 0.5), (4.0, 1.5), (6.0, 0.5), (8.0, 1.0), (9.0, 0.5)]
+        )
+        ranges, means, counts = rainflow_cycles(history)
+        np.testing.assert_array_equal(ranges[counts == 1.0], [4.0])
+        np.testing.assert_array_equal(means[counts == 1.0], [1.0])
+        self.assertEqual(count_cycles([]), [])
+        self.assertEqual(count_cycles([1.0, 1.0]), [])
+
+    def test_blocks_match_whole_record(self):
+        """Test random block boundaries do not change the count."""
+        rng = np.random.default_rng(0)
+        stress = rng.integers(-20, 21, 5000).astype(float)
+        whole = RainflowCounter()
+        whole.extend(stress)
+        streamed = RainflowCounter()
+        for block in np.split(stress, np.sort(rng.integers(0, len(stress), 200))):
+            streamed.extend(block)
+        np.testing.assert_array_equal(streamed.histogram, whole.histogram)
+        np.testing.assert_array_equal(streamed.residual, whole.residual)
+        self.assertAlmostEqual(streamed.total_damage, whole.total_damage, places=15)
+        self.assertGreater(whole.cycles, 1000)
+
+
+class TestFatigueLedger(unittest.TestCase):
+    """Test the range x mean fatigue ledger and S-N curves."""
+
+    def test_sn_curve(self):
+        """Test the EN 1993-1-9 knee and cut-off."""
+        curve = SNCurve.eurocode(80.0)
+        knee = 80.0 * (2 / 5) ** (1 / 3)
+        cutoff = knee * (5e6 / 1e8) ** (1 / 5)
+        np.testing.assert_allclose(
+            curve.cycles_to_failure([80.0, knee, cutoff * 1.001]),
+            [2e6, 5e6, 1e8 / 1.001 ** 5]
+        )
+        self.assertEqual(curve.cycles_to_failure(cutoff * 0.99), np.inf)
+        self.assertAlmostEqual(
+            DEFAULT_SN_CURVE.damage(100.0, 2.0), 2 * 100.0 ** 3 / 2e12
+        )
+
+    def test_merge_and_damage(self):
+        """Test ledgers of two periods add up and evaluate any curve."""
+        rng = np.random.default_rng(0)
+        stress = 40 * rng.standard_normal(20000).cumsum() / np.sqrt(np.arange(1, 20001))
+        whole = RainflowCounter()
+        whole.extend(stress)
+        first, second = RainflowCounter(), RainflowCounter()
+        first.extend(stress[:9000])
+        second.extend(stress[9000:])
+        merged = first.ledger + second.ledger
+        self.assertEqual(merged.counts.shape, (256, 32))
+        self.assertEqual(first.ledger.cycles + second.ledger.cycles,
+                         first.cycles + second.cycles)
+        self.assertAlmostEqual(merged.cycles, first.cycles + second.cycles)
+
+        # Bin centres are within half a bin of every range
+        self.assertAlmostEqual(whole.ledger.damage(), whole.damage,
+                               delta=0.05 * whole.damage)
+        self.assertAlmostEqual(whole.ledger_with_residual().damage(),
+                               whole.total_damage, delta=0.05 * whole.total_damage)
+        self.assertLess(whole.ledger.damage(SNCurve.eurocode(160.0)),
+                        whole.ledger.damage(SNCurve.eurocode(36.0)))
+
+        with self.assertRaises(ValueError):
+            merged += FatigueLedger(range_bin_width=2.0)
+
+    def test_save_load(self):
+        """Test a ledger survives a round trip through a file."""
+        ledger = FatigueLedger(2.0, 64, 5.0, 8)
+        ledger.add([1.0, 3.0, 500.0], [-100.0, 0.0, 7.0], [1.0, 0.5, 1.0])
+        np.testing.assert_array_equal(
+            np.argwhere(ledger.counts), [[0, 0], [1, 4], [63, 5]]
+        )
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory) / 'STR-000.fatigue.npy'
+            ledger.save(path)
+            loaded = FatigueLedger.load(path)
+        self.assertEqual(loaded.bins, ledger.bins)
+        np.testing.assert_array_equal(loaded.counts, ledger.counts)
+
+
+if __name__ == '__main__':
+    unittest.main()